@@ -9,9 +9,12 @@ setup(name='syllabletk',
       author_email='dmortens@cs.cmu.edu',
       license='MIT',
       install_requires=['setuptools',
-                        'panphon',
-                        'regex'],
-      scripts=['syllabletk/bin/param_syllabify.py', 'syllabletk/bin/syllable_sniffer.py'],
+                        'numpy',
+                        'panphon'],
+      scripts=['syllabletk/bin/param_syllabify.py', 'syllabletk/bin/syllable_sniffer.py',
+               'syllabletk/bin/convert_margins.py', 'syllabletk/bin/compile_corpus.py',
+               'syllabletk/bin/syllabletk_bench.py', 'syllabletk/bin/syllabletk_server.py'],
       packages=['syllabletk'],
-      zip_safe=True
+      package_data={'syllabletk': ['data/*.json']},
+      zip_safe=False
       )
@@ -1,4 +1,49 @@
-from ._syllabletk import *
-from ._analyzer import SyllableAnalyzer
-from ._margins import SonorityPeakSlicer
-from ._parameterized import PhonoRepr, ParameterizedSyllabifier
+"""SyllableTK: a library for dealing with syllables in natural language.
+
+Submodules are imported when one of their names is first used, so that
+importing the package (for example, from a short-lived script) does not load
+panphon, NumPy or modules that are not needed.
+"""
+
+import importlib
+
+_exports = {
+    '_syllabletk': ['FailedParse', 'count_true', 'iter_syllables',
+                    'check_parse', 'SyllabifierEngine', 'get_engine',
+                    'Syllabifier', 'SyllableAnalyzerDepr'],
+    '_analyzer': ['SyllableAnalyzer', 'FeatureMatrix'],
+    '_margins': ['SonorityPeakSlicer'],
+    '_parameterized': ['PhonoRepr', 'ParameterizedSyllabifier',
+                       'SyllabifyStats'],
+    '_model': ['load_margins', 'load_margin_model', 'save_margin_model'],
+    '_trace': ['RecordingSink', 'LoggingSink', 'get_trace_sink',
+               'set_trace_sink', 'tracing'],
+}
+_modules = {name: module for (module, names) in _exports.items()
+            for name in names}
+
+__all__ = sorted(_modules)
+
+
+def __getattr__(name):
+    module = _modules.get(name)
+    if module is not None:
+        value = getattr(importlib.import_module('.' + module, __name__), name)
+    elif name.startswith('_') and not name.startswith('__'):
+        # Submodules, as in syllabletk._model.write_margin_model(...).
+        try:
+            value = importlib.import_module('.' + name, __name__)
+        except ImportError as e:
+            if getattr(e, 'name', None) != __name__ + '.' + name:
+                raise
+            raise AttributeError(
+                'module {!r} has no attribute {!r}'.format(__name__, name))
+    else:
+        raise AttributeError(
+            'module {!r} has no attribute {!r}'.format(__name__, name))
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
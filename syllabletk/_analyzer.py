@@ -1,9 +1,225 @@
 from __future__ import print_function
 from __future__ import unicode_literals
 
-from panphon import FeatureTable
 from panphon import pat
 from collections import Counter
+import io
+import itertools
+import json
+import multiprocessing
+import os
+
+import numpy as np
+
+from ._counts import aggregate_counts
+from ._segcache import get_segment_cache
+
+ONSET, NUCLEUS, CODA = 0, 1, 2
+
+FEATURE_SPECS = [
+    ('SYL_ONSET_COMPLEX_2', ONSET, '[][]'),
+    ('SYL_ONSET_COMPLEX_3', ONSET, '[][][]'),
+    ('SYL_ONSET_COMPLEX_4', ONSET, '[][][][]'),
+    ('SYL_ONSET_OBSTRUENT_OBSTRUENT', ONSET, '[-son][-son]'),
+    ('SYL_ONSET_PLOSIVE_PLOSIVE', ONSET, '[-son -cont][-son -cont]'),
+    ('SYL_ONSET_FRICATIVE_FRICATIVE', ONSET, '[-son +cont][-son +cont]'),
+    ('SYL_ONSET_PLOSIVE_FRICATIVE', ONSET, '[-son -cont][-son +cont]'),
+    ('SYL_ONSET_FRICATIVE_PLOSIVE', ONSET, '[-son +cont][-son -cont]'),
+    ('SYL_ONSET_FRICATIVE_PLOSIVE', ONSET, '[-son +cont][-son -cont]'),
+    ('SYL_ONSET_SONORANT_SONORANT', ONSET, '[+son][+son]'),
+    ('SYL_ONSET_SONORANT_GLIDE', ONSET, '[+son][-syl -cons]'),
+    ('SYL_ONSET_OBSTRUENT_SONORANT', ONSET, '[+son][+son]'),
+    ('SYL_ONSET_OBSTRUENT_GLIDE', ONSET, '[-son][-syl -cons]'),
+    ('SYL_ONSET_OBSTRUENT_LIQUID', ONSET, '[-son][+cons +son -nas]'),
+    ('SYL_ONSET_OBSTRUENT_NASAL', ONSET, '[-son][+nas -syl]'),
+    ('SYL_CODA_PLOSIVE', CODA, '[-son -cont]'),
+    ('SYL_CODA_FRICATIVE', CODA, '[-son +cont]'),
+    ('SYL_CODA_NASAL', CODA, '[-syl +son +nas]'),
+    ('SYL_CODA_LIQUID', CODA, '[-syl +son -nas]'),
+    ('SYL_CODA_COMPLEX_2', CODA, '[][]'),
+    ('SYL_CODA_COMPLEX_3', CODA, '[][][]'),
+    ('SYL_CODA_COMPLEX_4', CODA, '[][][][]'),
+    ('SYL_CODA_OBSTRUENT_OBSTRUENT', CODA, '[-son][-son]'),
+    ('SYL_CODA_PLOSIVE_PLOSIVE', CODA, '[-son -cont][-son -cont]'),
+    ('SYL_CODA_FRICATIVE_FRICATIVE', CODA, '[-son -cont][-son -cont]'),
+    ('SYL_CODA_PLOSIVE_FRICATIVE', CODA, '[-son -cont][-son +cont]'),
+    ('SYL_CODA_FRICATIVE_PLOSIVE', CODA, '[-son +cont][-son -cont]'),
+    ('SYL_CODA_SONORANT_SONORANT', CODA, '[+son][+son]'),
+    ('SYL_CODA_LIQUID_NASAL', CODA, '[-syl +son -nas][-syl +son +nas]'),
+    ('SYL_CODA_SONORANT_OBSTRUENT', CODA, '[+son][+son]'),
+    ('SYL_NUCLEUS_BRANCHING', NUCLEUS, '[][]'),
+]
+"""Syllable features as <name, constituent index, panphon feature pattern>.
+
+A feature is present in a syllable when the constituent has exactly as many
+segments as the pattern has matrices and each segment matches its matrix.
+"""
+
+MAX_PATTERN_LEN = 4
+CHUNK_SIZE = 10000
+FORMAT = 'syllabletk-analysis'
+VERSION = 1
+
+
+class CompiledFeatures(object):
+    """NumPy representation of a list of syllable features.
+
+    The distinct feature matrices in the patterns are compiled once. Each
+    segment in the cache's SegmentInventory gets a row in a segment-by-matrix
+    boolean table, so that matching a pattern against many constituents
+    reduces to indexing that table with arrays of segment ids.
+
+    specs -- list of <name, constituent index, pattern string> triples.
+    cache -- SegmentCache that supplies the feature vectors of segments.
+    """
+
+    def __init__(self, specs, cache):
+        self.cache = cache
+        self.names = [name for (name, _, _) in specs]
+        self.constituents = np.array([c for (_, c, _) in specs], dtype=np.intp)
+        self.matrices = []
+        matrix_ids = {}
+        self.patterns = []
+        for _, _, p in specs:
+            ids = []
+            for matrix in pat(p):
+                key = frozenset(matrix)
+                if key not in matrix_ids:
+                    matrix_ids[key] = len(self.matrices)
+                    self.matrices.append(key)
+                ids.append(matrix_ids[key])
+            self.patterns.append(ids)
+        self.inventory = cache.inventory
+        self.table = np.zeros((0, len(self.matrices)), dtype=bool)
+
+    def seg_id(self, seg):
+        """Return the row of seg in the segment-by-matrix table."""
+        return self.inventory.intern(seg)
+
+    def _extend_table(self):
+        # Add rows for the segments interned since the table was last built.
+        segments = self.inventory.segments
+        if len(segments) > len(self.table):
+            rows = []
+            for seg in segments[len(self.table):]:
+                fts = self.cache.features(seg)
+                rows.append([fts.issuperset(m) for m in self.matrices])
+            rows = np.array(rows, dtype=bool).reshape(
+                (len(rows), len(self.matrices)))
+            self.table = np.concatenate([self.table, rows])
+
+    def encode(self, syls):
+        """Encode syllables as arrays of segment ids and constituent lengths.
+
+        syls -- a sequence of syllables (3-tuples of segment sequences).
+        return -- 2-tuple <ids, lengths>; ids has shape (n, 3, MAX_PATTERN_LEN)
+        and lengths has shape (n, 3). Only the first MAX_PATTERN_LEN segments
+        of a constituent are encoded, since no pattern is longer.
+        """
+        n = len(syls)
+        ids = np.zeros((n, 3, MAX_PATTERN_LEN), dtype=np.intp)
+        lengths = np.zeros((n, 3), dtype=np.intp)
+        seg_id = self.inventory.intern
+        for i, syl in enumerate(syls):
+            for c, const in enumerate(syl):
+                lengths[i, c] = len(const)
+                for j, seg in enumerate(const[:MAX_PATTERN_LEN]):
+                    ids[i, c, j] = seg_id(seg)
+        self._extend_table()
+        return ids, lengths
+
+    def evaluate(self, syls):
+        """Return a boolean array of shape (n syllables, n features) that is
+        True where a syllable exemplifies a feature.
+
+        syls -- a sequence of syllables (3-tuples of segment sequences).
+        """
+        ids, lengths = self.encode(syls)
+        out = np.zeros((len(syls), len(self.patterns)), dtype=bool)
+        for f, pattern in enumerate(self.patterns):
+            c = self.constituents[f]
+            # Only constituents of the pattern's length are looked up; the
+            # ids of the others are padding, which need not be in the table.
+            rows = np.flatnonzero(lengths[:, c] == len(pattern))
+            for j, m in enumerate(pattern):
+                rows = rows[self.table[ids[rows, c, j], m]]
+            out[rows, f] = True
+        return out
+
+    def count(self, syls, weights=None):
+        """Return the number of syllables exemplifying each feature as an
+        integer array aligned with self.names.
+
+        weights -- if given, the number of times each syllable is counted.
+        """
+        if not len(syls):
+            return np.zeros(len(self.patterns), dtype=np.int64)
+        if weights is not None:
+            return np.asarray(weights, dtype=np.int64).dot(self.evaluate(syls))
+        return self.evaluate(syls).sum(axis=0)
+
+
+class FeatureMatrix(object):
+    """Sparse words-by-features count matrix in compressed sparse row (CSR)
+    form, backed by NumPy arrays.
+
+    The counts of row i are data[indptr[i]:indptr[i + 1]], in the columns
+    indices[indptr[i]:indptr[i + 1]]; tocsr converts the matrix to a SciPy
+    csr_matrix.
+
+    data -- int32 array of the non-zero counts.
+    indices -- int32 array of their column indices.
+    indptr -- int64 array of n rows + 1 offsets into data and indices.
+    columns -- list of column (feature) names.
+    """
+
+    def __init__(self, data, indices, indptr, columns):
+        self.data = data
+        self.indices = indices
+        self.indptr = indptr
+        self.columns = list(columns)
+
+    @property
+    def shape(self):
+        return (len(self.indptr) - 1, len(self.columns))
+
+    @property
+    def nnz(self):
+        return len(self.data)
+
+    @classmethod
+    def vstack(cls, matrices, columns):
+        """Stack matrices with the same columns vertically."""
+        indptrs = [np.zeros(1, dtype=np.int64)]
+        offset = 0
+        for m in matrices:
+            indptrs.append(m.indptr[1:] + offset)
+            offset += m.nnz
+        return cls(np.concatenate([np.zeros(0, np.int32)] +
+                                  [m.data for m in matrices]),
+                   np.concatenate([np.zeros(0, np.int32)] +
+                                  [m.indices for m in matrices]),
+                   np.concatenate(indptrs), columns)
+
+    def row(self, i):
+        """Return the non-zero counts of row i as a dictionary keyed by
+        column name."""
+        start, end = self.indptr[i], self.indptr[i + 1]
+        return {self.columns[j]: int(n) for (j, n)
+                in zip(self.indices[start:end], self.data[start:end])}
+
+    def toarray(self):
+        """Return the matrix as a dense NumPy array."""
+        out = np.zeros(self.shape, dtype=np.int32)
+        rows = np.repeat(np.arange(self.shape[0]), np.diff(self.indptr))
+        out[rows, self.indices] = self.data
+        return out
+
+    def tocsr(self):
+        """Return the matrix as a scipy.sparse.csr_matrix (requires SciPy)."""
+        import scipy.sparse
+        return scipy.sparse.csr_matrix(
+            (self.data, self.indices, self.indptr), shape=self.shape)
 
 
 class SyllableAnalyzer(object):
@@ -12,76 +228,33 @@ class SyllableAnalyzer(object):
     Given a sequence of syllables structured as 3-tuples of constituents (onset,
     nucleus, coda), each consisting of n-tuples of segments, this class tracks
     whether syllables exemplify particular structural features.
+
+    cache -- SegmentCache that supplies the feature vectors of segments; by
+    default, the process-wide cache is used.
+    batch_size -- number of syllables evaluated together by analyze_syllables.
     """
 
-    def __init__(self):
-        self.ft = FeatureTable()
+    def __init__(self, cache=None, batch_size=10000):
+        self.cache = cache if cache is not None else get_segment_cache()
+        self.batch_size = batch_size
         self.feature_counter = Counter()
         self.syllable_counter = 0
-        self.features = [
-            ('SYL_ONSET_COMPLEX_2',
-             lambda syl: self.ft.match_pattern_seq(pat('[][]'), syl[0])),
-            ('SYL_ONSET_COMPLEX_3',
-             lambda syl: self.ft.match_pattern_seq(pat('[][][]'), syl[0])),
-            ('SYL_ONSET_COMPLEX_4',
-             lambda syl: self.ft.match_pattern_seq(pat('[][][][]'), syl[0])),
-            ('SYL_ONSET_OBSTRUENT_OBSTRUENT',
-             lambda syl: self.ft.match_pattern_seq(pat('[-son][-son]'), syl[0])),
-            ('SYL_ONSET_PLOSIVE_PLOSIVE',
-             lambda syl: self.ft.match_pattern_seq(pat('[-son -cont][-son -cont]'), syl[0])),
-            ('SYL_ONSET_FRICATIVE_FRICATIVE',
-             lambda syl: self.ft.match_pattern_seq(pat('[-son +cont][-son +cont]'), syl[0])),
-            ('SYL_ONSET_PLOSIVE_FRICATIVE',
-             lambda syl: self.ft.match_pattern_seq(pat('[-son -cont][-son +cont]'), syl[0])),
-            ('SYL_ONSET_FRICATIVE_PLOSIVE',
-             lambda syl: self.ft.match_pattern_seq(pat('[-son +cont][-son -cont]'), syl[0])),
-            ('SYL_ONSET_FRICATIVE_PLOSIVE',
-             lambda syl: self.ft.match_pattern_seq(pat('[-son +cont][-son -cont]'), syl[0])),
-            ('SYL_ONSET_SONORANT_SONORANT',
-             lambda syl: self.ft.match_pattern_seq(pat('[+son][+son]'), syl[0])),
-            ('SYL_ONSET_SONORANT_GLIDE',
-             lambda syl: self.ft.match_pattern_seq(pat('[+son][-syl -cons]'), syl[0])),
-            ('SYL_ONSET_OBSTRUENT_SONORANT',
-             lambda syl: self.ft.match_pattern_seq(pat('[+son][+son]'), syl[0])),
-            ('SYL_ONSET_OBSTRUENT_GLIDE',
-             lambda syl: self.ft.match_pattern_seq(pat('[-son][-syl -cons]'), syl[0])),
-            ('SYL_ONSET_OBSTRUENT_LIQUID',
-             lambda syl: self.ft.match_pattern_seq(pat('[-son][+cons +son -nas]'), syl[0])),
-            ('SYL_ONSET_OBSTRUENT_NASAL',
-             lambda syl: self.ft.match_pattern_seq(pat('[-son][+nas -syl]'), syl[0])),
-            ('SYL_CODA_PLOSIVE',
-             lambda syl: self.ft.match_pattern_seq(pat('[-son -cont]'), syl[2])),
-            ('SYL_CODA_FRICATIVE',
-             lambda syl: self.ft.match_pattern_seq(pat('[-son +cont]'), syl[2])),
-            ('SYL_CODA_NASAL',
-             lambda syl: self.ft.match_pattern_seq(pat('[-syl +son +nas]'), syl[2])),
-            ('SYL_CODA_LIQUID',
-             lambda syl: self.ft.match_pattern_seq(pat('[-syl +son -nas]'), syl[2])),
-            ('SYL_CODA_COMPLEX_2',
-             lambda syl: self.ft.match_pattern_seq(pat('[][]'), syl[2])),
-            ('SYL_CODA_COMPLEX_3',
-             lambda syl: self.ft.match_pattern_seq(pat('[][][]'), syl[2])),
-            ('SYL_CODA_COMPLEX_4',
-             lambda syl: self.ft.match_pattern_seq(pat('[][][][]'), syl[2])),
-            ('SYL_CODA_OBSTRUENT_OBSTRUENT',
-             lambda syl: self.ft.match_pattern_seq(pat('[-son][-son]'), syl[2])),
-            ('SYL_CODA_PLOSIVE_PLOSIVE',
-             lambda syl: self.ft.match_pattern_seq(pat('[-son -cont][-son -cont]'), syl[2])),
-            ('SYL_CODA_FRICATIVE_FRICATIVE',
-             lambda syl: self.ft.match_pattern_seq(pat('[-son -cont][-son -cont]'), syl[2])),
-            ('SYL_CODA_PLOSIVE_FRICATIVE',
-             lambda syl: self.ft.match_pattern_seq(pat('[-son -cont][-son +cont]'), syl[2])),
-            ('SYL_CODA_FRICATIVE_PLOSIVE',
-             lambda syl: self.ft.match_pattern_seq(pat('[-son +cont][-son -cont]'), syl[2])),
-            ('SYL_CODA_SONORANT_SONORANT',
-             lambda syl: self.ft.match_pattern_seq(pat('[+son][+son]'), syl[2])),
-            ('SYL_CODA_LIQUID_NASAL',
-             lambda syl: self.ft.match_pattern_seq(pat('[-syl +son -nas][-syl +son +nas]'), syl[2])),
-            ('SYL_CODA_SONORANT_OBSTRUENT',
-             lambda syl: self.ft.match_pattern_seq(pat('[+son][+son]'), syl[2])),
-            ('SYL_NUCLEUS_BRANCHING',
-             lambda syl: self.ft.match_pattern_seq(pat('[][]'), syl[1])),
-        ]
+        self.compiled = CompiledFeatures(FEATURE_SPECS, self.cache)
+        self.features = [(name, self._feature_function(c, pat(p)))
+                         for (name, c, p) in FEATURE_SPECS]
+        self.feature_names = []
+        for name, _ in self.features:
+            if name not in self.feature_names:
+                self.feature_names.append(name)
+        # One-hot map from the compiled features to the columns of
+        # feature_matrix; features that share a name share a column.
+        self._columns = np.zeros((len(self.features), len(self.feature_names)),
+                                 dtype=np.int32)
+        for f, (name, _) in enumerate(self.features):
+            self._columns[f, self.feature_names.index(name)] = 1
+
+    def _feature_function(self, constituent, pattern):
+        return lambda syl: self.cache.match_pattern_seq(pattern, syl[constituent])
 
     def analyze_syllable(self, syl):
         """Detect which structural patterns characterize a syllable.
@@ -98,10 +271,208 @@ class SyllableAnalyzer(object):
             if f(syl):
                 self.feature_counter[name] += 1
 
+    def analyze_batch(self, syls, weights=None):
+        """Analyze a list of syllables at once using the compiled features.
+
+        The effect on the counters is the same as calling analyze_syllable on
+        each syllable (weights[i] times for syllable i, if weights is given).
+
+        syls -- a list of syllables (see self.analyze_syllable).
+        weights -- list of positive integers, one per syllable.
+        """
+        counts = self.compiled.count(syls, weights)
+        self.syllable_counter += len(syls) if weights is None else sum(weights)
+        for name, n in zip(self.compiled.names, counts):
+            if n:
+                self.feature_counter[name] += int(n)
+
     def analyze_syllables(self, syls):
-        """Applies self.analyze_syllable to each syllable in a sequence.
+        """Analyze each syllable in a sequence, in batches of self.batch_size.
 
         syls -- a sequence of syllables (see self.analyze_syllable).
         """
+        batch = []
         for syl in syls:
-            self.analyze_syllable(syl)
+            batch.append(syl)
+            if len(batch) >= self.batch_size:
+                self.analyze_batch(batch)
+                batch = []
+        if batch:
+            self.analyze_batch(batch)
+
+    def analyze_syllables_weighted(self, counts):
+        """Like analyze_syllables, but for syllable frequencies: each
+        distinct syllable is evaluated once and counted as often as it
+        occurs.
+
+        counts -- mapping from syllables to counts, or iterable of <syllable,
+        count> pairs. Syllables are compared by their segments, so a list and
+        a tuple with the same segments are the same syllable.
+        """
+        types = list(aggregate_counts(counts, _freeze_syllable).items())
+        for k in range(0, len(types), self.batch_size):
+            batch = types[k:k + self.batch_size]
+            self.analyze_batch([syl for (syl, _) in batch],
+                               [count for (_, count) in batch])
+
+    def feature_matrix(self, words, chunk_size=CHUNK_SIZE):
+        """Return the per-word feature counts of a sequence of words as a
+        FeatureMatrix (words by features).
+
+        Column j counts the syllables of a word that exemplify the feature
+        self.feature_names[j], so the column sums equal what analyze_syllables
+        would add to feature_counter. The analyzer's counters are not changed.
+
+        words -- iterable of syllabified words, each a sequence of syllables
+        (see self.analyze_syllable), or None for an empty row.
+        chunk_size -- number of words evaluated at a time (see
+        iter_feature_matrices).
+        """
+        return FeatureMatrix.vstack(
+            list(self.iter_feature_matrices(words, chunk_size)),
+            self.feature_names)
+
+    def iter_feature_matrices(self, words, chunk_size=CHUNK_SIZE):
+        """Yield the feature matrix of words (see feature_matrix) in chunks of
+        chunk_size rows.
+
+        Only one chunk of words is held at a time, so a corpus of any size can
+        be streamed through in bounded memory, with each chunk written out or
+        consumed before the next is built.
+        """
+        chunk = []
+        for word in words:
+            chunk.append(word or ())
+            if len(chunk) >= chunk_size:
+                yield self._chunk_matrix(chunk)
+                chunk = []
+        if chunk:
+            yield self._chunk_matrix(chunk)
+
+    def _chunk_matrix(self, words):
+        n = len(words)
+        counts = np.zeros((n, len(self.feature_names)), dtype=np.int32)
+        syls = [syl for word in words for syl in word]
+        if syls:
+            lengths = np.array([len(word) for word in words], dtype=np.intp)
+            nonempty = lengths > 0
+            starts = (np.cumsum(lengths) - lengths)[nonempty]
+            matches = self.compiled.evaluate(syls).astype(np.int32)
+            counts[nonempty] = np.add.reduceat(matches.dot(self._columns),
+                                               starts, axis=0)
+        rows, cols = np.nonzero(counts)
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=n), out=indptr[1:])
+        return FeatureMatrix(counts[rows, cols], cols.astype(np.int32),
+                             indptr, self.feature_names)
+
+    def analyze_syllables_parallel(self, syls, workers=None,
+                                   chunk_size=CHUNK_SIZE):
+        """Analyze a stream of syllables in worker processes.
+
+        The stream is split into chunks of chunk_size syllables, each chunk is
+        analyzed by the analyzer of one worker, and the workers' counts are
+        merged into this analyzer, so the counters end up exactly as with
+        analyze_syllables.
+
+        syls -- iterable of syllables (see self.analyze_syllable); they must
+        be picklable.
+        workers -- number of worker processes; if None or 1, the syllables
+        are analyzed in this process.
+        chunk_size -- number of syllables sent to a worker per task.
+        """
+        if not workers or workers <= 1:
+            self.analyze_syllables(syls)
+            return
+        pool = multiprocessing.Pool(
+            workers, _init_worker,
+            (self.batch_size, self.cache.features_table()))
+        try:
+            for n, features in pool.imap_unordered(_analyze_in_worker,
+                                                   _chunks(syls, chunk_size)):
+                self.syllable_counter += n
+                self.feature_counter.update(features)
+        finally:
+            pool.close()
+            pool.join()
+
+    def merge(self, other):
+        """Add the counts of another analyzer to this one and return self."""
+        self.feature_counter.update(other.feature_counter)
+        self.syllable_counter += other.syllable_counter
+        return self
+
+    def __add__(self, other):
+        return SyllableAnalyzer(self.cache, self.batch_size).merge(self).merge(other)
+
+    def to_dict(self):
+        """Return the counters as a JSON-serializable dictionary:
+
+            {"format": "syllabletk-analysis", "version": 1,
+             "syllables": <syllable_counter>,
+             "features": {<feature name>: <count>, ...}}
+        """
+        return {'format': FORMAT,
+                'version': VERSION,
+                'syllables': self.syllable_counter,
+                'features': dict(sorted(self.feature_counter.items()))}
+
+    @classmethod
+    def from_dict(cls, data, cache=None):
+        """Restore an analyzer's counters from a dictionary made by to_dict."""
+        if data.get('format') != FORMAT:
+            raise ValueError('Not a syllable analysis.')
+        if data.get('version') != VERSION:
+            raise ValueError('Unsupported analysis version {}.'.format(
+                data.get('version')))
+        analyzer = cls(cache)
+        analyzer.syllable_counter = data['syllables']
+        analyzer.feature_counter.update(data['features'])
+        return analyzer
+
+    def save(self, path):
+        """Write the counters to a JSON file, replacing it atomically."""
+        tmp = path + '.tmp'
+        with io.open(tmp, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(self.to_dict(), ensure_ascii=False,
+                               separators=(',', ':')))
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path, cache=None):
+        """Restore an analyzer from a file written by save."""
+        with io.open(path, 'r', encoding='utf-8') as f:
+            return cls.from_dict(json.load(f), cache)
+
+
+_worker_state = {}
+
+
+def _init_worker(batch_size, features):
+    # Runs once per worker, which keeps one analyzer (and its compiled
+    # feature table) for all of its chunks. The parent's feature vectors are
+    # preloaded so that known segments need no panphon lookup.
+    cache = get_segment_cache()
+    cache.preload_features(features)
+    _worker_state['analyzer'] = SyllableAnalyzer(cache, batch_size)
+
+
+def _analyze_in_worker(syls):
+    analyzer = _worker_state['analyzer']
+    analyzer.feature_counter = Counter()
+    analyzer.syllable_counter = 0
+    analyzer.analyze_syllables(syls)
+    return analyzer.syllable_counter, analyzer.feature_counter
+
+
+def _chunks(items, size):
+    items = iter(items)
+    while True:
+        chunk = list(itertools.islice(items, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _freeze_syllable(syl):
+    return tuple(tuple(const) for const in syl)
@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+"""Batched NumPy kernel for sonority-peak syllabification.
+
+The sonority scores of many words are packed into padded 2-D arrays (one row
+per word; words are grouped by length to limit padding) and the steps of
+SyllabifierEngine.son_peak_parse are applied to all rows at once: peaks and
+glides by comparing neighbouring columns, and onset and coda slopes by finding,
+with cumulative minima and maxima, where each rising or falling run ends.
+
+The labels are the same as those of the scalar implementation for every word
+of two or more segments; shorter words make the scalar implementation raise
+IndexError and must be handled by the caller.
+"""
+
+from __future__ import print_function, unicode_literals
+
+import itertools
+
+import numpy as np
+
+BLANK, NUCLEUS, GLIDE, ONSET, CODA = range(5)
+LABELS = ' N)OC'
+_TO_LABELS = bytes.maketrans(bytes(bytearray(range(len(LABELS)))),
+                             LABELS.encode('ascii'))
+CHUNK_SIZE = 4096
+
+
+def pack_scores(score_lists):
+    """Pack lists of sonority scores into a padded array.
+
+    score_lists -- sequence of sequences of integers.
+    return -- 2-tuple <scores, lengths>; scores has shape (n words, longest
+    word) and dtype int8, padded with zeros.
+    """
+    lengths = np.array([len(s) for s in score_lists], dtype=np.intp)
+    width = int(lengths.max()) if len(lengths) else 0
+    scores = np.zeros((len(score_lists), width), dtype=np.int8)
+    flat = np.fromiter(itertools.chain.from_iterable(score_lists),
+                       dtype=np.int8, count=int(lengths.sum()))
+    # Row-major order of the mask is the order of the concatenated scores.
+    scores[np.arange(width) < lengths[:, np.newaxis]] = flat
+    return scores, lengths
+
+
+def son_peak_codes(scores, lengths):
+    """Return the constituent codes (BLANK, NUCLEUS, ...) for packed words.
+
+    scores -- int8 array of shape (n, width) (see pack_scores).
+    lengths -- array of the number of segments in each row; all must be at
+    least 2.
+    return -- uint8 array of shape (n, width); padding is BLANK.
+    """
+    n, width = scores.shape
+    s = scores.astype(np.int16)
+    pos = np.arange(width)[np.newaxis, :]
+    last = (lengths - 1)[:, np.newaxis]
+    valid = pos <= last
+
+    # Nuclei: word-initial and word-final peaks need a score of at least 6,
+    # word-internal peaks at least 5.
+    gt_left = np.zeros((n, width), dtype=bool)
+    gt_left[:, 1:] = s[:, 1:] > s[:, :-1]
+    gt_right = np.zeros((n, width), dtype=bool)
+    gt_right[:, :-1] = s[:, :-1] > s[:, 1:]
+    first = pos == 0
+    final = pos == last
+    nuc = np.where(first, gt_right & (s >= 6),
+                   np.where(final, gt_left & (s >= 6),
+                            gt_left & gt_right & (s >= 5)))
+    nuc &= valid
+
+    # Offglides: a segment of sonority 7 or more right after a nucleus.
+    glide = np.zeros((n, width), dtype=bool)
+    glide[:, 1:] = nuc[:, :-1] & (s[:, 1:] >= 7) & valid[:, 1:]
+
+    # Onsets: rising slopes to the left of each nucleus. A free segment is
+    # an onset if sonority rises from it to the next segment, and so on up to
+    # the first segment where it does not, which must be a nucleus.
+    free = valid & ~nuc & ~glide
+    rising = np.zeros((n, width), dtype=bool)
+    rising[:, :-1] = free[:, :-1] & valid[:, 1:] & (s[:, 1:] > s[:, :-1])
+    stop = np.where(rising, width - 1, pos)
+    stop = np.minimum.accumulate(stop[:, ::-1], axis=1)[:, ::-1]
+    ons = rising & np.take_along_axis(nuc, stop, axis=1)
+
+    # Codas: falling slopes to the right of each nucleus. A free segment is
+    # a coda if sonority falls to it from the previous segment, and so on
+    # back to the first segment where it does not, which must be a nucleus
+    # or an offglide.
+    free &= ~ons
+    falling = np.zeros((n, width), dtype=bool)
+    falling[:, 1:] = free[:, 1:] & (s[:, :-1] > s[:, 1:])
+    stop = np.where(falling, 0, pos)
+    stop = np.maximum.accumulate(stop, axis=1)
+    cod = falling & np.take_along_axis(nuc | glide, stop, axis=1)
+
+    # Margins: leading residue (except the last segment) is onset, then
+    # trailing residue (except the first segment) is coda.
+    free &= ~cod
+    lead = np.logical_and.accumulate(free, axis=1) & (pos < last)
+    ons |= lead
+    free &= ~lead
+    trail = np.logical_and.accumulate((free | ~valid)[:, ::-1], axis=1)[:, ::-1]
+    cod |= trail & valid & (pos > 0)
+
+    codes = np.zeros((n, width), dtype=np.uint8)
+    codes[nuc] = NUCLEUS
+    codes[glide] = GLIDE
+    codes[ons] = ONSET
+    codes[cod] = CODA
+    return codes
+
+
+def son_peak_labels(score_lists, chunk_size=CHUNK_SIZE):
+    """Return the constituent labels of each word as a list of lists of
+    one-character strings, as son_peak_parse does.
+
+    score_lists -- sequence of sequences of sonority scores, each of length 2
+    or more.
+    chunk_size -- number of words packed into one array; words are sorted by
+    length first, so that each array is only as wide as its longest word.
+    """
+    order = sorted(range(len(score_lists)), key=lambda i: len(score_lists[i]))
+    out = [None] * len(score_lists)
+    for k in range(0, len(order), chunk_size):
+        chunk = order[k:k + chunk_size]
+        scores, lengths = pack_scores([score_lists[i] for i in chunk])
+        width = scores.shape[1]
+        codes = son_peak_codes(scores, lengths)
+        labels = codes.tobytes().translate(_TO_LABELS).decode('ascii')
+        for r, (i, length) in enumerate(zip(chunk, lengths)):
+            out[i] = list(labels[r * width:r * width + length])
+    return out
@@ -0,0 +1,214 @@
+# -*- coding: utf-8 -*-
+"""Reproducible benchmarks over the bundled Turkish corpora.
+
+Each benchmark runs one component over every word of a corpus and reports
+throughput (words per second), per-word latency percentiles and the peak
+memory allocated while running. Results are plain dictionaries that can be
+saved as JSON and compared against a stored baseline.
+"""
+
+from __future__ import division, print_function, unicode_literals
+
+import gc
+import io
+import json
+import math
+import os
+import platform
+import time
+import tracemalloc
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+CORPORA = {'tur-1': 'tur-1.txt', 'tur-200': 'tur-200.txt', 'tur': 'tur.txt'}
+MARGINS = os.path.normpath(os.path.join(DATA_DIR, os.pardir, os.pardir, 'tur.yml'))
+PERCENTILES = (50, 90, 99)
+
+
+def read_corpus(name, limit=None):
+    """Return the words of a bundled corpus as a list.
+
+    name -- one of the keys of CORPORA.
+    limit -- if given, only the first limit words are returned.
+    """
+    with io.open(os.path.join(DATA_DIR, CORPORA[name]), encoding='utf-8') as f:
+        words = [line.strip() for line in f]
+    return words[:limit] if limit else words
+
+
+def _quietly(f):
+    # Benchmarks measure cost, not correctness: words that fail to parse are
+    # counted like any other.
+    def run(item):
+        try:
+            f(item)
+        except Exception:
+            pass
+    return run
+
+
+def _syllabifier(son_peak):
+    def setup(words, margins):
+        from ._syllabletk import SyllabifierEngine
+        engine = SyllabifierEngine(son_peak=son_peak)
+        return words, _quietly(engine.syllabify)
+    return setup
+
+
+def _parameterized(words, margins):
+    from ._parameterized import ParameterizedSyllabifier
+    ps = ParameterizedSyllabifier.from_margin_file(margins)
+    return words, _quietly(ps.syllabify)
+
+
+def _sniffer(words, margins):
+    from ._margins import MarginSniffer, SonorityPeakSlicer
+    sniffer = MarginSniffer(SonorityPeakSlicer)
+    return words, _quietly(sniffer.parse_token)
+
+
+def _analyzer(words, margins):
+    # The syllables are prepared beforehand so that only analysis is timed;
+    # each item is the list of syllables of one word.
+    from ._analyzer import SyllableAnalyzer
+    from ._parameterized import ParameterizedSyllabifier
+    ps = ParameterizedSyllabifier.from_margin_file(margins)
+    items = []
+    for word in words:
+        try:
+            items.append(ps.syllabify(word) or [])
+        except Exception:
+            items.append([])
+    analyzer = SyllableAnalyzer()
+    return items, analyzer.analyze_batch
+
+
+BENCHMARKS = [
+    ('syllabifier_son_peak', _syllabifier(True)),
+    ('syllabifier_son', _syllabifier(False)),
+    ('parameterized', _parameterized),
+    ('sniffer', _sniffer),
+    ('analyzer', _analyzer),
+]
+"""Benchmarks as <name, setup>, where setup(words, margins) returns the items
+to process and a function that processes one item."""
+
+
+def percentile(sorted_values, p):
+    """Return the p-th percentile (nearest rank) of a sorted list."""
+    if not sorted_values:
+        return 0.0
+    k = int(math.ceil(p / 100 * len(sorted_values))) - 1
+    k = max(0, min(len(sorted_values) - 1, k))
+    return sorted_values[k]
+
+
+def run_benchmark(setup, words, margins=MARGINS, warmup=10):
+    """Run one benchmark and return its measurements as a dictionary.
+
+    The items are processed twice with fresh state: once for timing and once
+    under tracemalloc for peak memory, so that tracing does not distort the
+    timings.
+
+    setup -- function returning <items, process> (see BENCHMARKS).
+    words -- list of words.
+    margins -- margins file for the benchmarks that need one.
+    warmup -- number of items processed before timing starts.
+    """
+    items, process = setup(words, margins)
+    for item in items[:warmup]:
+        process(item)
+    latencies = []
+    clock = time.perf_counter
+    gc.collect()
+    start = clock()
+    for item in items:
+        t = clock()
+        process(item)
+        latencies.append(clock() - t)
+    total = clock() - start
+    latencies.sort()
+
+    items, process = setup(words, margins)
+    gc.collect()
+    tracemalloc.start()
+    for item in items:
+        process(item)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    result = {'items': len(items),
+              'seconds': total,
+              'words_per_sec': len(items) / total if total else 0.0,
+              'peak_memory_bytes': peak}
+    for p in PERCENTILES:
+        result['latency_p{}_us'.format(p)] = percentile(latencies, p) * 1e6
+    return result
+
+
+def run_suite(corpus='tur-200', limit=None, names=None, margins=MARGINS):
+    """Run the selected benchmarks and return a JSON-serializable report.
+
+    corpus -- name of a bundled corpus (see CORPORA).
+    limit -- if given, only the first limit words are used.
+    names -- names of the benchmarks to run; all of them by default.
+    """
+    words = read_corpus(corpus, limit)
+    results = {}
+    for name, setup in BENCHMARKS:
+        if names and name not in names:
+            continue
+        results[name] = run_benchmark(setup, words, margins)
+    return {'meta': {'corpus': corpus,
+                     'words': len(words),
+                     'python': platform.python_version(),
+                     'platform': platform.platform(),
+                     'time': time.strftime('%Y-%m-%dT%H:%M:%S')},
+            'results': results}
+
+
+def compare(report, baseline, threshold=0.1):
+    """Return the regressions of a report relative to a baseline.
+
+    A regression is a drop in throughput, or a rise in median latency or peak
+    memory, by more than threshold (a fraction).
+
+    return -- list of <benchmark, metric, baseline value, new value> tuples.
+    """
+    worse_if_lower = ['words_per_sec']
+    worse_if_higher = ['latency_p50_us', 'peak_memory_bytes']
+    regressions = []
+    for name, new in sorted(report['results'].items()):
+        old = baseline['results'].get(name)
+        if old is None:
+            continue
+        for metric in worse_if_lower:
+            if new[metric] < old[metric] * (1 - threshold):
+                regressions.append((name, metric, old[metric], new[metric]))
+        for metric in worse_if_higher:
+            if new[metric] > old[metric] * (1 + threshold):
+                regressions.append((name, metric, old[metric], new[metric]))
+    return regressions
+
+
+def format_report(report):
+    """Return a report as a human-readable table."""
+    lines = ['{:<22}{:>12}{:>10}{:>10}{:>10}{:>12}'.format(
+        'benchmark', 'words/s', 'p50 us', 'p90 us', 'p99 us', 'peak KiB')]
+    for name, r in sorted(report['results'].items()):
+        lines.append('{:<22}{:>12.0f}{:>10.1f}{:>10.1f}{:>10.1f}{:>12.0f}'.format(
+            name, r['words_per_sec'], r['latency_p50_us'],
+            r['latency_p90_us'], r['latency_p99_us'],
+            r['peak_memory_bytes'] / 1024))
+    return '\n'.join(lines)
+
+
+def save_report(path, report):
+    """Write a report to path as JSON."""
+    with io.open(path, 'w', encoding='utf-8') as f:
+        f.write(json.dumps(report, indent=2, sort_keys=True))
+
+
+def load_report(path):
+    """Read a report written by save_report."""
+    with io.open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
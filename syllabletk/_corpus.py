@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+"""Pre-segmented binary corpora.
+
+Compiling a word list segments every word once and stores the result as
+packed segment ids, so that later runs over the same corpus can skip
+segmentation. The file layout (all integers little-endian) is:
+
+    header    -- magic b'STKC', version (uint16), segmentation (uint16; an
+                 index into SEGMENTATIONS), number of segments (uint32),
+                 number of words (uint64)
+    inventory -- for each segment, its length in bytes (uint16) followed by
+                 the segment in UTF-8
+    padding   -- zero bytes up to a multiple of 8
+    offsets   -- number of words + 1 uint64 offsets into the id array
+    ids       -- segment ids (uint16); word i is ids[offsets[i]:offsets[i+1]]
+
+CorpusReader memory-maps the file, so the pages are shared by all processes
+reading the same corpus.
+
+The parsers do not all segment words the same way, so a corpus records its
+segmentation:
+
+segs -- longest match over panphon's segment inventory, as used by the
+margin parsers, ParameterizedSyllabifier and CompiledSyllabifier.
+text -- panphon's segment_text, as used by SyllabifierEngine; it splits
+tie-bar affricates.
+chars -- one segment per character, as used by FixedSonoritySlicer.
+
+The words a CorpusReader returns carry their corpus's segmentation, and the
+parse_segs and syllabify_segs methods reject words of another segmentation
+(see check_segmentation). The consumers still take segments as strings: the
+reader decodes the ids of each word through the corpus's inventory.
+"""
+
+from __future__ import print_function, unicode_literals
+
+import array
+import io
+import mmap
+import struct
+import sys
+
+from ._inventory import SegmentInventory
+from ._segcache import get_segment_cache
+
+MAGIC = b'STKC'
+VERSION = 1
+SEGS, TEXT, CHARS = 'segs', 'text', 'chars'
+# Files written before the segmentation was recorded have 0 in its place,
+# which is the segmentation they were compiled with.
+SEGMENTATIONS = (SEGS, TEXT, CHARS)
+_HEADER = struct.Struct('<4sHHIQ')
+_LENGTH = struct.Struct('<H')
+
+
+class CorpusFormatError(Exception):
+    pass
+
+
+def _little_endian(arr):
+    if sys.byteorder != 'little':
+        arr = array.array(arr.typecode, arr)
+        arr.byteswap()
+    return arr
+
+
+class CorpusWord(list):
+    """List of the segments of a word read from a corpus.
+
+    Members:
+    segmentation -- the segmentation of the corpus (see SEGMENTATIONS).
+    """
+    __slots__ = ('segmentation',)
+
+
+def check_segmentation(segs, segmentation):
+    """Raise CorpusFormatError if segs is a CorpusWord of a corpus that was
+    not segmented with segmentation; other sequences are accepted as is."""
+    found = getattr(segs, 'segmentation', segmentation)
+    if found != segmentation:
+        raise CorpusFormatError(
+            'Word was segmented with {!r}, not {!r}; compile the corpus '
+            'with segmentation={!r}.'.format(found, segmentation,
+                                             segmentation))
+
+
+def _segmenter(segmentation):
+    if segmentation == SEGS:
+        return get_segment_cache().segmenter.segs
+    if segmentation == TEXT:
+        return get_segment_cache().segmenter.segment_text
+    return list
+
+
+def compile_corpus(in_path, out_path, segment=None, segmentation=SEGS):
+    """Segment a word list (one word per line) and write a binary corpus.
+
+    in_path -- path to a UTF-8 word list.
+    out_path -- path of the corpus file to write.
+    segment -- function from a word to a list of segments; by default, the
+    function of the segmentation.
+    segmentation -- one of SEGMENTATIONS; it is recorded in the corpus, and
+    must match the parser that will read it (for example, TEXT for
+    SyllabifierEngine).
+    return -- number of words written.
+    """
+    if segmentation not in SEGMENTATIONS:
+        raise ValueError('Unknown segmentation {!r}.'.format(segmentation))
+    if segment is None:
+        segment = _segmenter(segmentation)
+    inventory = SegmentInventory()
+    offsets = array.array(str('Q'), [0])
+    ids = array.array(str('H'))
+    with io.open(in_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                ids.extend(inventory.encode(segment(line.strip())))
+            except ValueError:
+                raise CorpusFormatError('Too many distinct segments.')
+            offsets.append(len(ids))
+    segments = inventory.segments
+    with io.open(out_path, 'wb') as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, SEGMENTATIONS.index(segmentation),
+                             len(segments), len(offsets) - 1))
+        size = _HEADER.size
+        for seg in segments:
+            data = seg.encode('utf-8')
+            f.write(_LENGTH.pack(len(data)))
+            f.write(data)
+            size += _LENGTH.size + len(data)
+        f.write(b'\0' * (-size % 8))
+        _little_endian(offsets).tofile(f)
+        _little_endian(ids).tofile(f)
+    return len(offsets) - 1
+
+
+class CorpusReader(object):
+    """Memory-mapped reader for corpora written by compile_corpus.
+
+    path -- path to the corpus file.
+
+    Members:
+    inventory -- SegmentInventory of the corpus.
+    segments -- the segment inventory as a list; segment id i is segments[i].
+    segmentation -- the segmentation the corpus was compiled with.
+    """
+
+    def __init__(self, path):
+        self._file = io.open(path, 'rb')
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, mode, n_segs, n_words = _HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            raise CorpusFormatError('Not a syllabletk corpus.')
+        if version != VERSION:
+            raise CorpusFormatError(
+                'Unsupported corpus version {}.'.format(version))
+        if mode >= len(SEGMENTATIONS):
+            raise CorpusFormatError('Unknown segmentation {}.'.format(mode))
+        self.segmentation = SEGMENTATIONS[mode]
+        if sys.byteorder != 'little':
+            raise CorpusFormatError('Corpora can only be mapped on '
+                                    'little-endian machines.')
+        pos = _HEADER.size
+        self.segments = []
+        for _ in range(n_segs):
+            (length,) = _LENGTH.unpack_from(self._mmap, pos)
+            pos += _LENGTH.size
+            self.segments.append(self._mmap[pos:pos + length].decode('utf-8'))
+            pos += length
+        pos += -pos % 8
+        self.inventory = SegmentInventory(self.segments)
+        view = memoryview(self._mmap)
+        end = pos + 8 * (n_words + 1)
+        self._offsets = view[pos:end].cast('Q')
+        self._ids = view[end:end + 2 * self._offsets[-1]].cast('H')
+        self._n_words = n_words
+
+    def __len__(self):
+        return self._n_words
+
+    def ids(self, i):
+        """Return the segment ids of word i as a memoryview (no copy)."""
+        return self._ids[self._offsets[i]:self._offsets[i + 1]]
+
+    def word_segments(self, i):
+        """Return the segments of word i as a CorpusWord of Unicode strings."""
+        segments = self.segments
+        word = CorpusWord([segments[j] for j in self.ids(i)])
+        word.segmentation = self.segmentation
+        return word
+
+    __getitem__ = word_segments
+
+    def iter_ids(self):
+        """Yield the segment ids of each word (see ids)."""
+        for i in range(self._n_words):
+            yield self.ids(i)
+
+    def __iter__(self):
+        """Yield the segments of each word (see word_segments)."""
+        segments = self.segments
+        segmentation = self.segmentation
+        ids, offsets = self._ids, self._offsets
+        for i in range(self._n_words):
+            word = CorpusWord([segments[j] for j in ids[offsets[i]:offsets[i + 1]]])
+            word.segmentation = segmentation
+            yield word
+
+    def close(self):
+        """Release the memory map and the file."""
+        self._offsets.release()
+        self._ids.release()
+        self._mmap.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
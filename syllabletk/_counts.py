@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+"""Type-frequency input.
+
+Much of our input is a frequency list, with one word and its count per line,
+or can cheaply be reduced to one. The weighted methods of MarginSniffer and
+SyllableAnalyzer process each distinct type once and add its count to the
+counters, which gives the same counts as processing every token.
+"""
+
+from __future__ import print_function, unicode_literals
+
+from collections import Counter
+
+
+class CountsFormatError(ValueError):
+    pass
+
+
+def read_counts(lines):
+    """Yield <word, count> pairs from the lines of a frequency list.
+
+    Each non-blank line holds a word and its count, separated by whitespace
+    (for example, a tab). Blank lines are skipped.
+
+    lines -- iterable of Unicode strings.
+    """
+    for n, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            word, count = line.rsplit(None, 1)
+            count = int(count)
+        except ValueError:
+            raise CountsFormatError(
+                'Line {}: expected a word and a count, got {!r}.'.format(
+                    n, line))
+        yield word, count
+
+
+def aggregate_counts(counts, key=None):
+    """Sum counts by type.
+
+    counts -- mapping from types to counts, or iterable of <type, count>
+    pairs; a type may occur more than once.
+    key -- function applied to each type before summing (for example, to
+    make it hashable).
+    return -- Counter of the types whose total count is positive, in order of
+    first occurrence.
+    """
+    items = counts.items() if hasattr(counts, 'items') else counts
+    totals = Counter()
+    for item, count in items:
+        totals[item if key is None else key(item)] += count
+    return Counter({item: count for (item, count) in totals.items()
+                    if count > 0})
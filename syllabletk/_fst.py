@@ -0,0 +1,389 @@
+# -*- coding: utf-8 -*-
+"""Compiled, table-driven form of ParameterizedSyllabifier.
+
+Compiling a syllabifier interns the segments of its margins as integer symbols
+and turns the attested onsets and codas into four deterministic automata with
+flat transition tables (onsets read forwards and backwards, codas read
+forwards and backwards). A word is then syllabified by a fixed number of
+linear passes over its symbols: the automata find the longest onset prefix,
+the longest coda suffix and the attested splits of each intervocalic cluster,
+and the sonority fallback for a cluster is found from the ends of its
+monotonic runs instead of by trying every split. The result is the same as
+that of ParameterizedSyllabifier.syllabify.
+
+Compiled syllabifiers are stored as JSON:
+
+    {
+      "format": "syllabletk-fst",
+      "version": 1,
+      "segments": ["b", "d", ...],
+      "sonority": [1, 1, ...],
+      "automata": {"ons": {"reverse": false, "delta": [...], "accept": [...]},
+                   "ons_r": ..., "cod": ..., "cod_r": ...}
+    }
+
+segments -- the symbol inventory; symbol i is segments[i], and symbol
+len(segments) stands for any other segment.
+sonority -- sonority score of each symbol in segments.
+delta -- transition table; the successor of state q on symbol a is
+delta[q * (len(segments) + 1) + a], or -1 if there is none.
+accept -- the accepting states.
+"""
+
+from __future__ import print_function, unicode_literals
+
+import bisect
+import io
+import json
+
+from ._corpus import SEGS, check_segmentation
+from ._parameterized import split_syllables
+from ._segcache import get_segment_cache
+
+FORMAT = 'syllabletk-fst'
+VERSION = 1
+_N, _O, _C, _G, _SPACE = [ord(c) for c in 'NOCG ']
+
+
+class FSTFormatError(Exception):
+    pass
+
+
+class Automaton(object):
+    """Deterministic automaton over integer symbols with a flat transition
+    table. Like syllabletk._trie.SegmentTrie, a reverse automaton stores its
+    members back to front and matches members that end at a given index.
+
+    width -- number of symbols.
+    reverse -- if True, match suffixes instead of prefixes.
+    delta -- transition table (see the module docstring); by default, a
+    single state with no transitions.
+    accept -- list of booleans, one per state.
+    """
+
+    def __init__(self, width, reverse=False, delta=None, accept=None):
+        self.width = width
+        self.reverse = reverse
+        self.delta = delta if delta is not None else [-1] * width
+        self.accept = accept if accept is not None else [False]
+
+    @classmethod
+    def from_sequences(cls, seqs, width, reverse=False):
+        """Build an automaton accepting exactly the given symbol sequences."""
+        automaton = cls(width, reverse)
+        for seq in seqs:
+            automaton.add(seq)
+        return automaton
+
+    def add(self, seq):
+        """Add a sequence of symbols to the accepted set."""
+        delta, width = self.delta, self.width
+        state = 0
+        for sym in (reversed(tuple(seq)) if self.reverse else seq):
+            k = state * width + sym
+            if delta[k] < 0:
+                delta[k] = len(self.accept)
+                delta.extend([-1] * width)
+                self.accept.append(False)
+            state = delta[k]
+        self.accept[state] = True
+
+    def match_lengths(self, syms, start=0, end=None):
+        """Return the lengths of all accepted sequences matching
+        syms[start:end], in ascending order (see SegmentTrie.match_lengths).
+        """
+        if end is None:
+            end = len(syms)
+        delta, accept, width = self.delta, self.accept, self.width
+        lengths = [0] if accept[0] else []
+        state = 0
+        if self.reverse:
+            for k in range(end - 1, start - 1, -1):
+                state = delta[state * width + syms[k]]
+                if state < 0:
+                    break
+                if accept[state]:
+                    lengths.append(end - k)
+        else:
+            for k in range(start, end):
+                state = delta[state * width + syms[k]]
+                if state < 0:
+                    break
+                if accept[state]:
+                    lengths.append(k + 1 - start)
+        return lengths
+
+    def longest_match(self, syms, start=0, end=None):
+        """Return the length of the longest accepted sequence matching
+        syms[start:end], or 0 if there is none."""
+        lengths = self.match_lengths(syms, start, end)
+        return lengths[-1] if lengths else 0
+
+    def to_dict(self):
+        return {'reverse': self.reverse,
+                'delta': self.delta,
+                'accept': [q for (q, a) in enumerate(self.accept) if a]}
+
+    @classmethod
+    def from_dict(cls, data, width):
+        delta = list(data['delta'])
+        if len(delta) % width:
+            raise FSTFormatError('Transition table does not match the '
+                                 'inventory.')
+        accept = [False] * (len(delta) // width)
+        for q in data['accept']:
+            accept[q] = True
+        return cls(width, data['reverse'], delta, accept)
+
+
+def _sonority_split(scores, start, end):
+    # Return the leftmost i in start+1..end-1 such that scores[start+1:i] is
+    # non-increasing and scores[i:end] is non-decreasing, or None. Only the
+    # start of the longest non-decreasing suffix can qualify, since the coda
+    # condition can only become false as i grows.
+    lo = start + 1
+    if lo >= end:
+        return None
+    i = end - 1
+    while i > lo and scores[i - 1] <= scores[i]:
+        i -= 1
+    for k in range(lo, i - 1):
+        if scores[k] < scores[k + 1]:
+            return None
+    return i
+
+
+def _automata_from_dict(data):
+    width = len(data['segments']) + 1
+    return {name: Automaton.from_dict(a, width)
+            for (name, a) in data['automata'].items()}
+
+
+class CompiledSyllabifier(object):
+    """Table-driven syllabifier compiled from attested margins.
+
+    Use compile (or ParameterizedSyllabifier.compile) to build one, and
+    save/load to store it.
+
+    segments -- the symbol inventory.
+    sonority -- sonority score of each segment.
+    automata -- dictionary of the four Automaton objects, keyed by 'ons',
+    'ons_r', 'cod' and 'cod_r'.
+    cache -- SegmentCache used to segment words and to score segments outside
+    the inventory; by default, the process-wide cache is used.
+
+    Members:
+    segmentation -- how syllabify splits words (see syllabletk._corpus).
+    """
+    segmentation = SEGS
+
+    def __init__(self, segments, sonority, automata, cache=None):
+        self.cache = cache if cache is not None else get_segment_cache()
+        self.segments = list(segments)
+        self.sonority = list(sonority)
+        self.other = len(self.segments)
+        self.automata = automata
+        self._ons = automata['ons']
+        self._ons_r = automata['ons_r']
+        self._cod = automata['cod']
+        self._cod_r = automata['cod_r']
+        self._codes = {seg: (i, score) for (i, (seg, score))
+                       in enumerate(zip(self.segments, self.sonority))}
+
+    @classmethod
+    def compile(cls, margins, cache=None):
+        """Compile attested margins.
+
+        margins -- a 2-tuple <init, fin> of attested onsets and codas (see
+        ParameterizedSyllabifier).
+        cache -- SegmentCache supplying sonority scores.
+        """
+        cache = cache if cache is not None else get_segment_cache()
+        onsets = set(tuple(x) for x in margins[0])
+        codas = set(tuple(x) for x in margins[1])
+        segments = sorted({seg for margin in onsets | codas for seg in margin})
+        index = {seg: i for (i, seg) in enumerate(segments)}
+        width = len(segments) + 1
+
+        def encode(margins):
+            return [[index[seg] for seg in margin] for margin in sorted(margins)]
+
+        automata = {
+            'ons': Automaton.from_sequences(encode(onsets), width),
+            'ons_r': Automaton.from_sequences(encode(onsets), width, True),
+            'cod': Automaton.from_sequences(encode(codas), width),
+            'cod_r': Automaton.from_sequences(encode(codas), width, True),
+        }
+        return cls(segments, cache.sonority_map(segments), automata, cache)
+
+    def __getstate__(self):
+        # See ParameterizedSyllabifier.__getstate__.
+        return {'fst': self.to_dict(),
+                'sonority': self.cache.sonority_table()}
+
+    def __setstate__(self, state):
+        cache = get_segment_cache()
+        cache.preload_sonority(state['sonority'])
+        data = state['fst']
+        self.__init__(data['segments'], data['sonority'],
+                      _automata_from_dict(data), cache)
+
+    def to_dict(self):
+        """Return the syllabifier as a JSON-serializable dictionary."""
+        return {'format': FORMAT,
+                'version': VERSION,
+                'segments': self.segments,
+                'sonority': self.sonority,
+                'automata': {name: a.to_dict()
+                             for (name, a) in sorted(self.automata.items())}}
+
+    @classmethod
+    def from_dict(cls, data, cache=None):
+        """Restore a syllabifier from a dictionary made by to_dict."""
+        if data.get('format') != FORMAT:
+            raise FSTFormatError('Not a compiled syllabifier.')
+        if data.get('version') != VERSION:
+            raise FSTFormatError(
+                'Unsupported compiled syllabifier version {}.'.format(
+                    data.get('version')))
+        return cls(data['segments'], data['sonority'],
+                   _automata_from_dict(data), cache)
+
+    def save(self, path):
+        """Write the syllabifier to a JSON file."""
+        with io.open(path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(self.to_dict(), ensure_ascii=False,
+                               separators=(',', ':')))
+
+    @classmethod
+    def load(cls, path, cache=None):
+        """Read a syllabifier written by save."""
+        with io.open(path, 'r', encoding='utf-8') as f:
+            return cls.from_dict(json.load(f), cache)
+
+    def encode(self, segs):
+        """Return the symbols and sonority scores of a list of segments.
+
+        return -- 2-tuple of lists <symbols, scores>.
+        """
+        codes, other = self._codes, self.other
+        syms, scores = [], []
+        for seg in segs:
+            code = codes.get(seg)
+            if code is None:
+                code = codes[seg] = (other, self.cache.sonority(seg))
+            syms.append(code[0])
+            scores.append(code[1])
+        return syms, scores
+
+    def syllabify(self, word):
+        """Syllabify word into a list of tuples of lists, as
+        ParameterizedSyllabifier.syllabify does.
+
+        word -- Unicode IPA string.
+        """
+        return self.syllabify_segs(self.cache.segmenter.segs(word))
+
+    def syllabify_segs(self, segs):
+        """Like syllabify, but for a word that has already been segmented."""
+        check_segmentation(segs, self.segmentation)
+        segs = list(segs)
+        if not segs:
+            return None
+        return split_syllables(segs, self.marks(segs))
+
+    def syllabify_many(self, words, ignore_errors=False):
+        """Syllabify a sequence of words.
+
+        ignore_errors -- if True, return None for words that cannot be parsed
+        instead of raising.
+        return -- list of syllabifications (see syllabify).
+        """
+        results = []
+        for word in words:
+            try:
+                results.append(self.syllabify(word))
+            except IndexError:
+                if not ignore_errors:
+                    raise
+                results.append(None)
+        return results
+
+    def marks(self, segs):
+        """Return the constituent marks of a non-empty list of segments as a
+        string (see PhonoRepr.marks)."""
+        n = len(segs)
+        syms, scores = self.encode(segs)
+        marks = bytearray(b' ' * n)
+        nuclei = []
+
+        def mark(i, symbol):
+            marks[i] = symbol
+            if symbol == _N:
+                k = bisect.bisect_left(nuclei, i)
+                if k == len(nuclei) or nuclei[k] != i:
+                    nuclei.insert(k, i)
+
+        # Longest attested onset prefix.
+        i = self._ons.longest_match(syms)
+        if i == 1:
+            mark(0, _N)
+        elif i > 1:
+            mark(i, _N)
+            for j in range(i):
+                mark(j, _O)
+        elif scores[0] <= 7 and scores[1] > 7:
+            mark(0, _O)
+            mark(1, _N)
+        elif scores[0] > 7:
+            mark(0, _N)
+
+        # Longest attested coda suffix.
+        i = n - self._cod_r.longest_match(syms)
+        mark(i - 1, _N)
+        for j in range(i, n):
+            mark(j, _C)
+
+        # Remaining nuclei.
+        first, last = nuclei[0], nuclei[-1]
+        if first != last:
+            for i, score in zip(range(first, last), scores[first:last]):
+                if score > 7:
+                    mark(i, _N)
+                elif score > scores[i - 1] and score > scores[i + 1]:
+                    mark(i, _N)
+
+        # Offglides.
+        state = _SPACE
+        for i, m in enumerate(bytes(marks)):
+            if state == _N and m == _SPACE and scores[i] == 7:
+                mark(i, _G)
+            state = m
+
+        # Intervocalic clusters.
+        for k in range(len(nuclei) - 1):
+            start, end = nuclei[k], nuclei[k + 1]
+            first = start + 1
+            while marks[first] == _G:
+                first += 1
+            i = self._attested_split(syms, first - 1, end)
+            if i is None:
+                first = start + 1
+                i = _sonority_split(scores, start, end)
+                if i is None:
+                    continue
+            for j in range(first, i):
+                mark(j, _C)
+            for j in range(i, end):
+                mark(j, _O)
+        return marks.decode('ascii')
+
+    def _attested_split(self, syms, start, end):
+        # See ParameterizedSyllabifier._attested_split.
+        ons_starts = set(end - n for n in
+                         self._ons_r.match_lengths(syms, start + 1, end))
+        for n in self._cod.match_lengths(syms, start + 1, end):
+            i = start + 1 + n
+            if i < end and i in ons_starts:
+                return i
+        return None
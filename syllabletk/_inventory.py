@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+"""Interned segment inventories.
+
+A SegmentInventory assigns each distinct segment a small integer id, so that
+words and margins can be held as compact arrays of ids (or as bytes, which are
+cheap to hash and compare) rather than as lists and tuples of strings. It also
+hands out one canonical string object per segment, so that the segments of
+many words share storage.
+"""
+
+from __future__ import print_function, unicode_literals
+
+import array
+
+TYPECODE = str('H')
+MAX_SEGMENTS = 65536
+
+
+class SegmentInventory(object):
+    """Bidirectional mapping between segments and integer ids.
+
+    segments -- segments to intern first; they receive ids 0, 1, ... in order.
+
+    Members:
+    segments -- list of the interned segments; segment id i is segments[i].
+    """
+
+    def __init__(self, segments=()):
+        self.segments = []
+        self._ids = {}
+        for seg in segments:
+            self.intern(seg)
+
+    def __len__(self):
+        return len(self.segments)
+
+    def __contains__(self, seg):
+        return seg in self._ids
+
+    def intern(self, seg):
+        """Return the id of a segment, assigning the next free id to a new
+        segment."""
+        try:
+            return self._ids[seg]
+        except KeyError:
+            if len(self.segments) >= MAX_SEGMENTS:
+                raise ValueError('Segment inventory is full.')
+            i = self._ids[seg] = len(self.segments)
+            self.segments.append(seg)
+            return i
+
+    def canonical(self, segs):
+        """Return a list of the canonical (shared) string objects for segs."""
+        ids, segments = self._ids, self.segments
+        out = []
+        for seg in segs:
+            i = ids.get(seg)
+            if i is None:
+                i = self.intern(seg)
+            out.append(segments[i])
+        return out
+
+    def encode(self, segs):
+        """Return the ids of a sequence of segments as an array('H')."""
+        ids = self._ids
+        out = array.array(TYPECODE)
+        for seg in segs:
+            i = ids.get(seg)
+            out.append(self.intern(seg) if i is None else i)
+        return out
+
+    def encode_key(self, segs):
+        """Return a sequence of segments as bytes, suitable as a dictionary key.
+
+        Keys use native byte order and are only meaningful to this inventory
+        (and so within one process).
+        """
+        return self.encode(segs).tobytes()
+
+    def decode(self, ids):
+        """Return the segments for a sequence of ids as a tuple of strings."""
+        segments = self.segments
+        return tuple([segments[i] for i in ids])
+
+    def decode_key(self, key):
+        """Return the segments of a key made by encode_key as a tuple."""
+        ids = array.array(TYPECODE)
+        ids.frombytes(key)
+        return self.decode(ids)
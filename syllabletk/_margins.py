@@ -4,44 +4,267 @@
 
 from __future__ import print_function, unicode_literals
 from collections import Counter
-import panphon.sonority
-import logging
+from collections.abc import Mapping
+import io
+import json
+import multiprocessing
+import os
 
-logging.basicConfig(logging=logging.DEBUG)
+from ._counts import aggregate_counts, read_counts
+from ._corpus import CHARS, SEGS, check_segmentation
+from ._model import dump_margin_model, parse_margin_model
+from ._segcache import get_segment_cache
 
 
 class MarginSniffer(object):
     """Given a WordMarginParser, count initial and final margins.
 
+    The state of a sniffer (its counters and the offset reached in its input
+    file) can be saved as a checkpoint, resumed, and merged with the state of
+    other sniffers.
+
+    Margins are counted as compact keys encoded by the SegmentInventory of
+    the parser's cache. The initial and final attributes are read-only
+    MarginCounts views of the counts; initial_counts and final_counts return
+    them as Counters of tuples of segments.
+
     margin_parser -- object that implements the WordMaringPaser interface.
     """
     def __init__(self, margin_parser):
+        self.margin_parser_class = margin_parser
         self.margin_parser = margin_parser()
-        self.initial, self.final = Counter(), Counter()
+        self.inventory = self.margin_parser.cache.inventory
+        self._initial, self._final = Counter(), Counter()
+        self.offset = 0
+
+    @property
+    def initial(self):
+        """Read-only view of the counts of initial margins."""
+        return MarginCounts(self._initial, self.inventory)
+
+    @property
+    def final(self):
+        """Read-only view of the counts of final margins."""
+        return MarginCounts(self._final, self.inventory)
+
+    def initial_counts(self):
+        """Return a Counter of initial margins (tuples of segments)."""
+        return self.initial.copy()
+
+    def final_counts(self):
+        """Return a Counter of final margins (tuples of segments)."""
+        return self.final.copy()
+
+    def _count(self, initial, final, count=1):
+        encode_key = self.inventory.encode_key
+        self._initial[encode_key(initial)] += count
+        self._final[encode_key(final)] += count
 
     def parse_token(self, token):
-        initial, final = self.margin_parser.parse(token)
-        self.initial[initial] += 1
-        self.final[final] += 1
+        self._count(*self.margin_parser.parse(token))
 
     def parse_tokens(self, tokens):
         """Apply margin parser's parse method to each each token."""
         for token in tokens:
             self.parse_token(token)
 
+    def parse_tokens_weighted(self, counts):
+        """Like parse_tokens, but for a frequency list: each distinct token
+        is parsed once and its margins are counted as often as the token
+        occurs.
+
+        counts -- mapping from tokens to counts, or iterable of <token,
+        count> pairs (see syllabletk._counts).
+        """
+        parse = self.margin_parser.parse
+        for token, count in aggregate_counts(counts).items():
+            self._count(*parse(token), count=count)
+
+    def parse_segmented(self, words):
+        """Count the margins of words that have already been segmented (for
+        example, those of a syllabletk._corpus.CorpusReader).
+
+        words -- iterable of lists of segments.
+        """
+        parse_segs = self.margin_parser.parse_segs
+        for segs in words:
+            self._count(*parse_segs(segs))
+
+    def parse_file(self, path, checkpoint_path=None, checkpoint_every=100000):
+        """Parse the tokens (one per line) of a UTF-8 file from self.offset.
+
+        self.offset is advanced past each line that is parsed, so a sniffer
+        restored from a checkpoint continues where it stopped, and a file that
+        grows by appending is only read from the previous end.
+
+        path -- path to the input file.
+        checkpoint_path -- if given, save a checkpoint there every
+        checkpoint_every lines and at the end.
+        """
+        with io.open(path, 'rb') as f:
+            f.seek(self.offset)
+            for n, line in enumerate(f, 1):
+                self.parse_token(line.strip().decode('utf-8'))
+                self.offset += len(line)
+                if checkpoint_path and n % checkpoint_every == 0:
+                    self.save_checkpoint(checkpoint_path)
+        if checkpoint_path:
+            self.save_checkpoint(checkpoint_path)
+
     def get_counters(self):
         """Return counts for intial and final margins as 2-tuple."""
-        return (self.initial, self.final)
+        return (self.initial_counts(), self.final_counts())
+
+    def merge(self, other):
+        """Add the counts of another sniffer to this one and return self.
+
+        The offsets are not combined, since they refer to different inputs.
+        """
+        if other.inventory is self.inventory:
+            self._initial.update(other._initial)
+            self._final.update(other._final)
+        else:
+            self._update(other.initial, other.final)
+        return self
+
+    def _update(self, initial, final):
+        # Add counts keyed by tuples of segments.
+        encode_key = self.inventory.encode_key
+        for margin, count in initial.items():
+            self._initial[encode_key(margin)] += count
+        for margin, count in final.items():
+            self._final[encode_key(margin)] += count
+
+    def __add__(self, other):
+        return MarginSniffer(self.margin_parser_class).merge(self).merge(other)
+
+    def to_checkpoint(self):
+        """Return the state of the sniffer as a JSON-serializable dictionary.
+
+        The dictionary is a margin model (see syllabletk._model) with an
+        additional "checkpoint" entry recording the parser and input offset.
+        """
+        data = dump_margin_model(self.initial, self.final)
+        data['checkpoint'] = {'parser': self.margin_parser_class.__name__,
+                              'offset': self.offset}
+        return data
+
+    @classmethod
+    def from_checkpoint(cls, data, margin_parser):
+        """Restore a sniffer from a dictionary made by to_checkpoint.
+
+        data -- checkpoint dictionary.
+        margin_parser -- WordMarginParser class; it must be the class the
+        checkpoint was made with.
+        """
+        checkpoint = data.get('checkpoint', {})
+        name = checkpoint.get('parser', margin_parser.__name__)
+        if name != margin_parser.__name__:
+            raise ValueError('Checkpoint was made with {}, not {}.'.format(
+                name, margin_parser.__name__))
+        sniffer = cls(margin_parser)
+        sniffer._update(*parse_margin_model(data))
+        sniffer.offset = checkpoint.get('offset', 0)
+        return sniffer
+
+    def save_checkpoint(self, path):
+        """Write a checkpoint to path, replacing any previous one atomically."""
+        tmp = path + '.tmp'
+        with io.open(tmp, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(self.to_checkpoint(), ensure_ascii=False,
+                               separators=(',', ':')))
+        os.replace(tmp, path)
+
+    @classmethod
+    def load_checkpoint(cls, path, margin_parser):
+        """Restore a sniffer from a checkpoint file (see from_checkpoint)."""
+        with io.open(path, 'r', encoding='utf-8') as f:
+            return cls.from_checkpoint(json.load(f), margin_parser)
+
+
+class MarginCounts(Mapping):
+    """Read-only view of margin counts held under encoded keys.
+
+    Like a Counter, it maps margins (sequences of segments) to counts and
+    gives 0 for margins that were not counted. Lookups encode the margin, so
+    they do not decode the other keys; iteration decodes the keys to tuples.
+    Update the counts through the MarginSniffer instead.
+
+    counts -- Counter keyed by SegmentInventory.encode_key.
+    inventory -- SegmentInventory that encoded the keys.
+    """
+
+    def __init__(self, counts, inventory):
+        self._counts = counts
+        self._inventory = inventory
+
+    def _key(self, margin):
+        # Margins with segments outside the inventory were never counted;
+        # they are not interned just to be looked up.
+        inventory = self._inventory
+        if all(seg in inventory for seg in margin):
+            return inventory.encode_key(margin)
+        return None
+
+    def __getitem__(self, margin):
+        return self._counts.get(self._key(margin), 0)
+
+    def __contains__(self, margin):
+        return self._key(margin) in self._counts
+
+    def get(self, margin, default=None):
+        return self._counts.get(self._key(margin), default)
+
+    def __iter__(self):
+        decode_key = self._inventory.decode_key
+        for key in self._counts:
+            yield decode_key(key)
+
+    def __len__(self):
+        return len(self._counts)
+
+    def items(self):
+        decode_key = self._inventory.decode_key
+        return [(decode_key(k), v) for (k, v) in self._counts.items()]
+
+    def copy(self):
+        """Return the counts as a Counter of tuples of segments."""
+        return Counter(dict(self.items()))
 
 
 class WordMarginParser(object):
-    """Base class for margin parsers."""
+    """Base class for margin parsers.
 
-    def __init__(self):
-        self.son = panphon.sonority.Sonority()
+    cache -- SegmentCache used for sonority lookups; by default, the
+    process-wide cache is used.
+
+    Members:
+    segmentation -- how segment splits words (see syllabletk._corpus).
+    """
+    segmentation = SEGS
+
+    def __init__(self, cache=None):
+        self.cache = cache if cache is not None else get_segment_cache()
+
+    @property
+    def son(self):
+        """The panphon Sonority object of the cache (built on first use)."""
+        return self.cache.son
 
     def _sonority_map(self, word):
-        return map(self.son.sonority, word)
+        return self.cache.sonority_map(word)
+
+    def segment(self, word):
+        """Return the segments of a word as a list of Unicode IPA strings."""
+        return self.cache.inventory.canonical(self.cache.segmenter.segs(word))
+
+    def parse(self, word):
+        """Given a word, return the first onset and last coda.
+
+        word -- word-length token (as a string) to be parsed. Returns tuple
+        consisting of first onset and last coda.
+        """
+        return self.parse_segs(self.segment(word))
 
     def from_map(self, son_map, word):
         return tuple([x for (x, _) in zip(word, son_map)])
@@ -52,6 +275,7 @@ class WordMarginParser(object):
 
 class FixedSonoritySlicer(WordMarginParser):
     """Margin parser that slices words before the first and after the last V."""
+    segmentation = CHARS
 
     def _initial_onset(self, son_map):
         i = 0
@@ -69,12 +293,17 @@ class FixedSonoritySlicer(WordMarginParser):
             i -= 1
         return cod
 
-    def parse(self, word):
-        """Given a word, return the first onset and last coda.
+    def segment(self, word):
+        """Return the characters of a word; this parser does not segment."""
+        return list(word)
 
-        word -- word-length token (as a string) to be parsed. Returns tuple
-        consisting of first onset and last coda.
+    def parse_segs(self, word):
+        """Given a segmented word, return the first onset and last coda.
+
+        word -- list of segments to be parsed. Returns tuple consisting of
+        first onset and last coda.
         """
+        check_segmentation(word, self.segmentation)
         son_map = self._sonority_map(word)
         ons_son = self._initial_onset(son_map)
         cod_son = self._final_coda(son_map)
@@ -143,13 +372,13 @@ class SonorityPeakSlicer(WordMarginParser):
                 ons.pop(0)
             return ons
 
-    def parse(self, word):
-        """Given a word, return the first onset and last coda.
+    def parse_segs(self, word):
+        """Given a segmented word, return the first onset and last coda.
 
-        word -- word-length token (as a string) to be parsed. Returns tuple
-        consisting of first onset and last coda.
+        word -- list of segments to be parsed. Returns tuple consisting of
+        first onset and last coda.
         """
-        word = self.son.segs(word)
+        check_segmentation(word, self.segmentation)
         son_map = self._sonority_map(word)
         son_map = self._mark_offglides(son_map)
         son_map = self._adjust_anom_fric_cod(son_map)
@@ -159,3 +388,84 @@ class SonorityPeakSlicer(WordMarginParser):
         ons = self.from_map(ons_son, word)
         cod = self.from_reverse_map(cod_son, word)
         return (ons, cod)
+
+
+def shard_file(path, n):
+    """Split a file into at most n byte ranges that begin at line boundaries.
+
+    path -- path to the file.
+    n -- number of shards wanted.
+    return -- list of (start, end) byte offsets covering the whole file.
+    """
+    size = os.path.getsize(path)
+    bounds = [0]
+    with io.open(path, 'rb') as f:
+        for k in range(1, n):
+            pos = size * k // n
+            if pos <= bounds[-1]:
+                continue
+            # Move to the start of the first line beginning at or after pos.
+            f.seek(pos - 1)
+            f.readline()
+            pos = f.tell()
+            if pos >= size:
+                break
+            bounds.append(pos)
+    bounds.append(size)
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def _read_lines(path, start, end):
+    # Yield the stripped, decoded lines of path between two byte offsets.
+    with io.open(path, 'rb') as f:
+        f.seek(start)
+        pos = start
+        while pos < end:
+            line = f.readline()
+            if not line:
+                break
+            pos += len(line)
+            yield line.strip().decode('utf-8')
+
+
+def _sniff_shard(args):
+    path, start, end, margin_parser, counts = args
+    sniffer = MarginSniffer(margin_parser)
+    if counts:
+        sniffer.parse_tokens_weighted(read_counts(_read_lines(path, start, end)))
+    else:
+        sniffer.parse_tokens(_read_lines(path, start, end))
+    return sniffer.get_counters()
+
+
+def sniff_file(path, margin_parser=SonorityPeakSlicer, workers=1,
+               counts=False):
+    """Count initial and final margins of the words in a file, one per line.
+
+    With more than one worker, the file is split into byte ranges at line
+    boundaries (see shard_file), each range is sniffed in a separate process,
+    and the counters are summed, so the result is the same as a serial run.
+
+    path -- path to a UTF-8 file with one token per line.
+    margin_parser -- WordMarginParser class to use.
+    workers -- number of worker processes.
+    counts -- if True, the file is a frequency list, with a word and its
+    count on each line (see MarginSniffer.parse_tokens_weighted).
+    return -- 2-tuple of Counters <initial, final>.
+    """
+    shards = [(path, start, end, margin_parser, counts)
+              for (start, end) in shard_file(path, max(1, workers))]
+    if workers <= 1 or len(shards) == 1:
+        results = [_sniff_shard(shard) for shard in shards]
+    else:
+        pool = multiprocessing.Pool(min(workers, len(shards)))
+        try:
+            results = pool.map(_sniff_shard, shards, 1)
+        finally:
+            pool.close()
+            pool.join()
+    initial, final = Counter(), Counter()
+    for shard_initial, shard_final in results:
+        initial.update(shard_initial)
+        final.update(shard_final)
+    return initial, final
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+"""Read and write margin models.
+
+A margin model records the word-initial and word-final margins sniffed from a
+corpus, with their counts. Models are stored as a single JSON object:
+
+    {
+      "format": "syllabletk-margins",
+      "version": 1,
+      "segments": ["b", "d", "d͡ʒ", ...],
+      "initials": [[[0], 43], [[0, 1], 36], ...],
+      "finals": [[[], 55698], [[2, 1], 5], ...]
+    }
+
+segments -- the segment inventory, as Unicode IPA strings.
+initials, finals -- onset and coda tables. Each row is a pair <margin,
+count>, where margin is a list of indices into segments.
+
+Unlike the legacy PyYAML files (which use !!python/tuple tags), models can be
+read with the standard json module and do not require an unsafe loader.
+"""
+
+from __future__ import print_function, unicode_literals
+
+import io
+import json
+
+FORMAT = 'syllabletk-margins'
+VERSION = 1
+
+
+class ModelFormatError(Exception):
+    pass
+
+
+def dump_margin_model(initials, finals):
+    """Return a margin model as a JSON-serializable dictionary.
+
+    initials -- mapping from onsets (sequences of segments) to counts.
+    finals -- mapping from codas (sequences of segments) to counts.
+    """
+    initials = {tuple(k): v for (k, v) in initials.items()}
+    finals = {tuple(k): v for (k, v) in finals.items()}
+    segments = sorted({seg for table in (initials, finals)
+                       for margin in table for seg in margin})
+    index = {seg: i for (i, seg) in enumerate(segments)}
+
+    def rows(table):
+        return [[[index[seg] for seg in margin], count]
+                for (margin, count) in sorted(table.items())]
+
+    return {'format': FORMAT,
+            'version': VERSION,
+            'segments': segments,
+            'initials': rows(initials),
+            'finals': rows(finals)}
+
+
+def parse_margin_model(data):
+    """Return <initials, finals> dictionaries from a model dictionary.
+
+    data -- dictionary as returned by dump_margin_model.
+    return -- 2-tuple of dictionaries mapping tuples of segments to counts.
+    """
+    if data.get('format') != FORMAT:
+        raise ModelFormatError('Not a margin model.')
+    if data.get('version') != VERSION:
+        raise ModelFormatError(
+            'Unsupported margin model version {}.'.format(data.get('version')))
+    segments = data['segments']
+
+    def table(rows):
+        return {tuple([segments[i] for i in margin]): count
+                for (margin, count) in rows}
+
+    return table(data['initials']), table(data['finals'])
+
+
+def write_margin_model(f, initials, finals):
+    """Write a margin model to a text file object (see dump_margin_model)."""
+    f.write(json.dumps(dump_margin_model(initials, finals),
+                       ensure_ascii=False, separators=(',', ':')))
+
+
+def read_margin_model(f):
+    """Read a margin model from a text file object (see parse_margin_model)."""
+    return parse_margin_model(json.load(f))
+
+
+def save_margin_model(path, initials, finals):
+    """Write a margin model to the file at path."""
+    with io.open(path, 'w', encoding='utf-8') as f:
+        write_margin_model(f, initials, finals)
+
+
+def load_margin_model(path):
+    """Read a margin model from the file at path."""
+    with io.open(path, 'r', encoding='utf-8') as f:
+        return read_margin_model(f)
+
+
+def load_yaml_margins(path):
+    """Read margins from a legacy PyYAML file such as tur.yml.
+
+    return -- 2-tuple of dictionaries mapping tuples of segments to counts.
+    """
+    import yaml
+    with io.open(path, 'r', encoding='utf-8') as f:
+        data = yaml.load(f, Loader=getattr(yaml, 'FullLoader', yaml.Loader))
+    return ({tuple(k): v for (k, v) in data['initials'].items()},
+            {tuple(k): v for (k, v) in data['finals'].items()})
+
+
+def load_margins(path):
+    """Read margins from either a margin model or a legacy PyYAML file.
+
+    return -- 2-tuple of dictionaries mapping tuples of segments to counts.
+    """
+    with io.open(path, 'r', encoding='utf-8') as f:
+        head = f.read(1)
+    if head == '{':
+        return load_margin_model(path)
+    return load_yaml_margins(path)
+
+
+def convert_yaml_margins(yaml_path, model_path):
+    """Convert a legacy PyYAML margins file to a margin model."""
+    initials, finals = load_yaml_margins(yaml_path)
+    save_margin_model(model_path, initials, finals)
@@ -1,12 +1,19 @@
 # -*- coding: utf-8 -*-
 from __future__ import print_function, unicode_literals
 
-import logging
+import array
+import bisect
+import contextlib
+from collections.abc import Sequence
+import multiprocessing
+import time
 
-import panphon.sonority
-import regex as re
+import re
 
-logging.basicConfig(level=logging.DEBUG)
+from ._corpus import SEGS, check_segmentation
+from ._model import load_margins
+from ._segcache import LRUCache, get_segment_cache
+from ._trie import SegmentTrie
 
 
 def flatten_syllables(segs_syl):
@@ -17,26 +24,149 @@ def flatten_syllables(segs_syl):
     return flat_string
 
 
+_missing = object()
+
+
+def freeze_syllables(segs_syl):
+    """Return an immutable copy of a syllabification (or None)."""
+    if segs_syl is None:
+        return None
+    return tuple((tuple(o), tuple(n), tuple(c)) for (o, n, c) in segs_syl)
+
+
+class SyllabifyStats(object):
+    """Cumulative per-stage timings of ParameterizedSyllabifier.syllabify.
+
+    Members:
+    time -- mapping from stage name to cumulative seconds.
+    calls -- mapping from stage name to number of calls.
+    splits -- number of intervocalic clusters split by attested margins
+    ('attested'), by the sonority fallback ('sonority'), or not at all
+    ('unsplit').
+    words -- number of words syllabified (result cache hits excluded).
+    """
+
+    stages = ('phono_repr', 'longest_ons_prefix', 'longest_cod_suffix',
+              'mark_rem_nuclei', 'mark_offglides', 'mark_intervocalic_clusts',
+              'syllabified')
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Zero all counters."""
+        self.time = dict.fromkeys(self.stages, 0.0)
+        self.calls = dict.fromkeys(self.stages, 0)
+        self.splits = {'attested': 0, 'sonority': 0, 'unsplit': 0}
+        self.words = 0
+
+    def add(self, stage, seconds):
+        """Record one call of stage that took seconds."""
+        self.time[stage] += seconds
+        self.calls[stage] += 1
+
+    def total(self):
+        """Return the cumulative time of all stages in seconds."""
+        return sum(self.time.values())
+
+    def as_dict(self):
+        """Return the statistics as a JSON-serializable dictionary."""
+        return {'stages': [{'stage': stage,
+                            'seconds': self.time[stage],
+                            'calls': self.calls[stage]}
+                           for stage in self.stages],
+                'splits': dict(self.splits),
+                'words': self.words,
+                'seconds': self.total()}
+
+    def __repr__(self):
+        return 'SyllabifyStats(words={}, seconds={:.6f})'.format(
+            self.words, self.total())
+
+
+_SYL_REGEX = re.compile('(O*)(NG?)(C*)')
+
+
+def split_syllables(segs, marks):
+    """Return segments grouped into syllables according to a string of marks
+    (see PhonoRepr).
+
+    segs -- list of segments.
+    marks -- string with one mark per segment.
+    return -- list of <onset, nucleus, coda> tuples of lists of segments.
+    """
+    segs_syl = []
+    pos = 0
+    for m in _SYL_REGEX.finditer(marks):
+        # Constituents are taken from consecutive offsets, whatever the
+        # position of the match.
+        o = pos + m.end(1) - m.start(1)
+        n = o + m.end(2) - m.start(2)
+        c = n + m.end(3) - m.start(3)
+        segs_syl.append((segs[pos:o], segs[o:n], segs[n:c]))
+        pos = c
+    return segs_syl
+
+
 class PhonoRepr(object):
     """Multi-tiered representation of a phonological word.
 
     Args:
-    segs -- Segments as a list of unicode strings.
-    son -- panphon.sonority.Sonority object.
+    son -- panphon.sonority.Sonority object. It is no longer used: word is
+    segmented by the cache's Segmenter, which gives the same segments as
+    son.filter_segs(son.segs_safe(word)). It may be None.
+    word -- Unicode IPA string.
+    cache -- SegmentCache used for sonority lookups; by default, the
+    process-wide cache is used.
+    segs -- if given, the segments of word, which is then not segmented again.
 
     Members:
+    ids -- the segments as ids of the cache's SegmentInventory, in an
+    array('H'). The syllabifier works on the ids; segs decodes them.
+    segs -- the segments as a list of Unicode strings (decoded on each read).
     marks -- Marks that indicate whether the corresponding segment is an onset
-    ("O"), nucleus ("N"), offglide (")"), or coda ("C").
-    scores -- sonority scores for the corresponding segment.
+    ("O"), nucleus ("N"), offglide (")"), or coda ("C"). They are stored in
+    a bytearray; this attribute is a Marks view of it, which reads and
+    assigns them as one-character strings, as a list would.
+    scores -- sonority scores for the corresponding segment, as array('b').
+    nuclei -- sorted indices of the segments marked as nuclei.
     i -- index for operations that scan the string.
     """
 
-    def __init__(self, son, word):
-        self.segs = son.filter_segs(son.segs_safe(word))
-        self.marks = [' ' for s in self.segs]
-        self.scores = [son.sonority(s) for s in self.segs]
+    __slots__ = ('ids', '_inventory', '_marks', 'scores', 'nuclei', 'i')
+
+    syl_regex = _SYL_REGEX
+
+    def __init__(self, son, word, cache=None, segs=None):
+        cache = cache if cache is not None else get_segment_cache()
+        segs = cache.segmenter.segs(word) if segs is None else list(segs)
+        self._inventory = cache.inventory
+        self.ids = cache.inventory.encode(segs)
+        self._marks = bytearray(b' ' * len(self.ids))
+        self.scores = array.array(str('b'), cache.sonority_map(segs))
         self.nuclei = []
-        self.syl_regex = re.compile('(O*)(NG?)(C*)')
+
+    @property
+    def segs(self):
+        """The segments as a list of Unicode strings."""
+        return list(self._inventory.decode(self.ids))
+
+    @property
+    def marks(self):
+        """The marks as a mutable Marks view."""
+        return Marks(self._marks)
+
+    @marks.setter
+    def marks(self, marks):
+        self._marks = bytearray(''.join(marks).encode('ascii'))
+
+    def get_mark(self, i):
+        """Return the mark at index i."""
+        return chr(self._marks[i])
+
+    def marks_string(self):
+        """Return the marks as a string."""
+        return self._marks.decode('ascii')
 
     def get_segment(self, i=None):
         """Return segment, sonority score, and mark for the index.
@@ -45,7 +175,8 @@ class PhonoRepr(object):
         instead.
         """
         i = i if i is not None else self.i
-        return self.segs[i], self.scores[i], self.marks[i]
+        return (self._inventory.segments[self.ids[i]], self.scores[i],
+                self.get_mark(i))
 
     def set_mark(self, i, symbol):
         """Set the mark at the index.
@@ -53,26 +184,62 @@ class PhonoRepr(object):
         i -- the index.
         symbol -- one of "O", "N", "C", or "G".
         """
-        self.marks[i] = symbol
+        self._marks[i] = ord(symbol)
         if symbol == 'N':
-            if i not in self.nuclei:
-                self.nuclei.append(i)
-                self.nuclei.sort()
+            nuclei = self.nuclei
+            k = bisect.bisect_left(nuclei, i)
+            if k == len(nuclei) or nuclei[k] != i:
+                nuclei.insert(k, i)
 
     def syllabified(self):
         """Return segments syllabified according to the marks."""
-        segs = self.segs[:]
-        segs_syl = []
-        for m in self.syl_regex.finditer(''.join(self.marks)):
-            o, n, c = m.groups()
-            ons = segs[0:len(o)]
-            segs = segs[len(o):]
-            nuc = segs[0:len(n)]
-            segs = segs[len(n):]
-            cod = segs[0:len(c)]
-            segs = segs[len(c):]
-            segs_syl.append((ons, nuc, cod))
-        return segs_syl
+        return split_syllables(self.segs, self.marks_string())
+
+
+class Marks(Sequence):
+    """Mutable, fixed-length view of the marks of a PhonoRepr.
+
+    Indexing gives one-character strings, and assigning a mark to an index
+    changes the PhonoRepr; like item assignment on the former list of marks,
+    it does not update PhonoRepr.nuclei (use set_mark for that).
+
+    marks -- the bytearray of marks.
+    """
+
+    __slots__ = ('_marks',)
+
+    def __init__(self, marks):
+        self._marks = marks
+
+    def __len__(self):
+        return len(self._marks)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return list(self._marks[i].decode('ascii'))
+        return chr(self._marks[i])
+
+    def __setitem__(self, i, mark):
+        if isinstance(i, slice):
+            data = ''.join(mark).encode('ascii')
+            if len(data) != len(self._marks[i]):
+                raise ValueError('Marks cannot be added or removed.')
+            self._marks[i] = data
+        else:
+            self._marks[i] = ord(mark)
+
+    def __iter__(self):
+        return iter(self._marks.decode('ascii'))
+
+    def __eq__(self, other):
+        if isinstance(other, (Marks, list, tuple)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return 'Marks({!r})'.format(list(self))
 
 
 class ParameterizedSyllabifier(object):
@@ -84,24 +251,145 @@ class ParameterizedSyllabifier(object):
     occur. When a sequence of consonants between nuclei cannot be divided into
     an onset from self.attest_ons and a coda from attest_cod, sonority is used
     as a fallback.
+    cache -- SegmentCache used for sonority lookups; by default, the
+    process-wide cache is used.
+    result_cache_size -- if given, cache the syllabifications of up to this
+    many distinct words, evicting the least recently used. Cached results are
+    returned as immutable tuples. The cache is cleared whenever ons_set or
+    cod_set is replaced.
+
+    Members:
+    cluster_table -- memo table mapping intervocalic clusters, as <segments
+    encoded by the cache's SegmentInventory, number of leading offglides>, to
+    [method, split, uses] (see _cluster_split). Sonority scores are not part
+    of the key, since they are determined by the segments. The table is
+    shared by all calls and cleared when the margins change.
+    stats -- SyllabifyStats collecting per-stage timings, or None (the
+    default) if instrumentation is disabled (see instrument).
+    segmentation -- how syllabify splits words (see syllabletk._corpus).
     """
+    segmentation = SEGS
+
+    def __init__(self, margins, cache=None, result_cache_size=None):
+        self.cache = cache if cache is not None else get_segment_cache()
+        self.result_cache = None
+        if result_cache_size:
+            self.result_cache = LRUCache(result_cache_size)
+        self.stats = None
+        self.set_margins(margins)
+
+    @property
+    def son(self):
+        """The panphon Sonority object of the cache (built on first use)."""
+        return self.cache.son
+
+    @classmethod
+    def from_margin_file(cls, path, **kwargs):
+        """Build a syllabifier from a margin model or legacy PyYAML file.
+
+        path -- path to the margins file (see syllabletk._model).
+        kwargs -- further arguments to the constructor.
+        """
+        initials, finals = load_margins(path)
+        return cls((list(initials), list(finals)), **kwargs)
 
-    def __init__(self, margins):
-        self.attest_ons, self.attest_cod = margins
-        self.attest_ons.sort(key=lambda x: len(x), reverse=True)
-        self.attest_cod.sort(key=lambda x: len(x), reverse=True)
-        self.ons_set = {tuple(x) for x in self.attest_ons}
-        self.cod_set = {tuple(x) for x in self.attest_cod}
-        self.son = panphon.sonority.Sonority()
+    def set_margins(self, margins):
+        """Replace the attested onsets and codas.
+
+        margins -- a 2-tuple <init, fin> of attested onsets and codas.
+        """
+        attest_ons, attest_cod = margins
+        self.attest_ons = sorted(attest_ons, key=lambda x: len(x), reverse=True)
+        self.attest_cod = sorted(attest_cod, key=lambda x: len(x), reverse=True)
+        self.ons_set = self.attest_ons
+        self.cod_set = self.attest_cod
+
+    @property
+    def ons_set(self):
+        """Frozen set of attested onsets as tuples of segments."""
+        return self._ons_set
+
+    @ons_set.setter
+    def ons_set(self, onsets):
+        self._ons_set = frozenset(tuple(x) for x in onsets)
+        ids = self._encode_margins(self._ons_set)
+        self._ons_trie = SegmentTrie(ids)
+        self._ons_rtrie = SegmentTrie(ids, reverse=True)
+        self._margins_changed()
+
+    @property
+    def cod_set(self):
+        """Frozen set of attested codas as tuples of segments."""
+        return self._cod_set
+
+    @cod_set.setter
+    def cod_set(self, codas):
+        self._cod_set = frozenset(tuple(x) for x in codas)
+        ids = self._encode_margins(self._cod_set)
+        self._cod_trie = SegmentTrie(ids)
+        self._cod_rtrie = SegmentTrie(ids, reverse=True)
+        self._margins_changed()
+
+    def _encode_margins(self, margins):
+        # The tries are keyed by inventory ids, like PhonoRepr.ids.
+        encode = self.cache.inventory.encode
+        return [encode(margin) for margin in margins]
+
+    def _margins_changed(self):
+        # Drop everything derived from the attested margins.
+        self.cluster_table = {}
+        if self.result_cache is not None:
+            self.result_cache.clear()
+
+    def __getstate__(self):
+        # Ship only the margins and settings; panphon objects are rebuilt (or
+        # shared through the process-wide cache) on the receiving side.
+        return {'margins': (self.attest_ons, self.attest_cod),
+                'result_cache_size': self.result_cache.maxsize
+                if self.result_cache is not None else None,
+                'sonority': self.cache.sonority_table()}
+
+    def __setstate__(self, state):
+        cache = get_segment_cache()
+        cache.preload_sonority(state['sonority'])
+        self.__init__(state['margins'], cache=cache,
+                      result_cache_size=state['result_cache_size'])
+
+    def compile(self):
+        """Return a syllabletk._fst.CompiledSyllabifier that gives the same
+        syllabifications as this syllabifier."""
+        from ._fst import CompiledSyllabifier
+        return CompiledSyllabifier.compile((self.attest_ons, self.attest_cod),
+                                           self.cache)
+
+    def result_cache_stats(self):
+        """Return the statistics of the word-result cache, or None if the
+        cache is disabled."""
+        if self.result_cache is None:
+            return None
+        return self.result_cache.stats()
+
+    @contextlib.contextmanager
+    def instrument(self, stats=None):
+        """Collect per-stage timings of syllabify within a with block.
+
+        stats -- SyllabifyStats to add to; by default, a new one.
+        return -- context manager yielding the SyllabifyStats object. The
+        previous value of self.stats is restored on exit.
+        """
+        previous = self.stats
+        self.stats = stats if stats is not None else SyllabifyStats()
+        try:
+            yield self.stats
+        finally:
+            self.stats = previous
 
     def _longest_ons_prefix(self, phonr):
         """Mark and return longest onset prefix.
 
         phonr -- a PhonoRepr object.
         """
-        i = len(phonr.segs)
-        while tuple(phonr.segs[:i]) not in self.ons_set and i > 0:
-            i -= 1
+        i = self._ons_trie.longest_match(phonr.ids)
         if i == 1:
             phonr.set_mark(0, 'N')
         elif i > 1:
@@ -120,11 +408,9 @@ class ParameterizedSyllabifier(object):
 
         phonr -- a PhonoRepr object with the longest coda suffix, if any, marked.
         """
-        i = 0
-        while tuple(phonr.segs[i:]) not in self.cod_set and i < len(phonr.segs):
-            i += 1
+        i = len(phonr.ids) - self._cod_rtrie.longest_match(phonr.ids)
         phonr.set_mark(i - 1, 'N')
-        for j in range(i, len(phonr.segs)):
+        for j in range(i, len(phonr.ids)):
             phonr.set_mark(j, 'C')
         return phonr
 
@@ -152,7 +438,7 @@ class ParameterizedSyllabifier(object):
         return -- mutated PhonoRepr object with postvocalic glides marked.
         """
         state = ' '
-        for i, mark in enumerate(phonr.marks):
+        for i, mark in enumerate(phonr.marks_string()):
             if state == 'N' and mark == ' ' and phonr.scores[i] == 7:
                 phonr.set_mark(i, 'G')
             state = mark
@@ -161,16 +447,94 @@ class ParameterizedSyllabifier(object):
     def _mark_intervocalic_clusts(self, phonr):
         """Mark the clusters between vowels with 'C's and 'O's.
 
+        Splits are looked up in (and added to) self.cluster_table.
+
         phonr -- a PhonoRepr object.
         return -- mutated PhonoRepr object.
         """
+        stats = self.stats
         if len(phonr.nuclei) > 1:
             for i, start in enumerate(phonr.nuclei[:-1]):
                 end = phonr.nuclei[i + 1]
-                if self._mark_intervocalic_clust_attested(phonr, start, end) is None:
-                    self._mark_intervocalic_clust_sonority(phonr, start, end)
+                method, split = self._cluster_split(phonr, start, end)
+                if stats is not None:
+                    stats.splits[method or 'unsplit'] += 1
+                if method is not None:
+                    first = start + 1
+                    if method == 'attested':
+                        while phonr.get_mark(first) == 'G':
+                            first += 1
+                    self._mark_split(phonr, first, start + 1 + split, end)
         return phonr
 
+    def _cluster_split(self, phonr, start, end):
+        """Return the split chosen for the cluster between two nuclei.
+
+        phonr -- a PhonoRepr object.
+        start -- index of the nucleus preceding the cluster.
+        end -- index of the nucleus following the cluster.
+        return -- 2-tuple <method, split>, where method is 'attested',
+        'sonority', or None (no split) and split is the index of the first
+        onset segment relative to start + 1.
+        """
+        glides = 0
+        while phonr.get_mark(start + 1 + glides) == 'G':
+            glides += 1
+        key = (phonr.ids[start + 1:end].tobytes(), glides)
+        entry = self.cluster_table.get(key)
+        if entry is None:
+            i = self._attested_split(phonr.ids, start + glides, end)
+            if i is not None:
+                entry = ['attested', i - start - 1, 0]
+            else:
+                i = self._sonority_split(phonr.scores, start, end)
+                if i is not None:
+                    entry = ['sonority', i - start - 1, 0]
+                else:
+                    entry = [None, None, 0]
+            self.cluster_table[key] = entry
+        entry[2] += 1
+        return entry[0], entry[1]
+
+    def _mark_split(self, phonr, first, i, end):
+        # Mark first..i-1 as coda and i..end-1 as onset.
+        for j in range(first, i):
+            phonr.set_mark(j, 'C')
+        for j in range(i, end):
+            phonr.set_mark(j, 'O')
+
+    def _attested_split(self, ids, start, end):
+        # Return the leftmost split of ids[start+1:end] into an attested coda
+        # and a non-empty attested onset, or None. Onsets ending at end and
+        # codas beginning after start are each found in one trie walk.
+        ons_starts = set(end - n for n in
+                         self._ons_rtrie.match_lengths(ids, start + 1, end))
+        for n in self._cod_trie.match_lengths(ids, start + 1, end):
+            i = start + 1 + n
+            if i < end and i in ons_starts:
+                return i
+        return None
+
+    def _sonority_split(self, scores, start, end):
+        # Return the leftmost split of scores[start+1:end] into a coda of
+        # non-rising sonority and an onset of non-falling sonority, or None.
+
+        def valid_cod(cod):
+            for i, score in enumerate(cod[:-1]):
+                if i < len(cod) - 1 and score < cod[i + 1]:
+                    return False
+            return True
+
+        def valid_ons(ons):
+            return valid_cod(list(reversed(ons)))
+
+        for i in range(start + 1, end):
+            cod = scores[start + 1:i]
+            ons = scores[i:end]
+            if valid_cod(cod) and valid_ons(ons):
+                return i
+        return None
+
     def _mark_intervocalic_clust_attested(self, phonr, start, end):
         """Use attested onsets/codas to parse intervocalic consonants/clusters.
 
@@ -179,18 +543,13 @@ class ParameterizedSyllabifier(object):
         end -- index marking the end of a consonant sequence.
         return -- mutated phonr if syllabificiation is possible; otherwise, None.
         """
-        while phonr.marks[start + 1] == 'G':
+        while phonr.get_mark(start + 1) == 'G':
             start += 1
-        for i in range(start + 1, end):
-            cod = phonr.segs[start + 1:i]
-            ons = phonr.segs[i:end]
-            if tuple(cod) in self.cod_set and tuple(ons) in self.ons_set:
-                for j in range(start + 1, i):
-                    phonr.set_mark(j, 'C')
-                for j in range(i, end):
-                    phonr.set_mark(j, 'O')
-                return phonr
-        return None
+        i = self._attested_split(phonr.ids, start, end)
+        if i is None:
+            return None
+        self._mark_split(phonr, start + 1, i, end)
+        return phonr
 
     def _mark_intervocalic_clust_sonority(self, phonr, start, end):
         """Use sonority to mark intervocalic consonants/clusters.
@@ -200,35 +559,109 @@ class ParameterizedSyllabifier(object):
         end -- index marking the end of a consonant sequence.
         return -- mutated phonr if syllabificiation is possible; otherwise, None.
         """
+        i = self._sonority_split(phonr.scores, start, end)
+        if i is None:
+            return None
+        self._mark_split(phonr, start + 1, i, end)
+        return phonr
 
-        def valid_cod(cod):
-            for i, score in enumerate(cod[:-1]):
-                if i < len(cod) - 1 and score < cod[i + 1]:
-                    return False
-            return True
+    def cluster_table_stats(self):
+        """Return how many distinct clusters and how many cluster tokens were
+        split by each method, as a dictionary keyed by 'attested', 'sonority'
+        and 'unsplit'."""
+        stats = {}
+        for method, _, uses in self.cluster_table.values():
+            method = method or 'unsplit'
+            types, tokens = stats.get(method, (0, 0))
+            stats[method] = (types + 1, tokens + uses)
+        return {method: {'types': types, 'tokens': tokens}
+                for method, (types, tokens) in stats.items()}
+
+    def export_cluster_table(self):
+        """Return the cluster table as a list of JSON-serializable records.
+
+        Each record has the keys 'segs', 'scores', 'glides', 'method', 'split'
+        and 'uses'.
+        """
+        records = []
+        for (key, glides), (method, split, uses) in self.cluster_table.items():
+            segs = list(self.cache.inventory.decode_key(key))
+            records.append({'segs': segs,
+                            'scores': self.cache.sonority_map(segs),
+                            'glides': glides, 'method': method,
+                            'split': split, 'uses': uses})
+        return records
 
-        def valid_ons(ons):
-            return valid_cod(list(reversed(ons)))
+    def load_cluster_table(self, records):
+        """Warm the cluster table from records made by export_cluster_table.
 
-        for i in range(start + 1, end):
-            cod = phonr.scores[start + 1:i]
-            ons = phonr.scores[i:end]
-            if valid_cod(cod) and valid_ons(ons):
-                for j in range(start + 1, i):
-                    phonr.set_mark(j, 'C')
-                for j in range(i, end):
-                    phonr.set_mark(j, 'O')
-                return phonr
-        return None
+        The records must come from a syllabifier with the same margins.
+
+        records -- iterable of dictionaries.
+        """
+        encode_key = self.cache.inventory.encode_key
+        for r in records:
+            key = (encode_key(r['segs']), r['glides'])
+            self.cluster_table[key] = [r['method'], r['split'], r.get('uses', 0)]
 
     def syllabify(self, word):
         """Syllabify word into a list of tuples of lists.
 
         word -- Unicode IPA string to be syllabified.
         return -- a list of 3-tuples (syllables) consisting of lists of strings.
+        If the result cache is enabled, a tuple of 3-tuples of tuples is
+        returned instead.
+        """
+        if self.result_cache is not None:
+            segs_syl = self.result_cache.get(word, _missing)
+            if segs_syl is _missing:
+                segs_syl = freeze_syllables(self._syllabify(word))
+                self.result_cache.put(word, segs_syl)
+            return segs_syl
+        return self._syllabify(word)
+
+    def syllabify_many(self, words, workers=None, chunksize=None,
+                       ignore_errors=False):
+        """Syllabify a sequence of words, optionally using a process pool.
+
+        words -- an iterable of Unicode IPA strings.
+        workers -- number of worker processes; if None or 1, or if there are
+        fewer than PARALLEL_MIN_WORDS words, the words are processed in this
+        process.
+        chunksize -- number of words sent to a worker per task; by default,
+        chosen from the number of words and workers.
+        ignore_errors -- if True, return None for words that cannot be parsed
+        instead of raising.
+        return -- list of syllabifications (see syllabify) in input order.
+        """
+        words = list(words)
+        if not workers or workers <= 1 or len(words) < PARALLEL_MIN_WORDS:
+            return [_syllabify_or_none(self, w, ignore_errors) for w in words]
+        if chunksize is None:
+            chunksize = max(1, min(1000, len(words) // (workers * 4)))
+        pool = multiprocessing.Pool(workers, _init_worker,
+                                    (self, ignore_errors))
+        try:
+            return list(pool.imap(_syllabify_in_worker, words, chunksize))
+        finally:
+            pool.close()
+            pool.join()
+
+    def syllabify_segs(self, segs):
+        """Like syllabify, but for a word that has already been segmented
+        (for example, one read from a syllabletk._corpus.CorpusReader). The
+        result cache is not used.
+
+        segs -- sequence of segments as Unicode IPA strings.
         """
-        phonr = PhonoRepr(self.son, word)
-        if phonr.segs:
+        check_segmentation(segs, self.segmentation)
+        return self._syllabify(None, segs)
+
+    def _syllabify(self, word, segs=None):
+        if self.stats is not None:
+            return self._syllabify_timed(word, segs)
+        phonr = PhonoRepr(None, word, self.cache, segs)
+        if phonr.ids:
             phonr = self._longest_ons_prefix(phonr)
             phonr = self._longest_cod_suffix(phonr)
             phonr = self._mark_rem_nuclei(phonr)
@@ -238,3 +671,55 @@ class ParameterizedSyllabifier(object):
             return segs_syl
         else:
             return None
+
+    def _syllabify_timed(self, word, segs=None):
+        # Same pipeline as _syllabify, with each stage timed into self.stats.
+        stats = self.stats
+        clock = time.perf_counter
+        stats.words += 1
+        t0 = clock()
+        phonr = PhonoRepr(None, word, self.cache, segs)
+        t1 = clock()
+        stats.add('phono_repr', t1 - t0)
+        if not phonr.ids:
+            return None
+        for stage, mark in (('longest_ons_prefix', self._longest_ons_prefix),
+                            ('longest_cod_suffix', self._longest_cod_suffix),
+                            ('mark_rem_nuclei', self._mark_rem_nuclei),
+                            ('mark_offglides', self._mark_offglides),
+                            ('mark_intervocalic_clusts',
+                             self._mark_intervocalic_clusts)):
+            t0 = t1
+            phonr = mark(phonr)
+            t1 = clock()
+            stats.add(stage, t1 - t0)
+        segs_syl = phonr.syllabified()
+        stats.add('syllabified', clock() - t1)
+        return segs_syl
+
+
+PARALLEL_MIN_WORDS = 2000
+"""Inputs shorter than this are syllabified without a process pool."""
+
+_worker_state = {}
+
+
+def _syllabify_or_none(ps, word, ignore_errors):
+    try:
+        return ps.syllabify(word)
+    except IndexError:
+        if not ignore_errors:
+            raise
+        return None
+
+
+def _init_worker(ps, ignore_errors):
+    # Runs once per worker: the syllabifier (margins and sonority table) is
+    # unpickled here rather than with every task.
+    _worker_state['ps'] = ps
+    _worker_state['ignore_errors'] = ignore_errors
+
+
+def _syllabify_in_worker(word):
+    return _syllabify_or_none(_worker_state['ps'], word,
+                              _worker_state['ignore_errors'])
@@ -0,0 +1,328 @@
+# -*- coding: utf-8 -*-
+"""Memo caches for segment- and word-level results.
+
+Sonority scores and feature vectors depend only on the segment, and a language
+has only a few dozen distinct segments, so they are looked up in panphon once
+and then served from memory. Word-level results are held in bounded LRU caches,
+since word frequencies in running text follow Zipf's law.
+
+panphon is only imported, and its feature tables only built, when a segment is
+first looked up that is not in the cache. Sonority scores are first looked up
+in a snapshot (SONORITY_SNAPSHOT, generated with write_sonority_snapshot), so
+a process that only needs sonority scores of known segments never builds a
+panphon table. The snapshot also records panphon's segment inventory, from
+which the cache's Segmenter is built. The bundled snapshot stands in for the
+default Sonority object only: a cache given its own Sonority object uses that
+object's scores and inventory.
+"""
+
+from __future__ import print_function, unicode_literals
+
+from collections import OrderedDict
+import io
+import json
+import os
+
+from ._inventory import SegmentInventory
+
+SONORITY_SNAPSHOT = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                 'data', 'sonority.json')
+SNAPSHOT_FORMAT = 'syllabletk-sonority'
+# Default of SegmentCache's snapshot argument: SONORITY_SNAPSHOT, unless a
+# Sonority object is given.
+_BUNDLED = object()
+
+
+class SegmentCache(object):
+    """Memoize sonority scores and feature vectors keyed by segment string.
+
+    maxsize -- maximum number of segments to hold in each table; if None, the
+    tables are unbounded. When a table is full, the oldest entry is evicted.
+    son -- panphon.sonority.Sonority object; if None, one is built the first
+    time it is needed.
+    snapshot -- path to a sonority snapshot consulted before panphon, or None
+    to always use panphon. It is read the first time a score is missing. By
+    default, SONORITY_SNAPSHOT is used if son is None, and no snapshot
+    otherwise, since the bundled snapshot was made from panphon's default
+    tables.
+
+    Members:
+    inventory -- SegmentInventory interning the segments seen by the
+    subsystems that share this cache. It is not emptied by clear, since ids
+    may be held elsewhere.
+    segmenter -- syllabletk._segmenter.Segmenter used by the subsystems that
+    share this cache (built on first use).
+    """
+
+    def __init__(self, maxsize=None, son=None, snapshot=_BUNDLED):
+        if snapshot is _BUNDLED:
+            snapshot = SONORITY_SNAPSHOT if son is None else None
+        self.maxsize = maxsize
+        self._son = son
+        self.snapshot = snapshot
+        self._snapshot_data = None
+        self._segmenter = None
+        self._sonority = OrderedDict()
+        self._features = OrderedDict()
+        self.inventory = SegmentInventory()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def son(self):
+        """The panphon.sonority.Sonority object backing the cache."""
+        if self._son is None:
+            import panphon.sonority
+            self._son = panphon.sonority.Sonority()
+        return self._son
+
+    @property
+    def segmenter(self):
+        """The Segmenter of the cache (built on first use)."""
+        if self._segmenter is None:
+            from ._segmenter import Segmenter
+            segments = self._read_snapshot().get('segments')
+            if segments is None:
+                segments = list(self.son.seg_dict)
+            self._segmenter = Segmenter(segments)
+        return self._segmenter
+
+    def _read_snapshot(self):
+        if self._snapshot_data is None:
+            self._snapshot_data = {}
+            if self.snapshot and os.path.exists(self.snapshot):
+                self._snapshot_data = _read_snapshot(self.snapshot)
+        return self._snapshot_data
+
+    def _snapshot_sonority(self, seg):
+        # Return the score of seg in the snapshot, or None.
+        return self._read_snapshot().get('sonority', {}).get(seg)
+
+    def _store(self, table, seg, value):
+        if self.maxsize is not None:
+            while len(table) >= self.maxsize and table:
+                table.popitem(last=False)
+        if self.maxsize is None or self.maxsize > 0:
+            table[seg] = value
+        return value
+
+    def sonority(self, seg):
+        """Return the sonority score (1-9) of a segment.
+
+        seg -- segment as a Unicode IPA string.
+        """
+        try:
+            value = self._sonority[seg]
+        except KeyError:
+            self.misses += 1
+            value = self._snapshot_sonority(seg)
+            if value is None:
+                value = self.son.sonority(seg)
+            return self._store(self._sonority, seg, value)
+        self.hits += 1
+        return value
+
+    def sonority_map(self, segs):
+        """Return a list of the sonority scores of a sequence of segments."""
+        table = self._sonority
+        try:
+            scores = [table[seg] for seg in segs]
+        except KeyError:
+            return [self.sonority(seg) for seg in segs]
+        self.hits += len(scores)
+        return scores
+
+    def sonority_table(self):
+        """Return a dictionary of the sonority scores cached so far."""
+        return dict(self._sonority)
+
+    def preload_sonority(self, table):
+        """Add precomputed sonority scores to the cache.
+
+        table -- dictionary mapping segments to sonority scores.
+        """
+        for seg, score in table.items():
+            if seg not in self._sonority:
+                self._store(self._sonority, seg, score)
+
+    def features_table(self):
+        """Return a dictionary of the feature vectors cached so far."""
+        return dict(self._features)
+
+    def preload_features(self, table):
+        """Add precomputed feature vectors to the cache.
+
+        table -- dictionary mapping segments to frozensets of (value, feature)
+        tuples, such as one returned by features_table.
+        """
+        for seg, fts in table.items():
+            if seg not in self._features:
+                self._store(self._features, seg, fts)
+
+    def features(self, seg):
+        """Return the features of a segment as a frozenset of (value, feature)
+        tuples; unknown segments have no features.
+
+        seg -- segment as a Unicode IPA string.
+        """
+        try:
+            value = self._features[seg]
+        except KeyError:
+            self.misses += 1
+            fts = self.son.fts(seg) or ()
+            return self._store(self._features, seg, frozenset(fts))
+        self.hits += 1
+        return value
+
+    def match_pattern_seq(self, pat, const):
+        """Return True if each segment in const matches the corresponding
+        feature set in pat and they are of the same length.
+
+        pat -- a list of sets of (value, feature) tuples (see panphon.pat).
+        const -- a sequence of Unicode IPA strings.
+        """
+        if len(pat) != len(const):
+            return False
+        for p, seg in zip(pat, const):
+            if not self.features(seg).issuperset(p):
+                return False
+        return True
+
+    def stats(self):
+        """Return hit/miss statistics and table sizes as a dictionary."""
+        lookups = self.hits + self.misses
+        return {'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': float(self.hits) / lookups if lookups else 0.0,
+                'sonority_size': len(self._sonority),
+                'features_size': len(self._features),
+                'maxsize': self.maxsize}
+
+    def clear(self):
+        """Empty the tables and reset the statistics."""
+        self._sonority.clear()
+        self._features.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+class LRUCache(object):
+    """Bounded mapping that evicts the least recently used entry.
+
+    maxsize -- maximum number of entries to hold.
+    """
+
+    _missing = object()
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def get(self, key, default=None):
+        """Return the value for key and mark it as recently used.
+
+        If key is not present, count a miss and return default.
+        """
+        value = self._data.pop(key, self._missing)
+        if value is self._missing:
+            self.misses += 1
+            return default
+        self._data[key] = value
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        """Store value under key, evicting the oldest entries if necessary."""
+        self._data.pop(key, None)
+        while self._data and len(self._data) >= self.maxsize:
+            self._data.popitem(last=False)
+            self.evictions += 1
+        if self.maxsize > 0:
+            self._data[key] = value
+
+    def stats(self):
+        """Return hit/miss/eviction statistics as a dictionary."""
+        lookups = self.hits + self.misses
+        return {'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': float(self.hits) / lookups if lookups else 0.0,
+                'size': len(self._data),
+                'maxsize': self.maxsize}
+
+    def clear(self):
+        """Remove all entries; the statistics are kept."""
+        self._data.clear()
+
+
+def _read_snapshot(path):
+    with io.open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    if data.get('format') != SNAPSHOT_FORMAT:
+        raise ValueError('Not a sonority snapshot: {}'.format(path))
+    return data
+
+
+def read_sonority_snapshot(path):
+    """Return the table of a sonority snapshot as a dictionary mapping
+    segments to scores."""
+    return _read_snapshot(path)['sonority']
+
+
+def read_snapshot_segments(path):
+    """Return the segment inventory recorded in a sonority snapshot as a list,
+    or None if it has none."""
+    return _read_snapshot(path).get('segments')
+
+
+def write_sonority_snapshot(path, segments=None, son=None):
+    """Compute the sonority scores of segments with panphon and write them as
+    a snapshot (see SegmentCache), together with panphon's segment inventory.
+
+    path -- path of the JSON file to write.
+    segments -- iterable of segments; by default, panphon's segment inventory.
+    son -- panphon.sonority.Sonority object; by default, a new one.
+    return -- number of segments written.
+    """
+    if son is None:
+        import panphon.sonority
+        son = panphon.sonority.Sonority()
+    inventory = sorted(son.seg_dict)
+    if segments is None:
+        segments = inventory
+    table = {seg: son.sonority(seg) for seg in set(segments)}
+    with io.open(path, 'w', encoding='utf-8') as f:
+        f.write(json.dumps({'format': SNAPSHOT_FORMAT, 'version': 1,
+                            'segments': inventory, 'sonority': table},
+                           ensure_ascii=False, sort_keys=True,
+                           separators=(',', ':')))
+    return len(table)
+
+
+_default_cache = None
+
+
+def get_segment_cache():
+    """Return the process-wide SegmentCache shared by all subsystems."""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = SegmentCache()
+    return _default_cache
+
+
+def set_segment_cache(cache):
+    """Replace the process-wide SegmentCache (for example, to bound its size).
+
+    cache -- a SegmentCache object.
+    """
+    global _default_cache
+    _default_cache = cache
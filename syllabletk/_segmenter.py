@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+"""Segmentation of IPA strings into segments.
+
+panphon segments words with a regular expression that alternates over its
+whole segment inventory (several thousand segments), which makes segmentation
+the most expensive step of syllabification. A Segmenter instead walks a trie
+of the inventory, keyed by code point, taking the longest segment at each
+position. It gives the same segments as panphon:
+
+segs -- like Sonority.segs (and filter_segs(segs_safe(word))): characters
+that do not begin a segment are dropped.
+segs_safe -- like Sonority.segs_safe: such characters are kept as
+single-character segments.
+segment_text -- like panphon._panphon.segment_text, which does not use the
+inventory: a segment is a base character followed by any combining
+diacritics and then any spacing modifier letters.
+
+Plain ASCII words, which need only the few ASCII segments of the inventory,
+are segmented by a small compiled pattern, and the segmentations of recently
+seen words are cached.
+"""
+
+from __future__ import print_function, unicode_literals
+
+import re
+
+from ._segcache import LRUCache
+
+WORD_CACHE_SIZE = 65536
+
+# Character classes of panphon's SEG_REGEX, by code point. All classified
+# code points are below 0x400.
+_OTHER, _BASE, _COMBINING, _MODIFIER = range(4)
+
+
+def _text_classes():
+    classes = bytearray(0x400)
+    for lo, hi in [(0x0000, 0x007F), (0x00C0, 0x00FF), (0x0250, 0x02AF),
+                   (0x0370, 0x03FF), (0x014B, 0x014B), (0x0153, 0x0153)]:
+        classes[lo:hi + 1] = bytes(bytearray([_BASE] * (hi + 1 - lo)))
+    classes[0x02B0:0x0300] = bytes(bytearray([_MODIFIER] * 0x50))
+    classes[0x0300:0x0370] = bytes(bytearray([_COMBINING] * 0x70))
+    classes[0x0361] = _OTHER
+    return bytes(classes)
+
+
+_TEXT_CLASSES = _text_classes()
+
+
+def _text_class(c):
+    o = ord(c)
+    return _TEXT_CLASSES[o] if o < 0x400 else _OTHER
+
+
+class Segmenter(object):
+    """Longest-match segmenter over a segment inventory.
+
+    segments -- iterable of segments (Unicode IPA strings), such as the keys of
+    panphon's FeatureTable.seg_dict.
+    cache_size -- number of words whose segmentations are cached per method;
+    0 disables the caches.
+
+    Members:
+    root -- the trie: each node is a dictionary mapping a character to a list
+    <child node, segment>, where segment is the segment ending at the child,
+    or None.
+    """
+
+    def __init__(self, segments, cache_size=WORD_CACHE_SIZE):
+        self.root = {}
+        self.size = 0
+        ascii_segs = []
+        for seg in set(segments):
+            if not seg:
+                continue
+            self._add(seg)
+            if seg.isascii():
+                ascii_segs.append(seg)
+        ascii_segs.sort(key=lambda seg: (-len(seg), seg))
+        pattern = '|'.join(re.escape(seg) for seg in ascii_segs)
+        self._ascii_re = re.compile(pattern or '(?!)')
+        self._ascii_safe_re = re.compile(pattern + '|.' if pattern else '.',
+                                         re.DOTALL)
+        self.cache_size = cache_size
+        self._caches = {}
+
+    def __len__(self):
+        return self.size
+
+    def _add(self, seg):
+        node = self.root
+        for c in seg[:-1]:
+            entry = node.get(c)
+            if entry is None:
+                entry = node[c] = [{}, None]
+            node = entry[0]
+        entry = node.get(seg[-1])
+        if entry is None:
+            entry = node[seg[-1]] = [{}, None]
+        if entry[1] is None:
+            self.size += 1
+        entry[1] = seg
+
+    def _cached(self, name, word, segment):
+        # Return the cached segmentation of word for a method, or compute,
+        # cache and return it. Callers get a fresh list.
+        if not self.cache_size:
+            return segment(word)
+        cache = self._caches.get(name)
+        if cache is None:
+            cache = self._caches[name] = LRUCache(self.cache_size)
+        segs = cache.get(word)
+        if segs is None:
+            segs = tuple(segment(word))
+            cache.put(word, segs)
+        return list(segs)
+
+    def segs(self, word):
+        """Return the segments of word, dropping characters that do not begin
+        a segment."""
+        return self._cached('segs', word, self._segs)
+
+    def segs_safe(self, word):
+        """Return the segments of word, keeping characters that do not begin a
+        segment as single-character segments."""
+        return self._cached('segs_safe', word, self._segs_safe)
+
+    def segment_text(self, text):
+        """Return the segments of text as panphon's segment_text does."""
+        return self._cached('segment_text', text, _segment_text)
+
+    def _segs(self, word):
+        if word.isascii():
+            return self._ascii_re.findall(word)
+        return self._walk(word, False)
+
+    def _segs_safe(self, word):
+        if word.isascii():
+            return self._ascii_safe_re.findall(word)
+        return self._walk(word, True)
+
+    def _walk(self, word, safe):
+        root = self.root
+        n = len(word)
+        out = []
+        i = 0
+        while i < n:
+            node = root
+            seg, end = None, i
+            j = i
+            while j < n:
+                entry = node.get(word[j])
+                if entry is None:
+                    break
+                node = entry[0]
+                j += 1
+                if entry[1] is not None:
+                    seg, end = entry[1], j
+            if seg is not None:
+                out.append(seg)
+                i = end
+            else:
+                if safe:
+                    out.append(word[i])
+                i += 1
+        return out
+
+    def stats(self):
+        """Return the statistics of the word caches, keyed by method."""
+        return {name: cache.stats() for (name, cache) in self._caches.items()}
+
+    def clear(self):
+        """Empty the word caches."""
+        for cache in self._caches.values():
+            cache.clear()
+
+
+def _segment_text(text):
+    if text.isascii():
+        # Every ASCII character is a base character, and no ASCII character
+        # is a diacritic or modifier.
+        return list(text)
+    n = len(text)
+    out = []
+    i = 0
+    while i < n:
+        if _text_class(text[i]) != _BASE:
+            i += 1
+            continue
+        j = i + 1
+        while j < n and _text_class(text[j]) == _COMBINING:
+            j += 1
+        while j < n and _text_class(text[j]) == _MODIFIER:
+            j += 1
+        out.append(text[i:j])
+        i = j
+    return out
@@ -0,0 +1,481 @@
+# -*- coding: utf-8 -*-
+"""Long-running local syllabification service.
+
+A SyllabificationServer holds loaded syllabifiers (ParameterizedSyllabifier,
+CompiledSyllabifier or SyllabifierEngine objects, by name) and answers
+requests on a Unix socket or a localhost TCP port, so that clients do not pay
+for interpreter startup and margin loading on every call. Requests from all
+connections are queued per model and coalesced into micro-batches, which are
+syllabified in a worker thread or, with workers > 0, in a process pool.
+
+The protocol is newline-delimited JSON: each request is one JSON object on
+one line, and each response is one line carrying the id of its request.
+Responses on a connection may arrive out of order.
+
+    {"id": 1, "model": "tur", "word": "kitap"}
+    {"id": 1, "result": [["k", "i", ""], ["t", "a", "p"]]}
+
+    {"id": 2, "words": ["ev", "okul"]}
+    {"id": 2, "result": [[["", "e", "v"]], [["", "o", ""], ["k", "u", "l"]]]}
+
+    {"id": 3, "op": "metrics"}
+    {"id": 3, "result": {"requests": 2, "words": 3, ...}}
+
+A syllabification is a list of [onset, nucleus, coda] strings, or null if
+the word cannot be parsed. "model" may be omitted to use the default model.
+The other operations are "models" and "ping". Failed requests are answered
+with {"id": ..., "error": message}.
+
+Each model has a bounded queue, and each connection a bounded number of
+requests in flight; when either is full, the server stops reading from the
+connection until there is room, which pushes back on the client.
+"""
+
+from __future__ import division, print_function, unicode_literals
+
+import asyncio
+import collections
+import concurrent.futures
+import json
+import socket
+import time
+
+from ._benchmark import PERCENTILES, percentile
+
+HOST = '127.0.0.1'
+PORT = 7437
+BATCH_SIZE = 256
+MAX_DELAY = 0.002
+MAX_QUEUE = 1024
+MAX_INFLIGHT = 64
+LINE_LIMIT = 2 ** 24
+LATENCY_WINDOW = 10000
+
+
+class ServerError(Exception):
+    pass
+
+
+def syllabify_words(model, words):
+    """Syllabify a list of words with any of the syllabifiers, returning
+    JSON-ready results (see the module docstring).
+
+    model -- ParameterizedSyllabifier, CompiledSyllabifier or
+    SyllabifierEngine.
+    words -- list of Unicode IPA strings.
+    """
+    if hasattr(model, 'syllabify_batch'):
+        results = model.syllabify_batch(words, ignore_errors=True)
+    else:
+        results = model.syllabify_many(words, ignore_errors=True)
+    return [None if syls is None else
+            [[''.join(o), ''.join(n), ''.join(c)] for (o, n, c) in syls]
+            for syls in results]
+
+
+_worker_models = {}
+
+
+def _init_worker(models):
+    # Runs once per worker process, as in syllabletk._parameterized.
+    _worker_models.update(models)
+
+
+def _syllabify_in_worker(name, words):
+    return syllabify_words(_worker_models[name], words)
+
+
+class ServerMetrics(object):
+    """Request counters and a window of recent request latencies.
+
+    window -- number of most recent latencies kept for the percentiles.
+    """
+
+    def __init__(self, window=LATENCY_WINDOW):
+        self.started = time.time()
+        self.requests = 0
+        self.words = 0
+        self.errors = 0
+        self.batches = 0
+        self.batch_words = 0
+        self.latencies = collections.deque(maxlen=window)
+
+    def add_request(self, n_words, latency):
+        self.requests += 1
+        self.words += n_words
+        self.latencies.append(latency)
+
+    def add_batch(self, n_words):
+        self.batches += 1
+        self.batch_words += n_words
+
+    def as_dict(self):
+        latencies = sorted(self.latencies)
+        metrics = {'uptime_sec': time.time() - self.started,
+                   'requests': self.requests,
+                   'words': self.words,
+                   'errors': self.errors,
+                   'batches': self.batches,
+                   'mean_batch_words': (self.batch_words / self.batches
+                                        if self.batches else 0.0)}
+        for p in PERCENTILES:
+            metrics['latency_p{}_us'.format(p)] = \
+                percentile(latencies, p) * 1e6
+        return metrics
+
+
+def _resolve(pending, result=None, error=None):
+    if pending.future.done():
+        return
+    if error is not None:
+        pending.future.set_exception(error)
+    else:
+        pending.future.set_result(result)
+
+
+class _Pending(object):
+    __slots__ = ('words', 'future')
+
+    def __init__(self, words, future):
+        self.words = words
+        self.future = future
+
+
+class SyllabificationServer(object):
+    """Serve syllabifiers over a local socket (see the module docstring).
+
+    models -- dictionary mapping names to syllabifiers.
+    default -- name of the model used by requests that do not name one; by
+    default, the first name in sorted order.
+    workers -- number of worker processes; if 0, batches are syllabified in
+    a single thread of this process.
+    batch_size -- number of words at which a batch is closed.
+    max_delay -- seconds to wait for more requests before closing a batch
+    that is not full.
+    max_queue -- maximum number of requests queued per model.
+    max_inflight -- maximum number of unanswered requests per connection.
+
+    Members:
+    metrics -- ServerMetrics of the server.
+    """
+
+    def __init__(self, models, default=None, workers=0, batch_size=BATCH_SIZE,
+                 max_delay=MAX_DELAY, max_queue=MAX_QUEUE,
+                 max_inflight=MAX_INFLIGHT):
+        if not models:
+            raise ValueError('At least one model is required.')
+        self.models = dict(models)
+        self.default = default if default is not None else sorted(models)[0]
+        if self.default not in self.models:
+            raise ValueError('Unknown default model {!r}.'.format(default))
+        self.workers = workers
+        self.batch_size = batch_size
+        self.max_delay = max_delay
+        self.max_queue = max_queue
+        self.max_inflight = max_inflight
+        self.metrics = ServerMetrics()
+        self._executor = None
+        self._queues = {}
+        self._tasks = []
+        self._slots = None
+        self._servers = []
+
+    def _ensure_started(self):
+        if self._executor is not None:
+            return
+        if self.workers > 0:
+            self._executor = concurrent.futures.ProcessPoolExecutor(
+                self.workers, initializer=_init_worker,
+                initargs=(self.models,))
+            slots = self.workers
+        else:
+            self._executor = concurrent.futures.ThreadPoolExecutor(1)
+            slots = 1
+        self._slots = asyncio.Semaphore(slots)
+        for name in self.models:
+            self._queues[name] = asyncio.Queue(self.max_queue)
+            self._tasks.append(asyncio.ensure_future(self._batcher(name)))
+
+    async def start(self, path=None, host=HOST, port=PORT):
+        """Start listening and return the asyncio server.
+
+        path -- path of a Unix socket; if None, listen on host:port instead.
+        """
+        self._ensure_started()
+        if path is not None:
+            server = await asyncio.start_unix_server(
+                self._handle_connection, path, limit=LINE_LIMIT)
+        else:
+            server = await asyncio.start_server(
+                self._handle_connection, host, port, limit=LINE_LIMIT)
+        self._servers.append(server)
+        return server
+
+    async def close(self):
+        """Stop listening, cancel queued work and shut down the workers."""
+        for server in self._servers:
+            server.close()
+            await server.wait_closed()
+        for task in self._tasks:
+            task.cancel()
+        for task in self._tasks:
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+        self._servers, self._tasks, self._executor = [], [], None
+
+    async def syllabify(self, words, model=None):
+        """Syllabify a list of words through the batch queue of a model.
+
+        return -- list of JSON-ready syllabifications (see syllabify_words).
+        """
+        self._ensure_started()
+        name = self.default if model is None else model
+        if name not in self._queues:
+            raise ServerError('Unknown model {!r}.'.format(name))
+        if not words:
+            return []
+        future = asyncio.get_event_loop().create_future()
+        await self._queues[name].put(_Pending(list(words), future))
+        return await future
+
+    async def _batcher(self, name):
+        # Collect queued requests into batches of about batch_size words and
+        # run each batch once a worker slot is free. While all slots are busy,
+        # requests accumulate in the queue, so batches grow with the load.
+        # The slot is taken before the batch is closed but after its first
+        # request arrives, so that idle models do not hold slots.
+        queue, loop = self._queues[name], asyncio.get_event_loop()
+        while True:
+            batch = [await queue.get()]
+            await self._slots.acquire()
+            n = len(batch[0].words)
+            deadline = loop.time() + self.max_delay
+            while n < self.batch_size:
+                if queue.empty():
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        pending = await asyncio.wait_for(queue.get(), timeout)
+                    except asyncio.TimeoutError:
+                        break
+                else:
+                    pending = queue.get_nowait()
+                batch.append(pending)
+                n += len(pending.words)
+            asyncio.ensure_future(self._run_batch(name, batch))
+
+    def _execute(self, name, words):
+        loop = asyncio.get_event_loop()
+        if self.workers > 0:
+            return loop.run_in_executor(self._executor, _syllabify_in_worker,
+                                        name, words)
+        return loop.run_in_executor(self._executor, syllabify_words,
+                                    self.models[name], words)
+
+    async def _run_batch(self, name, batch):
+        words = [w for pending in batch for w in pending.words]
+        try:
+            try:
+                results = await self._execute(name, words)
+            except Exception:
+                if len(batch) == 1:
+                    raise
+                # Retry the requests one by one, so that only the request
+                # with the offending word fails.
+                results = None
+            if results is None:
+                for pending in batch:
+                    try:
+                        _resolve(pending, await self._execute(name,
+                                                              pending.words))
+                    except Exception as e:
+                        _resolve(pending, error=e)
+            else:
+                k = 0
+                for pending in batch:
+                    _resolve(pending, results[k:k + len(pending.words)])
+                    k += len(pending.words)
+        except Exception as e:
+            _resolve(batch[0], error=e)
+        finally:
+            self._slots.release()
+        self.metrics.add_batch(len(words))
+
+    async def handle_request(self, request):
+        """Answer one decoded request and return the response dictionary."""
+        start = time.perf_counter()
+        rid = request.get('id') if isinstance(request, dict) else None
+        try:
+            if not isinstance(request, dict):
+                raise ServerError('Request must be a JSON object.')
+            op = request.get('op', 'syllabify')
+            if op == 'syllabify':
+                if 'word' in request:
+                    words = [request['word']]
+                else:
+                    words = request.get('words')
+                if not isinstance(words, list) or \
+                   not all(isinstance(w, str) for w in words):
+                    raise ServerError('Expected "word" or a list of "words".')
+                results = await self.syllabify(words, request.get('model'))
+                result = results[0] if 'word' in request else results
+                self.metrics.add_request(len(words),
+                                         time.perf_counter() - start)
+            elif op == 'metrics':
+                result = self.metrics.as_dict()
+                result['queued'] = {name: q.qsize()
+                                    for (name, q) in self._queues.items()}
+            elif op == 'models':
+                result = {'models': sorted(self.models),
+                          'default': self.default}
+            elif op == 'ping':
+                result = 'pong'
+            else:
+                raise ServerError('Unknown operation {!r}.'.format(op))
+        except Exception as e:
+            self.metrics.errors += 1
+            return {'id': rid, 'error': str(e)}
+        return {'id': rid, 'result': result}
+
+    async def _handle_connection(self, reader, writer):
+        inflight = asyncio.Semaphore(self.max_inflight)
+        lock = asyncio.Lock()
+        tasks = set()
+
+        async def answer(line):
+            try:
+                try:
+                    request = json.loads(line.decode('utf-8'))
+                except ValueError as e:
+                    self.metrics.errors += 1
+                    response = {'id': None, 'error': 'Bad JSON: {}'.format(e)}
+                else:
+                    response = await self.handle_request(request)
+                data = json.dumps(response, ensure_ascii=False) + '\n'
+                async with lock:
+                    writer.write(data.encode('utf-8'))
+                    await writer.drain()
+            except (ConnectionError, asyncio.CancelledError):
+                pass
+            finally:
+                inflight.release()
+
+        try:
+            while True:
+                await inflight.acquire()
+                try:
+                    line = await reader.readline()
+                except (ConnectionError, ValueError):
+                    break
+                if not line:
+                    break
+                if not line.strip():
+                    inflight.release()
+                    continue
+                task = asyncio.ensure_future(answer(line))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.wait(tasks)
+        finally:
+            writer.close()
+
+
+def serve(models, path=None, host=HOST, port=PORT, **kwargs):
+    """Run a SyllabificationServer until interrupted.
+
+    models -- dictionary mapping names to syllabifiers.
+    path -- path of a Unix socket; if None, listen on host:port.
+    kwargs -- other arguments of SyllabificationServer.
+    """
+    async def run():
+        server = SyllabificationServer(models, **kwargs)
+        listener = await server.start(path, host, port)
+        try:
+            await listener.serve_forever()
+        finally:
+            await server.close()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+
+
+class SyllabificationClient(object):
+    """Blocking client for a SyllabificationServer, using plain sockets.
+
+    path -- path of the server's Unix socket; if None, connect to host:port.
+    timeout -- socket timeout in seconds, or None to wait indefinitely.
+    """
+
+    def __init__(self, path=None, host=HOST, port=PORT, timeout=None):
+        if path is not None:
+            self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            address = path
+        else:
+            self._sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            address = (host, port)
+        self._sock.settimeout(timeout)
+        self._sock.connect(address)
+        self._file = self._sock.makefile('rwb')
+        self._next_id = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self._file.close()
+        self._sock.close()
+
+    def request(self, request):
+        """Send one request and return its result.
+
+        request -- dictionary (see the module docstring); its id is set here.
+        Raises ServerError if the server answers with an error.
+        """
+        self._next_id += 1
+        request = dict(request, id=self._next_id)
+        data = json.dumps(request, ensure_ascii=False) + '\n'
+        self._file.write(data.encode('utf-8'))
+        self._file.flush()
+        line = self._file.readline()
+        if not line:
+            raise ServerError('Connection closed by the server.')
+        response = json.loads(line.decode('utf-8'))
+        if response.get('id') != self._next_id:
+            raise ServerError('Unexpected response id {!r}.'.format(
+                response.get('id')))
+        if 'error' in response:
+            raise ServerError(response['error'])
+        return response['result']
+
+    def syllabify(self, word, model=None):
+        """Return the syllables of a word as a list of <onset, nucleus, coda>
+        string tuples, or None if it cannot be parsed."""
+        return _tuples(self.request({'word': word, 'model': model}))
+
+    def syllabify_many(self, words, model=None):
+        """Syllabify a list of words in one request (see syllabify)."""
+        results = self.request({'words': list(words), 'model': model})
+        return [_tuples(syls) for syls in results]
+
+    def metrics(self):
+        """Return the server's metrics as a dictionary."""
+        return self.request({'op': 'metrics'})
+
+    def models(self):
+        """Return the names of the server's models and its default model."""
+        return self.request({'op': 'models'})
+
+
+def _tuples(syls):
+    return None if syls is None else [tuple(syl) for syl in syls]
@@ -2,12 +2,11 @@
 from __future__ import print_function
 from __future__ import unicode_literals
 
-import logging
-import panphon
-import panphon.sonority
-import regex as re
+import re
 
-# logging.basicConfig(level=logging.DEBUG)
+from ._corpus import TEXT, check_segmentation
+from ._segcache import get_segment_cache
+from ._trace import get_trace_sink
 
 
 class FailedParse(Exception):
@@ -19,45 +18,184 @@ def count_true(items):
     return len([bool(x) for x in items if x])
 
 
-class Syllabifier(object):
-    def __init__(self, word, son_peak=True):
-        """Syllabifies words of text.
+def iter_syllables(word, constituents):
+    """Yield (onset, nucleus, coda) string tuples for a parsed word.
 
-        word -- Unicode IPA string
+    word -- list of segments as Unicode IPA strings.
+    constituents -- list of constituent labels, one per segment.
+    """
+    labels = ''.join(constituents)
+    for m in re.finditer(r'(O*)(\(*N\)*)(C*)', labels):
+        o, n, c = len(m.group(1)), len(m.group(2)), len(m.group(3))
+        ons = ''.join(word[:o])
+        nuc = ''.join(word[o:o + n])
+        cod = ''.join(word[o + n:o + n + c])
+        yield (ons, nuc, cod)
+        word = word[o + n + c:]
+
+
+def check_parse(word, constituents):
+    """Raise FailedParse if the constituent labels are not a valid parse."""
+    cons = ''.join(constituents).encode('utf-8')
+    word = ''.join(word).encode('utf-8')
+    if ' ' in constituents:
+        raise FailedParse('Unparsed segments ' +
+                          'For "{}" parsed "{}".'.format(word, cons))
+    if 'N' not in constituents:
+        raise FailedParse('No nucleus ' +
+                          'For "{}", parsed "{}".'.format(word, cons))
+
+
+class SyllabifierEngine(object):
+    """Long-lived syllabifier that loads panphon's tables only once.
+
+    A single engine can be used to syllabify any number of words, which avoids
+    the cost of rebuilding the sonority tables for each word.
+
+    son_peak -- if True, use son_peak_parse; otherwise, use son_parse.
+    cache -- SegmentCache used for sonority lookups; by default, the
+    process-wide cache is used.
+
+    Members:
+    segmentation -- how segment splits words (see syllabletk._corpus).
+    """
+    segmentation = TEXT
+
+    def __init__(self, son_peak=True, cache=None):
+        self.cache = cache if cache is not None else get_segment_cache()
+        self.son_peak = son_peak
+
+    @property
+    def son(self):
+        """The panphon Sonority object of the cache (built on first use)."""
+        return self.cache.son
+
+    def __getstate__(self):
+        # As for ParameterizedSyllabifier, ship the settings and the sonority
+        # table rather than the cache and its panphon objects.
+        return {'son_peak': self.son_peak,
+                'sonority': self.cache.sonority_table()}
+
+    def __setstate__(self, state):
+        cache = get_segment_cache()
+        cache.preload_sonority(state['sonority'])
+        self.__init__(state['son_peak'], cache)
+
+    def segment(self, word):
+        """Return the segments of a word as a list of Unicode IPA strings."""
+        return self.cache.inventory.canonical(
+            self.cache.segmenter.segment_text(word))
+
+    def parse(self, word):
+        """Return the segments and constituent labels for a word.
+
+        word -- Unicode IPA string.
+        return -- 2-tuple of lists <segments, constituents>. Raises
+        FailedParse if the word cannot be parsed.
         """
-        self.son = panphon.sonority.Sonority()
-        if son_peak:
-            self.son_peak_parse(word)
+        return self.parse_segs(self.segment(word))
+
+    def parse_segs(self, segs):
+        """Like parse, but for a word that has already been segmented.
+
+        segs -- sequence of segments as Unicode IPA strings.
+        """
+        check_segmentation(segs, self.segmentation)
+        if self.son_peak:
+            segs, cons = self.son_peak_parse(segs, segmented=True)
         else:
-            self.son_parse(word)
-        self._check_parse()
-        self.ft = panphon.FeatureTable()
+            segs, cons = self.son_parse(segs, segmented=True)
+        check_parse(segs, cons)
+        return segs, cons
 
-    def _check_parse(self):
-        # Check whether the current parse is valid.
-        cons = ''.join(self.constituents).encode('utf-8')
-        word = ''.join(self.word).encode('utf-8')
-        if ' ' in self.constituents:
-            raise FailedParse('Unparsed segments ' +
-                              'For "{}" parsed "{}".'.format(word, cons))
-        if 'N' not in self.constituents:
-            raise FailedParse('No nucleus ' +
-                              'For "{}", parsed "{}".'.format(word, cons))
+    def syllabify(self, word):
+        """Return the syllables of a word as a list of string 3-tuples.
 
-    def son_peak_parse(self, word):
+        word -- Unicode IPA string.
+        return -- list of <onset, nucleus, coda> tuples of Unicode strings.
+        """
+        return list(iter_syllables(*self.parse(word)))
+
+    def syllabify_segs(self, segs):
+        """Like syllabify, but for a word that has already been segmented
+        (for example, one read from a syllabletk._corpus.CorpusReader).
+
+        segs -- sequence of segments as Unicode IPA strings.
+        """
+        return list(iter_syllables(*self.parse_segs(segs)))
+
+    def syllabify_many(self, words, ignore_errors=False):
+        """Yield the syllabification of each word in an iterable.
+
+        words -- an iterable of Unicode IPA strings.
+        ignore_errors -- if True, yield None for words that cannot be parsed
+        instead of raising.
+        """
+        for word in words:
+            try:
+                yield self.syllabify(word)
+            except (FailedParse, IndexError):
+                if not ignore_errors:
+                    raise
+                yield None
+
+    def syllabify_batch(self, words, ignore_errors=False):
+        """Syllabify a list of words, using the batched NumPy kernel of
+        syllabletk._batch for the sonority-peak parse.
+
+        The result is the same as that of syllabify_many. Without son_peak,
+        or while a trace sink is installed, the words are parsed one by one.
+
+        words -- a sequence of Unicode IPA strings.
+        ignore_errors -- if True, return None for words that cannot be parsed
+        instead of raising.
+        return -- list of syllabifications (see syllabify).
+        """
+        if not self.son_peak or get_trace_sink() is not None:
+            return list(self.syllabify_many(words, ignore_errors))
+        results = []
+        for segs, cons in self.son_peak_parse_batch(words):
+            try:
+                if cons is None:
+                    raise IndexError('Cannot parse a word of fewer than '
+                                     'two segments.')
+                check_parse(segs, cons)
+                results.append(list(iter_syllables(segs, cons)))
+            except (FailedParse, IndexError):
+                if not ignore_errors:
+                    raise
+                results.append(None)
+        return results
+
+    def son_peak_parse_batch(self, words, segmented=False):
+        """Apply son_peak_parse to many words at once (see syllabletk._batch).
+
+        words -- a sequence of Unicode IPA strings.
+        segmented -- if True, words are sequences of segments instead.
+        return -- list of 2-tuples <segments, constituents>, one per word. The
+        constituents are None for words of fewer than two segments, for which
+        son_peak_parse raises IndexError.
+        """
+        from ._batch import son_peak_labels
+        segs = [list(w) if segmented else self.segment(w) for w in words]
+        scores = [self.cache.sonority_map(w) for w in segs]
+        long_words = [i for (i, w) in enumerate(scores) if len(w) >= 2]
+        labels = son_peak_labels([scores[i] for i in long_words])
+        cons = [None] * len(segs)
+        for i, word_labels in zip(long_words, labels):
+            cons[i] = word_labels
+        return list(zip(segs, cons))
+
+    def son_peak_parse(self, word, segmented=False):
         """Syllabify a word using sonority peaks to identify nuclei and sonority
         slopes to identify onsets and codas. Correctly handles falling-sonority
         diphthongs but does not address rising-sonority diphthongs.
 
         word -- a word to be syllabified as a Unicode IPA string.
+        segmented -- if True, word is a sequence of segments instead.
+        return -- 2-tuple of lists <segments, constituents>.
         """
 
-        def trace(cons, caller):
-            # Call debugging traces if log level is set to DEBUG.
-            logging.debug('{}\t{}'.format(''.join(cons), caller))
-            logging.debug(''.join(map(str, scores)))
-            logging.debug(''.join(word))
-
         def mark_peaks_as_nuclei(scores, cons):
             # Mark the sonority peaks in a word as nuclei ('N').
             nuclei = []
@@ -76,7 +214,8 @@ class Syllabifier(object):
                        scores[i] >= 5:
                         cons[i] = 'N'
                         nuclei.append(i)
-                trace(cons, 'nuclei')
+                if sink is not None:
+                    sink.event('nuclei', i, cons)
             return cons, nuclei
 
         def mark_glides(scores, cons, nuclei):
@@ -86,7 +225,8 @@ class Syllabifier(object):
                 if i < len(cons) - 1:
                     if cons[i + 1] == ' ' and scores[i + 1] >= 7:
                         cons[i + 1] = ')'
-                trace(cons, 'glide')
+                if sink is not None:
+                    sink.event('glide', i, cons)
             return cons
 
         def mark_left_slopes_as_onsets(scores, cons, nuclei):
@@ -100,23 +240,22 @@ class Syllabifier(object):
                        scores[j] > scores[j - 1]):
                     cons[j - 1] = 'O'
                     j -= 1
-                trace(cons, 'onset')
+                if sink is not None:
+                    sink.event('onset', i, cons)
             return cons
 
         def mark_right_slops_as_codas(scores, cons, nuclei):
             # Mark the right slope following the nuclei as codas.
             for i in nuclei:
                 j = i
-                logging.debug('index j={} before increment.'.format(j))
                 while (j < len(cons) - 1 and cons[j + 1] == ')'):
                     j += 1
-                    logging.debug('index j={} after glide.'.format(j))
                 while (j < len(cons) - 1 and
                        cons[j + 1] == ' ' and scores[j] > scores[j + 1]):
                     cons[j + 1] = 'C'
                     j += 1
-                    logging.debug('index j={} after coda.'.format(j))
-                trace(cons, 'coda')
+                if sink is not None:
+                    sink.event('coda', i, cons)
             return cons
 
         def mark_margins(cons):
@@ -129,27 +268,32 @@ class Syllabifier(object):
             while cons[i] == ' ' and i > 0:
                 cons[i] = 'C'
                 i -= 1
-            trace(cons, 'margins')
+            if sink is not None:
+                sink.event('margins', None, cons)
             return cons
 
-        word = list(panphon._panphon.segment_text(word))
-        scores = map(lambda x: self.son.sonority(x), word)
+        word = list(word) if segmented else self.segment(word)
+        scores = self.cache.sonority_map(word)
+        sink = get_trace_sink()
+        if sink is not None:
+            sink.begin(word, scores)
         cons = len(scores) * [' ']
         cons, nuclei = mark_peaks_as_nuclei(scores, cons)
         cons = mark_glides(scores, cons, nuclei)
         cons = mark_left_slopes_as_onsets(scores, cons, nuclei)
         cons = mark_right_slops_as_codas(scores, cons, nuclei)
         cons = mark_margins(cons)
-        self.word = word
-        self.constituents = cons
+        return word, cons
 
-    def son_parse(self, word):
+    def son_parse(self, word, segmented=False):
         """Parse based on absolute sonority. Likely to be deprecated.
 
         word - word as Unicode IPA string
+        segmented -- if True, word is a sequence of segments instead.
+        return -- 2-tuple of lists <segments, constituents>.
         """
-        word = list(panphon._panphon.segment_text(word))
-        scores = [self.son.sonority(x) for x in word]
+        word = list(word) if segmented else self.segment(word)
+        scores = self.cache.sonority_map(word)
         constituents = len(word) * [' ']
         # Find nuclei.
         for i, score in enumerate(scores):
@@ -182,20 +326,63 @@ class Syllabifier(object):
         for i, con in enumerate(constituents):
             if con == ' ':
                 constituents[i] = 'O'
-        self.word = word
-        self.constituents = constituents
+        return word, constituents
+
+
+_engines = {}
+
+
+def get_engine(son_peak=True):
+    """Return the shared SyllabifierEngine for the given parse mode."""
+    if son_peak not in _engines:
+        _engines[son_peak] = SyllabifierEngine(son_peak=son_peak)
+    return _engines[son_peak]
+
+
+class Syllabifier(object):
+    def __init__(self, word, son_peak=True, engine=None):
+        """Syllabifies words of text.
+
+        This is a thin wrapper around a shared SyllabifierEngine.
+
+        word -- Unicode IPA string
+        son_peak -- if True, use sonority peaks to find nuclei.
+        engine -- SyllabifierEngine to use; by default, the shared engine for
+        the parse mode is used.
+        """
+        self.engine = engine if engine is not None else get_engine(son_peak)
+        if son_peak:
+            self.son_peak_parse(word)
+        else:
+            self.son_parse(word)
+        self._check_parse()
+
+    @property
+    def son(self):
+        return self.engine.son
+
+    def _check_parse(self):
+        # Check whether the current parse is valid.
+        check_parse(self.word, self.constituents)
+
+    def son_peak_parse(self, word):
+        """Syllabify a word using sonority peaks (see
+        SyllabifierEngine.son_peak_parse).
+
+        word -- a word to be syllabified as a Unicode IPA string.
+        """
+        self.word, self.constituents = self.engine.son_peak_parse(word)
+
+    def son_parse(self, word):
+        """Parse based on absolute sonority. Likely to be deprecated.
+
+        word - word as Unicode IPA string
+        """
+        self.word, self.constituents = self.engine.son_parse(word)
 
     def as_tuples_iter(self):
         """Yield the syllables in Syllabifier as an interator over tuples."""
-        labels = ''.join(self.constituents)
-        word = self.word
-        for m in re.finditer(r'(O*)(\(*N\)*)(C*)', labels):
-            o, n, c = len(m.group(1)), len(m.group(2)), len(m.group(3))
-            ons = ''.join(word[:o])
-            nuc = ''.join(word[o:o + n])
-            cod = ''.join(word[o + n:o + n + c])
-            yield (ons, nuc, cod)
-            word = word[o + n + c:]
+        return iter_syllables(self.word, self.constituents)
 
     def as_tuples(self):
         """Return the syllables in Syllabifier as a list of tuples."""
@@ -211,6 +398,23 @@ class Syllabifier(object):
         return list(self.as_strings_iter())
 
 
+def _feature(constituent, test):
+    """Return a SyllableAnalyzerDepr method scoring onsets or codas.
+
+    constituent -- 'onset' or 'coda'.
+    test -- a feature-pattern string (compiled to a regex) or a predicate
+    over the constituent string.
+    """
+    def feature(self, ws):
+        score = self._scorer(test)
+        if constituent == 'onset':
+            return [score(x) for x in self.the_onsets(ws)]
+        return [score(x) for x in self.the_codas(ws)]
+    feature.constituent = constituent
+    feature.test = test
+    return feature
+
+
 class SyllableAnalyzerDepr(object):
     """
     Deprecated. Provide rule-based analysis of the syllabic structure of a
@@ -219,6 +423,7 @@ class SyllableAnalyzerDepr(object):
     words -- an iterable of Unicode IPA strings.
     """
     def __init__(self):
+        import panphon
         self.son = panphon.FeatureTable()
         self.features = [
             # Language allows obstruent-sonorant onsets
@@ -283,145 +488,105 @@ class SyllableAnalyzerDepr(object):
         ]
         self.names, _ = zip(*self.features)
         self.values = {}  # dictionary of lists of floats
+        self.engine = get_engine(True)
+        self._regexes = {}
+
+    def _constituents(self, w):
+        # Return the onsets and codas of a word.
+        ons, _, cod = zip(*self.engine.syllabify(w))
+        return {'onset': ons, 'coda': cod}
 
     def the_onsets(self, ws):
         onsets = []
         for w in ws:
-            ons, _, _ = zip(*Syllabifier(w).as_tuples())
-            onsets += ons
+            onsets += self._constituents(w)['onset']
         return onsets
 
     def the_codas(self, ws):
         codas = []
         for w in ws:
-            _, _, cod = zip(*Syllabifier(w).as_tuples())
-            codas += cod
+            codas += self._constituents(w)['coda']
         return codas
 
+    def _scorer(self, test):
+        # Return a function scoring a constituent 1.0 or 0.0 for a test that
+        # is either a feature-pattern string or a predicate. Regexes are
+        # compiled only once per analyzer.
+        if callable(test):
+            return lambda x: 1.0 if test(x) else 0.0
+        if test not in self._regexes:
+            self._regexes[test] = self.son.compile_regex_from_str(test)
+        regexp = self._regexes[test]
+        return lambda x: 1.0 if regexp.match(x) else 0.0
+
+    def evaluate(self, ws):
+        """Score every registered feature in a single pass over the words.
+
+        Each word is syllabified once and the scores for all of the features
+        in self.features are appended to the lists in self.values.
+
+        ws -- an iterable (possibly a generator) of Unicode IPA strings.
+        return -- self.values.
+        """
+        scorers = [(name, f.constituent, self._scorer(f.test))
+                   for (name, f) in self.features]
+        for name in self.names:
+            self.values.setdefault(name, [])
+        for w in ws:
+            constituents = self._constituents(w)
+            for name, constituent, score in scorers:
+                self.values[name].extend(
+                    [score(x) for x in constituents[constituent]])
+        return self.values
+
     # Types of onsets
-    def the_obstruent_sonorant_onsets(self, ws):
-        regexp = self.son.compile_regex_from_str('[-syl -son]' +
-                                                '[-syl +son]')
-        return map(lambda x: 1.0 if regexp.match(x) else 0.0,
-                   self.the_onsets(ws))
-
-    def the_plosive_sonorant_onsets(self, ws):
-        regexp = self.son.compile_regex_from_str('[-syl -son -cont]' +
-                                                '[-syl +son]')
-        return map(lambda x: 1.0 if regexp.match(x) else 0.0,
-                   self.the_onsets(ws))
-
-    def the_obstruent_approximant_onsets(self, ws):
-        regexp = self.son.compile_regex_from_str('[-syl -son]' +
-                                                '[-syl +son +cont]')
-        return map(lambda x: 1.0 if regexp.match(x) else 0.0,
-                   self.the_onsets(ws))
-
-    def the_plosive_approximant_onsets(self, ws):
-        regexp = self.son.compile_regex_from_str('[-syl -son -cont]' +
-                                                '[-syl +son +cont]')
-        return map(lambda x: 1.0 if regexp.match(x) else 0.0,
-                   self.the_onsets(ws))
-
-    def the_obstruent_obstruent_onsets(self, ws):
-        regexp = self.son.compile_regex_from_str('[-syl -son]' +
-                                                '[-syl -son]')
-        return map(lambda x: 1.0 if regexp.match(x) else 0.0,
-                   self.the_onsets(ws))
-
-    def the_plosive_plosive_onsets(self, ws):
-        regexp = self.son.compile_regex_from_str('[-syl -son -cont]' +
-                                                '[-syl -son -cont]')
-        return map(lambda x: 1.0 if regexp.match(x) else 0.0,
-                   self.the_onsets(ws))
-
-    def the_sonorant_sonorant_onsets(self, ws):
-        regexp = self.son.compile_regex_from_str('[-syl +son]' +
-                                                '[-syl +son]')
-        return map(lambda x: 1.0 if regexp.match(x) else 0.0,
-                   self.the_onsets(ws))
-
-    def the_nasal_nasal_onsets(self, ws):
-        regexp = self.son.compile_regex_from_str('[-syl +son +nas]' +
-                                                '[-syl +son +nas]')
-        return map(lambda x: 1.0 if regexp.match(x) else 0.0,
-                   self.the_onsets(ws))
-
-    def the_complex_onsets(self, ws):
-        return map(lambda x: 1.0 if len(x) > 1 else 0.0,
-                   self.the_onsets(ws))
-
-    def the_complex_onsets_2(self, ws):
-        return map(lambda x: 1.0 if len(x) == 2 else 0.0,
-                   self.the_onsets(ws))
-
-    def the_complex_onsets_3(self, ws):
-        return map(lambda x: 1.0 if len(x) == 3 else 0.0,
-                   self.the_onsets(ws))
-
-    def the_complex_onsets_4_or_more(self, ws):
-        return map(lambda x: 1.0 if len(x) >= 4 else 0.0,
-                   self.the_onsets(ws))
+    the_obstruent_sonorant_onsets = _feature(
+        'onset', '[-syl -son][-syl +son]')
+    the_plosive_sonorant_onsets = _feature(
+        'onset', '[-syl -son -cont][-syl +son]')
+    the_obstruent_approximant_onsets = _feature(
+        'onset', '[-syl -son][-syl +son +cont]')
+    the_plosive_approximant_onsets = _feature(
+        'onset', '[-syl -son -cont][-syl +son +cont]')
+    the_obstruent_obstruent_onsets = _feature(
+        'onset', '[-syl -son][-syl -son]')
+    the_plosive_plosive_onsets = _feature(
+        'onset', '[-syl -son -cont][-syl -son -cont]')
+    the_sonorant_sonorant_onsets = _feature(
+        'onset', '[-syl +son][-syl +son]')
+    the_nasal_nasal_onsets = _feature(
+        'onset', '[-syl +son +nas][-syl +son +nas]')
+    the_complex_onsets = _feature(
+        'onset', lambda x: len(x) > 1)
+    the_complex_onsets_2 = _feature(
+        'onset', lambda x: len(x) == 2)
+    the_complex_onsets_3 = _feature(
+        'onset', lambda x: len(x) == 3)
+    the_complex_onsets_4_or_more = _feature(
+        'onset', lambda x: len(x) >= 4)
 
     # Types of codas
-    def the_sonorant_obstruent_codas(self, ws):
-        regexp = self.son.compile_regex_from_str('[-syl +son]' +
-                                                '[-syl -son]')
-        return map(lambda x: 1.0 if regexp.match(x) else 0.0,
-                   self.the_codas(ws))
-
-    def the_sonorant_plosive_codas(self, ws):
-        regexp = self.son.compile_regex_from_str('[-syl +son]' +
-                                                '[-syl -son -cont]')
-        return map(lambda x: 1.0 if regexp.match(x) else 0.0,
-                   self.the_codas(ws))
-
-    def the_approximant_obstruent_codas(self, ws):
-        regexp = self.son.compile_regex_from_str('[-syl +son +cont]' +
-                                                '[-syl -son]')
-        return map(lambda x: 1.0 if regexp.match(x) else 0.0,
-                   self.the_codas(ws))
-
-    def the_approximant_plosive_codas(self, ws):
-        regexp = self.son.compile_regex_from_str('[-syl +son +cont]' +
-                                                '[-syl -son -cont]')
-        return map(lambda x: 1.0 if regexp.match(x) else 0.0,
-                   self.the_codas(ws))
-
-    def the_approximant_sonorant_sonorant(self, ws):
-        regexp = self.son.compile_regex_from_str('[-syl +son]' +
-                                                '[-syl +son]')
-        return map(lambda x: 1.0 if regexp.match(x) else 0.0,
-                   self.the_codas(ws))
-
-    def the_approximant_approximant_codas(self, ws):
-        regexp = self.son.compile_regex_from_str('[-syl +son +cont]' +
-                                                '[-syl +son +cont]')
-        return map(lambda x: 1.0 if regexp.match(x) else 0.0,
-                   self.the_codas(ws))
-
-    def the_plosive_plosive_codas(self, ws):
-        regexp = self.son.compile_regex_from_str('[-syl -son -cont]' +
-                                                '[-syl -son -cont]')
-        return map(lambda x: 1.0 if regexp.match(x) else 0.0,
-                   self.the_codas(ws))
-
-    def the_simple_codas(self, ws):
-        return map(lambda x: 1.0 if len(x) == 1 else 0.0,
-                   self.the_codas(ws))
-
-    def the_complex_codas(self, ws):
-        return map(lambda x: 1.0 if len(x) > 1 else 0.0,
-                   self.the_codas(ws))
-
-    def the_complex_codas_2(self, ws):
-        return map(lambda x: 1.0 if len(x) == 2 else 0.0,
-                   self.the_codas(ws))
-
-    def the_complex_codas_3(self, ws):
-        return map(lambda x: 1.0 if len(x) == 3 else 0.0,
-                   self.the_codas(ws))
-
-    def the_complex_codas_4_or_more(self, ws):
-        return map(lambda x: 1.0 if len(x) >= 4 else 0.0,
-                   self.the_codas(ws))
+    the_sonorant_obstruent_codas = _feature(
+        'coda', '[-syl +son][-syl -son]')
+    the_sonorant_plosive_codas = _feature(
+        'coda', '[-syl +son][-syl -son -cont]')
+    the_approximant_obstruent_codas = _feature(
+        'coda', '[-syl +son +cont][-syl -son]')
+    the_approximant_plosive_codas = _feature(
+        'coda', '[-syl +son +cont][-syl -son -cont]')
+    the_approximant_sonorant_sonorant = _feature(
+        'coda', '[-syl +son][-syl +son]')
+    the_approximant_approximant_codas = _feature(
+        'coda', '[-syl +son +cont][-syl +son +cont]')
+    the_plosive_plosive_codas = _feature(
+        'coda', '[-syl -son -cont][-syl -son -cont]')
+    the_simple_codas = _feature(
+        'coda', lambda x: len(x) == 1)
+    the_complex_codas = _feature(
+        'coda', lambda x: len(x) > 1)
+    the_complex_codas_2 = _feature(
+        'coda', lambda x: len(x) == 2)
+    the_complex_codas_3 = _feature(
+        'coda', lambda x: len(x) == 3)
+    the_complex_codas_4_or_more = _feature(
+        'coda', lambda x: len(x) >= 4)
@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+"""Trace sinks for syllabification events.
+
+The parsers report each marking step to the current trace sink as an event
+<stage, index, marks>, where marks is the constituent vector after the step.
+No sink is installed by default, in which case the parsers do no tracing work
+at all. To capture the derivation of one word:
+
+    with tracing() as rec:
+        SyllabifierEngine().parse(word)
+    print(rec.derivation())
+"""
+
+from __future__ import print_function, unicode_literals
+
+import contextlib
+import logging
+
+_sink = None
+
+
+class TraceSink(object):
+    """Base class for trace sinks; all methods do nothing."""
+
+    def begin(self, segs, scores):
+        """Called once per word, before any event.
+
+        segs -- list of segments of the word.
+        scores -- list of their sonority scores.
+        """
+
+    def event(self, stage, index, marks):
+        """Called after a marking step.
+
+        stage -- name of the step (for example, 'nuclei' or 'coda').
+        index -- index of the segment the step was applied at, or None.
+        marks -- list of constituent marks; it is mutated by later steps, so
+        sinks that keep it must copy it.
+        """
+
+
+class RecordingSink(TraceSink):
+    """Sink that keeps every event in memory.
+
+    Members:
+    words -- list of <segs, scores, events> tuples, one per word, where
+    events is a list of <stage, index, marks> tuples with marks as a string.
+    """
+
+    def __init__(self):
+        self.words = []
+
+    def begin(self, segs, scores):
+        self.words.append((list(segs), list(scores), []))
+
+    def event(self, stage, index, marks):
+        self.words[-1][2].append((stage, index, ''.join(marks)))
+
+    @property
+    def events(self):
+        """The events of the last word traced."""
+        return self.words[-1][2] if self.words else []
+
+    def derivation(self):
+        """Return the derivation of the last word traced as text, one step
+        per line."""
+        if not self.words:
+            return ''
+        segs, scores, events = self.words[-1]
+        lines = [' '.join(segs), ''.join(map(str, scores))]
+        for stage, index, marks in events:
+            lines.append('{}\t{}\t{}'.format(
+                marks, stage, '' if index is None else index))
+        return '\n'.join(lines)
+
+    def clear(self):
+        """Forget all recorded words."""
+        del self.words[:]
+
+
+class LoggingSink(TraceSink):
+    """Sink that writes events to a logger, as the parsers used to do.
+
+    logger -- logging.Logger; by default, the 'syllabletk' logger.
+    level -- logging level of the messages.
+    """
+
+    def __init__(self, logger=None, level=logging.DEBUG):
+        self.logger = logger or logging.getLogger('syllabletk')
+        self.level = level
+
+    def begin(self, segs, scores):
+        self.logger.log(self.level, ''.join(segs))
+        self.logger.log(self.level, ''.join(map(str, scores)))
+
+    def event(self, stage, index, marks):
+        self.logger.log(self.level, '%s\t%s\t%s', ''.join(marks), stage, index)
+
+
+def get_trace_sink():
+    """Return the current trace sink, or None."""
+    return _sink
+
+
+def set_trace_sink(sink):
+    """Install a trace sink (or None to disable tracing) and return the
+    previous one."""
+    global _sink
+    previous, _sink = _sink, sink
+    return previous
+
+
+@contextlib.contextmanager
+def tracing(sink=None):
+    """Install a trace sink within a with block.
+
+    sink -- TraceSink; by default, a new RecordingSink.
+    return -- context manager yielding the sink. The previous sink is
+    restored on exit.
+    """
+    sink = sink if sink is not None else RecordingSink()
+    previous = set_trace_sink(sink)
+    try:
+        yield sink
+    finally:
+        set_trace_sink(previous)
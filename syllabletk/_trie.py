@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+"""Tries over segment sequences for attested onsets and codas.
+"""
+
+from __future__ import print_function, unicode_literals
+
+
+class SegmentTrie(object):
+    """Trie whose edges are labeled with segments.
+
+    A forward trie matches members that begin at a given index of a word; a
+    reverse trie stores its members back to front and matches members that end
+    at a given index. Either way, all matches are found in a single walk over
+    the word, without building any tuples.
+
+    seqs -- iterable of segment sequences to add.
+    reverse -- if True, build a reverse trie.
+
+    Members:
+    children -- list of dictionaries, one per node, mapping segments to nodes.
+    terminal -- list of booleans, one per node, that are True where a member
+    ends. Node 0 is the root.
+    """
+
+    def __init__(self, seqs=(), reverse=False):
+        self.reverse = reverse
+        self.children = [{}]
+        self.terminal = [False]
+        self.size = 0
+        for seq in seqs:
+            self.add(seq)
+
+    def __len__(self):
+        return self.size
+
+    def __contains__(self, seq):
+        node = self._find(seq)
+        return node is not None and self.terminal[node]
+
+    def _find(self, seq):
+        node = 0
+        for seg in (reversed(seq) if self.reverse else seq):
+            node = self.children[node].get(seg)
+            if node is None:
+                return None
+        return node
+
+    def add(self, seq):
+        """Add a sequence of segments to the trie."""
+        node = 0
+        for seg in (reversed(tuple(seq)) if self.reverse else seq):
+            child = self.children[node].get(seg)
+            if child is None:
+                child = len(self.children)
+                self.children[node][seg] = child
+                self.children.append({})
+                self.terminal.append(False)
+            node = child
+        if not self.terminal[node]:
+            self.terminal[node] = True
+            self.size += 1
+
+    def match_lengths(self, segs, start=0, end=None):
+        """Return the lengths of all members matching segs[start:end], in
+        ascending order.
+
+        A forward trie matches members that are prefixes of segs[start:end]; a
+        reverse trie matches members that are suffixes of it. The empty
+        sequence matches (with length 0) if it is a member.
+
+        segs -- a sequence of segments.
+        start, end -- bounds of the part of segs to match against.
+        """
+        if end is None:
+            end = len(segs)
+        children, terminal = self.children, self.terminal
+        lengths = [0] if terminal[0] else []
+        node = 0
+        if self.reverse:
+            for k in range(end - 1, start - 1, -1):
+                node = children[node].get(segs[k])
+                if node is None:
+                    break
+                if terminal[node]:
+                    lengths.append(end - k)
+        else:
+            for k in range(start, end):
+                node = children[node].get(segs[k])
+                if node is None:
+                    break
+                if terminal[node]:
+                    lengths.append(k + 1 - start)
+        return lengths
+
+    def longest_match(self, segs, start=0, end=None):
+        """Return the length of the longest member matching segs[start:end]
+        (see match_lengths), or 0 if there is none."""
+        lengths = self.match_lengths(segs, start, end)
+        return lengths[-1] if lengths else 0
@@ -0,0 +1,25 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+from __future__ import print_function
+
+import argparse
+import sys
+
+from syllabletk._corpus import SEGMENTATIONS, SEGS, compile_corpus
+
+
+def main(words, corpus, segmentation=SEGS):
+    n = compile_corpus(words, corpus, segmentation=segmentation)
+    print('{} words written to {}'.format(n, corpus), file=sys.stderr)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Segments a word list once and writes a binary corpus.')
+    parser.add_argument('words', help='UTF-8 word list, one word per line')
+    parser.add_argument('corpus', help='path of the binary corpus to write')
+    parser.add_argument('--segmentation', choices=SEGMENTATIONS, default=SEGS,
+                        help='segmentation of the parser that will read the corpus: '
+                        'segs (margin parsers, ParameterizedSyllabifier, CompiledSyllabifier), '
+                        'text (SyllabifierEngine) or chars (FixedSonoritySlicer)')
+    args = parser.parse_args()
+    main(args.words, args.corpus, args.segmentation)
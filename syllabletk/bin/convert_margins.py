@@ -0,0 +1,19 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+from __future__ import print_function
+
+import argparse
+
+from syllabletk._model import convert_yaml_margins
+
+
+def main(yaml_path, model_path):
+    convert_yaml_margins(yaml_path, model_path)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Converts a PyYAML margins file to a margin model.')
+    parser.add_argument('yaml', help='PyYAML file containing syllable margins')
+    parser.add_argument('model', help='path of the margin model to write')
+    args = parser.parse_args()
+    main(args.yaml, args.model)
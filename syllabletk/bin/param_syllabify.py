@@ -5,9 +5,10 @@ from __future__ import division
 from __future__ import print_function
 
 from syllabletk import ParameterizedSyllabifier, PhonoRepr
+from syllabletk._counts import aggregate_counts, read_counts
+from syllabletk._fst import CompiledSyllabifier
 import argparse
 import sys
-import yaml
 
 
 def prettify_syllables(word):
@@ -28,24 +29,38 @@ def flatten_syllables(word):
     return s
 
 
-def main(margins):
-    with open(margins) as f:
-        margin_dict = yaml.load(f.read())
-    initials = margin_dict['initials'].keys()
-    finals = margin_dict['finals'].keys()
-    ps = ParameterizedSyllabifier((initials, finals))
-    for line in sys.stdin:
-        word = line.strip().decode('utf-8')
-        print('word={}'.format(word).encode('utf-8'))
+def main(margins, compiled=False, save_compiled=None, counts=False):
+    if compiled:
+        ps = CompiledSyllabifier.load(margins)
+    else:
+        ps = ParameterizedSyllabifier.from_margin_file(margins)
+    if save_compiled:
+        if not compiled:
+            ps = ps.compile()
+        ps.save(save_compiled)
+    if counts:
+        # Each distinct word is syllabified once and printed with its count.
+        words = aggregate_counts(read_counts(sys.stdin)).items()
+    else:
+        words = ((line.strip(), None) for line in sys.stdin)
+    for word, count in words:
+        if count is None:
+            print('word={}'.format(word))
+        else:
+            print('word={}\tcount={}'.format(word, count))
         syllabified = ps.syllabify(word)
         if syllabified:
             pretty = prettify_syllables(syllabified)
             flat = flatten_syllables(syllabified)
-            print('"{}" -> {}'.format(word, pretty).encode('utf-8'), file=sys.stdout)
+            print('"{}" -> {}'.format(word, pretty), file=sys.stdout)
             assert word.replace('ʼ', '') == flat
 
 if __name__ == '__main__':
     parser = argparse.ArgumentParser(description='Uses syllable margins as parameters to parse a list of words.')
-    parser.add_argument('margins', help='PyYAML file containing syllable margins from list')
+    parser.add_argument('margins', help='margin model (or legacy PyYAML file) containing syllable margins from list')
+    parser.add_argument('--compiled', action='store_true', help='margins is a compiled syllabifier written with --save-compiled')
+    parser.add_argument('--save-compiled', metavar='PATH', help='write the compiled syllabifier to PATH')
+    parser.add_argument('--counts', action='store_true',
+                        help='input is a frequency list: a word and its count on each line')
     args = parser.parse_args()
-    main(args.margins)
+    main(args.margins, args.compiled, args.save_compiled, args.counts)
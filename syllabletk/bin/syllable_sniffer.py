@@ -1,28 +1,56 @@
 #!/usr/bin/env python
 from __future__ import print_function
 
+import argparse
 import sys
-import yaml
 from collections import Counter
 
 import syllabletk
 
 
 def write_frequencies(outfile, initials, finals):
+    import yaml
     data = {'initials': dict(initials), 'finals': dict(finals)}
-    print(yaml.dump(data).encode('utf-8'), file=sys.stdout)
-
-
-def main(infile, outfile):
-    sps = syllabletk.SonorityPeakSlicer()
-    initials, finals = Counter(), Counter()
-    for line in infile:
-        # print(line.strip(), file=sys.stderr)
-        initial, final = sps.parse(line.strip().decode('utf-8'))
-        initials[initial] += 1
-        finals[final] += 1
-    write_frequencies(outfile, initials, finals)
+    print(yaml.dump(data), file=sys.stdout)
+
+
+def write_model(outfile, initials, finals):
+    syllabletk._model.write_margin_model(outfile, initials, finals)
+    print(file=outfile)
+
+
+def main(infile, outfile, fmt='yaml', path=None, jobs=1, counts=False):
+    if path is not None:
+        initials, finals = syllabletk._margins.sniff_file(path, workers=jobs,
+                                                          counts=counts)
+    elif counts:
+        sniffer = syllabletk._margins.MarginSniffer(syllabletk.SonorityPeakSlicer)
+        sniffer.parse_tokens_weighted(syllabletk._counts.read_counts(infile))
+        initials, finals = sniffer.get_counters()
+    else:
+        sps = syllabletk.SonorityPeakSlicer()
+        initials, finals = Counter(), Counter()
+        for line in infile:
+            # print(line.strip(), file=sys.stderr)
+            initial, final = sps.parse(line.strip())
+            initials[initial] += 1
+            finals[final] += 1
+    if fmt == 'model':
+        write_model(outfile, initials, finals)
+    else:
+        write_frequencies(outfile, initials, finals)
 
 
 if __name__ == '__main__':
-    main(sys.stdin, sys.stdout)
+    parser = argparse.ArgumentParser(description='Sniffs word margins from a list of words (one per line).')
+    parser.add_argument('infile', nargs='?', help='word list to read instead of STDIN')
+    parser.add_argument('--format', choices=['yaml', 'model'], default='yaml',
+                        help='output format: legacy PyYAML or margin model')
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help='number of worker processes (requires infile)')
+    parser.add_argument('--counts', action='store_true',
+                        help='input is a frequency list: a word and its count on each line')
+    args = parser.parse_args()
+    if args.jobs > 1 and args.infile is None:
+        parser.error('--jobs requires an input file')
+    main(sys.stdin, sys.stdout, args.format, args.infile, args.jobs, args.counts)
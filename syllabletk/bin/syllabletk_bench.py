@@ -0,0 +1,39 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+from __future__ import print_function
+
+import argparse
+import sys
+
+from syllabletk._benchmark import (BENCHMARKS, CORPORA, MARGINS, compare,
+                                   format_report, load_report, run_suite,
+                                   save_report)
+
+
+def main(corpus, limit, only, margins, output, baseline, threshold):
+    report = run_suite(corpus, limit, only, margins)
+    print(format_report(report))
+    if output:
+        save_report(output, report)
+    if baseline:
+        regressions = compare(report, load_report(baseline), threshold)
+        for name, metric, old, new in regressions:
+            print('REGRESSION {} {}: {:.1f} -> {:.1f}'.format(name, metric, old, new))
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmarks syllabletk on the bundled Turkish corpora.')
+    parser.add_argument('--corpus', choices=sorted(CORPORA), default='tur-200')
+    parser.add_argument('--limit', type=int, help='use only the first LIMIT words')
+    parser.add_argument('--only', action='append', choices=[name for (name, _) in BENCHMARKS],
+                        help='run only this benchmark (may be repeated)')
+    parser.add_argument('--margins', default=MARGINS, help='margins file for the parameterized benchmarks')
+    parser.add_argument('-o', '--output', help='write the JSON report to this file')
+    parser.add_argument('--compare', metavar='BASELINE', help='JSON report to compare against')
+    parser.add_argument('--threshold', type=float, default=0.1,
+                        help='relative change counted as a regression (default 0.1)')
+    args = parser.parse_args()
+    sys.exit(main(args.corpus, args.limit, args.only, args.margins,
+                  args.output, args.compare, args.threshold))
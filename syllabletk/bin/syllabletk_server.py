@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+from __future__ import print_function
+
+import argparse
+import os
+import sys
+
+from syllabletk import ParameterizedSyllabifier, SyllabifierEngine
+from syllabletk._fst import CompiledSyllabifier
+from syllabletk._server import (BATCH_SIZE, HOST, MAX_DELAY, MAX_INFLIGHT,
+                                MAX_QUEUE, PORT, serve)
+
+
+def parse_spec(spec):
+    # NAME=PATH, or PATH, in which case the name is the file's base name.
+    name, sep, path = spec.partition('=')
+    if not sep:
+        path = spec
+        name = os.path.splitext(os.path.basename(spec))[0]
+    return name, path
+
+
+def load_models(margins, compiled, engines):
+    models = []
+    for name, path in map(parse_spec, margins):
+        models.append((name, ParameterizedSyllabifier.from_margin_file(path)))
+    for name, path in map(parse_spec, compiled):
+        models.append((name, CompiledSyllabifier.load(path)))
+    for mode in engines:
+        models.append((mode, SyllabifierEngine(son_peak=mode == 'peak')))
+    return models
+
+
+def main(args):
+    models = load_models(args.margins, args.compiled, args.engine)
+    if not models:
+        print('No models given; use --margins, --compiled or --engine.', file=sys.stderr)
+        return 2
+    where = args.socket or '{}:{}'.format(args.host, args.port)
+    print('Serving {} on {}'.format(', '.join(name for (name, _) in models), where),
+          file=sys.stderr)
+    serve(dict(models), args.socket, args.host, args.port,
+          default=models[0][0], workers=args.workers,
+          batch_size=args.batch_size, max_delay=args.max_delay_ms / 1000,
+          max_queue=args.max_queue, max_inflight=args.max_inflight)
+    return 0
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Serves syllabifiers over a local socket (newline-delimited JSON).')
+    parser.add_argument('--margins', action='append', default=[], metavar='[NAME=]PATH',
+                        help='margin model to serve as a ParameterizedSyllabifier (may be repeated)')
+    parser.add_argument('--compiled', action='append', default=[], metavar='[NAME=]PATH',
+                        help='compiled syllabifier to serve (may be repeated)')
+    parser.add_argument('--engine', action='append', default=[], choices=['peak', 'son'],
+                        help='serve a sonority-peak or sonority-slope SyllabifierEngine')
+    parser.add_argument('--socket', help='listen on this Unix socket instead of TCP')
+    parser.add_argument('--host', default=HOST)
+    parser.add_argument('--port', type=int, default=PORT)
+    parser.add_argument('--workers', type=int, default=0,
+                        help='worker processes (default 0: one thread in the server process)')
+    parser.add_argument('--batch-size', type=int, default=BATCH_SIZE)
+    parser.add_argument('--max-delay-ms', type=float, default=MAX_DELAY * 1000,
+                        help='time to wait for more requests before running a partial batch')
+    parser.add_argument('--max-queue', type=int, default=MAX_QUEUE,
+                        help='requests queued per model before connections are paused')
+    parser.add_argument('--max-inflight', type=int, default=MAX_INFLIGHT,
+                        help='unanswered requests per connection before it is paused')
+    sys.exit(main(parser.parse_args()))
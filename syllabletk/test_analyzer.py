@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import os
+import shutil
+import tempfile
+import unittest
+from syllabletk import _analyzer, _segcache
+
+try:
+    import scipy.sparse
+except ImportError:
+    scipy = None
+
+
+SYLLABLES = [(('p', 'r'), ('a',), ('l',)),
+             (('s', 't'), ('a',), ('k', 's')),
+             ((), ('a', 'j'), ('n', 't')),
+             (('s', 't', 'r'), ('e',), ()),
+             (('m', 'j'), ('u',), ('r', 'm'))]
+
+
+class TestSyllableAnalyzer(unittest.TestCase):
+    def setUp(self):
+        self.sa = _analyzer.SyllableAnalyzer(batch_size=2)
+
+    def test_batch_matches_scalar(self):
+        scalar = _analyzer.SyllableAnalyzer()
+        for syl in SYLLABLES:
+            scalar.analyze_syllable(syl)
+        self.sa.analyze_syllables(SYLLABLES)
+        self.assertEqual(self.sa.feature_counter, scalar.feature_counter)
+        self.assertEqual(self.sa.syllable_counter, scalar.syllable_counter)
+
+    def test_empty_constituents(self):
+        syls = [((), (), ()), ((), ('a',), ())]
+        sa = _analyzer.SyllableAnalyzer(_segcache.SegmentCache())
+        sa.analyze_batch(syls)
+        scalar = _analyzer.SyllableAnalyzer()
+        for syl in syls:
+            scalar.analyze_syllable(syl)
+        self.assertEqual(sa.feature_counter, scalar.feature_counter)
+        self.assertEqual(sa.syllable_counter, 2)
+
+    def test_onset_features(self):
+        self.sa.analyze_syllables(SYLLABLES[:1])
+        self.assertEqual(self.sa.feature_counter['SYL_ONSET_COMPLEX_2'], 1)
+        self.assertEqual(self.sa.feature_counter['SYL_ONSET_OBSTRUENT_LIQUID'], 1)
+        self.assertEqual(self.sa.feature_counter['SYL_CODA_LIQUID'], 1)
+
+    def test_weighted_matches_tokens(self):
+        tokens = SYLLABLES * 3 + SYLLABLES[:2]
+        self.sa.analyze_syllables(tokens)
+        weighted = _analyzer.SyllableAnalyzer(batch_size=2)
+        weighted.analyze_syllables_weighted(
+            [(list(map(list, syl)), 3) for syl in SYLLABLES] +
+            [(syl, 1) for syl in SYLLABLES[:2]])
+        self.assertEqual(weighted.feature_counter, self.sa.feature_counter)
+        self.assertEqual(weighted.syllable_counter, len(tokens))
+
+    def test_feature_matrix_rows(self):
+        words = [SYLLABLES[:2], None, SYLLABLES[2:], [], SYLLABLES[:1]]
+        m = self.sa.feature_matrix(words, chunk_size=2)
+        self.assertEqual(m.shape, (5, len(self.sa.feature_names)))
+        for i, word in enumerate(words):
+            single = _analyzer.SyllableAnalyzer()
+            single.analyze_syllables(word or [])
+            self.assertEqual(m.row(i), {name: n for (name, n)
+                                        in single.feature_counter.items() if n})
+        self.assertEqual(self.sa.syllable_counter, 0)
+
+    def test_feature_matrix_chunks(self):
+        words = [SYLLABLES[i:i + 2] for i in range(len(SYLLABLES))]
+        whole = self.sa.feature_matrix(words, chunk_size=100)
+        chunks = list(self.sa.iter_feature_matrices(words, chunk_size=2))
+        self.assertEqual([c.shape[0] for c in chunks], [2, 2, 1])
+        stacked = _analyzer.FeatureMatrix.vstack(chunks, self.sa.feature_names)
+        self.assertEqual(stacked.toarray().tolist(), whole.toarray().tolist())
+        self.sa.analyze_syllables([syl for word in words for syl in word])
+        self.assertEqual(list(whole.toarray().sum(axis=0)),
+                         [self.sa.feature_counter[name] for name in whole.columns])
+
+    @unittest.skipIf(scipy is None, 'SciPy is not installed')
+    def test_tocsr(self):
+        m = self.sa.feature_matrix([SYLLABLES, SYLLABLES[:1]])
+        self.assertEqual(m.tocsr().toarray().tolist(), m.toarray().tolist())
+
+    def test_merge(self):
+        first = _analyzer.SyllableAnalyzer()
+        first.analyze_syllables(SYLLABLES[:2])
+        second = _analyzer.SyllableAnalyzer()
+        second.analyze_syllables(SYLLABLES[2:])
+        total = first + second
+        self.sa.analyze_syllables(SYLLABLES)
+        self.assertEqual(total.feature_counter, self.sa.feature_counter)
+        self.assertEqual(total.syllable_counter, len(SYLLABLES))
+        self.assertEqual(first.syllable_counter, 2)
+        first.merge(second)
+        self.assertEqual(first.feature_counter, self.sa.feature_counter)
+
+    def test_save_load(self):
+        self.sa.analyze_syllables(SYLLABLES)
+        tmp = tempfile.mkdtemp()
+        try:
+            path = os.path.join(tmp, 'analysis.json')
+            self.sa.save(path)
+            loaded = _analyzer.SyllableAnalyzer.load(path)
+        finally:
+            shutil.rmtree(tmp)
+        self.assertEqual(loaded.feature_counter, self.sa.feature_counter)
+        self.assertEqual(loaded.syllable_counter, self.sa.syllable_counter)
+
+    def test_from_dict_rejects_other_formats(self):
+        data = self.sa.to_dict()
+        data['version'] = 99
+        with self.assertRaises(ValueError):
+            _analyzer.SyllableAnalyzer.from_dict(data)
+        with self.assertRaises(ValueError):
+            _analyzer.SyllableAnalyzer.from_dict({'features': {}})
+
+    def test_parallel_matches_sequential(self):
+        syls = SYLLABLES * 7
+        self.sa.analyze_syllables(syls)
+        parallel = _analyzer.SyllableAnalyzer()
+        parallel.analyze_syllables_parallel(iter(syls), workers=2, chunk_size=4)
+        self.assertEqual(parallel.feature_counter, self.sa.feature_counter)
+        self.assertEqual(parallel.syllable_counter, len(syls))
+
+    def test_evaluate_shape(self):
+        matches = self.sa.compiled.evaluate(SYLLABLES)
+        self.assertEqual(matches.shape, (len(SYLLABLES), len(_analyzer.FEATURE_SPECS)))
+
+
+if __name__ == '__main__':
+    unittest.main()
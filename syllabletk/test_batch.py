@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import io
+import itertools
+import unittest
+
+from syllabletk import _batch, _syllabletk
+
+
+class _Scores(object):
+    # Stands in for a SegmentCache, returning fixed sonority scores.
+    def __init__(self, scores):
+        self.scores = scores
+
+    def sonority_map(self, segs):
+        return list(self.scores)
+
+
+class TestSonPeakKernel(unittest.TestCase):
+    def scalar(self, scores):
+        engine = _syllabletk.SyllabifierEngine.__new__(
+            _syllabletk.SyllabifierEngine)
+        engine.cache = _Scores(scores)
+        return engine.son_peak_parse(['x'] * len(scores), segmented=True)[1]
+
+    def test_exhaustive_short(self):
+        score_lists = [list(p) for n in range(2, 6)
+                       for p in itertools.product([1, 3, 5, 6, 7, 8, 9], repeat=n)]
+        labels = _batch.son_peak_labels(score_lists, chunk_size=1000)
+        for scores, got in zip(score_lists, labels):
+            self.assertEqual(got, self.scalar(scores), scores)
+
+    def test_corpus(self):
+        engine = _syllabletk.SyllabifierEngine()
+        with io.open('data/tur-200.txt', encoding='utf-8') as f:
+            words = [line.strip() for line in f]
+        batch = engine.son_peak_parse_batch(words)
+        for word, (segs, cons) in zip(words, batch):
+            self.assertEqual((segs, cons), engine.son_peak_parse(word))
+        self.assertEqual(engine.syllabify_batch(words, ignore_errors=True),
+                         list(engine.syllabify_many(words, ignore_errors=True)))
+
+    def test_short_words(self):
+        engine = _syllabletk.SyllabifierEngine()
+        self.assertEqual(engine.son_peak_parse_batch(['a', 'anne'])[0],
+                         (['a'], None))
+        self.assertEqual(engine.syllabify_batch(['a'], ignore_errors=True), [None])
+        self.assertRaises(IndexError, engine.syllabify_batch, ['a'])
+
+
+if __name__ == '__main__':
+    unittest.main()
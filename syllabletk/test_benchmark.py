@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import unittest
+
+from syllabletk import _benchmark
+
+
+def _lengths(words, margins):
+    return words, len
+
+
+class TestBenchmark(unittest.TestCase):
+    def test_percentile(self):
+        values = list(range(1, 101))
+        self.assertEqual(_benchmark.percentile(values, 50), 50)
+        self.assertEqual(_benchmark.percentile(values, 99), 99)
+        self.assertEqual(_benchmark.percentile([], 50), 0.0)
+
+    def test_run_benchmark(self):
+        words = _benchmark.read_corpus('tur-200', 20)
+        result = _benchmark.run_benchmark(_lengths, words)
+        self.assertEqual(result['items'], 20)
+        self.assertGreater(result['words_per_sec'], 0)
+        self.assertLessEqual(result['latency_p50_us'], result['latency_p99_us'])
+
+    def test_compare(self):
+        old = {'results': {'x': {'words_per_sec': 100.0,
+                                 'latency_p50_us': 10.0,
+                                 'peak_memory_bytes': 1000}}}
+        new = {'results': {'x': {'words_per_sec': 80.0,
+                                 'latency_p50_us': 10.5,
+                                 'peak_memory_bytes': 1000}}}
+        regressions = _benchmark.compare(new, old, threshold=0.1)
+        self.assertEqual(regressions, [('x', 'words_per_sec', 100.0, 80.0)])
+        self.assertEqual(_benchmark.compare(old, old), [])
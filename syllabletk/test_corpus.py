@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from syllabletk import _corpus, _margins, _syllabletk
+
+
+class TestCorpus(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.words = 'data/tur-200.txt'
+        self.path = os.path.join(self.tmp, 'tur-200.stkc')
+        self.n = _corpus.compile_corpus(self.words, self.path)
+        self.reader = _corpus.CorpusReader(self.path)
+        self.parser = _margins.SonorityPeakSlicer()
+
+    def tearDown(self):
+        self.reader.close()
+        shutil.rmtree(self.tmp)
+
+    def test_roundtrip(self):
+        with io.open(self.words, encoding='utf-8') as f:
+            expected = [self.parser.segment(line.strip()) for line in f]
+        self.assertEqual(self.n, len(expected))
+        self.assertEqual(len(self.reader), len(expected))
+        self.assertEqual(list(self.reader), expected)
+        self.assertEqual(self.reader.word_segments(3), expected[3])
+
+    def test_ids(self):
+        ids = self.reader.ids(0)
+        self.assertEqual([self.reader.segments[i] for i in ids],
+                         self.reader.word_segments(0))
+
+    def test_sniff_segmented(self):
+        ms = _margins.MarginSniffer(_margins.SonorityPeakSlicer)
+        ms.parse_segmented(self.reader)
+        self.assertEqual(ms.get_counters(), _margins.sniff_file(self.words))
+
+    def test_segmentation(self):
+        self.assertEqual(self.reader.segmentation, _corpus.SEGS)
+        engine = _syllabletk.SyllabifierEngine()
+        with self.assertRaises(_corpus.CorpusFormatError):
+            engine.syllabify_segs(self.reader[0])
+        with self.assertRaises(_corpus.CorpusFormatError):
+            _margins.FixedSonoritySlicer().parse_segs(self.reader[0])
+
+    def test_engine_text_corpus(self):
+        path = os.path.join(self.tmp, 'tur-200-text.stkc')
+        _corpus.compile_corpus(self.words, path, segmentation=_corpus.TEXT)
+        engine = _syllabletk.SyllabifierEngine()
+        with io.open(self.words, encoding='utf-8') as f, \
+                _corpus.CorpusReader(path) as reader:
+            self.assertEqual(reader.segmentation, _corpus.TEXT)
+            for i, line in enumerate(f):
+                word = line.strip()
+                try:
+                    expected = engine.syllabify(word)
+                except (_syllabletk.FailedParse, IndexError) as e:
+                    self.assertRaises(type(e), engine.syllabify_segs, reader[i])
+                    continue
+                self.assertEqual(engine.syllabify_segs(reader[i]), expected)
+
+    def test_bad_magic(self):
+        path = os.path.join(self.tmp, 'bad')
+        with io.open(path, 'wb') as f:
+            f.write(b'\0' * 64)
+        self.assertRaises(_corpus.CorpusFormatError, _corpus.CorpusReader, path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import io
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from collections import Counter
+from syllabletk import _counts, _margins, _model
+
+BIN = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'bin')
+
+
+class TestCounts(unittest.TestCase):
+    def test_read_counts(self):
+        lines = ['kitap\t3\n', '\n', 'ev 2\n']
+        self.assertEqual(list(_counts.read_counts(lines)), [('kitap', 3), ('ev', 2)])
+
+    def test_bad_line(self):
+        with self.assertRaises(_counts.CountsFormatError):
+            list(_counts.read_counts(['kitap\n']))
+
+    def test_aggregate_counts(self):
+        totals = _counts.aggregate_counts([('ev', 2), ('okul', 0), ('ev', 1)])
+        self.assertEqual(totals, Counter({'ev': 3}))
+        self.assertEqual(_counts.aggregate_counts({'ev': 1}, key=str.upper), Counter({'EV': 1}))
+
+
+class TestWeightedSniffing(unittest.TestCase):
+    def setUp(self):
+        self.tokens = ['kitap', 'ev', 'kitap', 'okul', 'ev', 'kitap']
+        self.tokens_sniffer = _margins.MarginSniffer(_margins.SonorityPeakSlicer)
+        self.tokens_sniffer.parse_tokens(self.tokens)
+
+    def test_parse_tokens_weighted(self):
+        sniffer = _margins.MarginSniffer(_margins.SonorityPeakSlicer)
+        sniffer.parse_tokens_weighted(Counter(self.tokens))
+        self.assertEqual(sniffer.get_counters(), self.tokens_sniffer.get_counters())
+
+    def test_sniff_file_counts(self):
+        tmp = tempfile.mkdtemp()
+        try:
+            path = os.path.join(tmp, 'counts.txt')
+            with io.open(path, 'w', encoding='utf-8') as f:
+                for word, count in Counter(self.tokens).items():
+                    f.write('{}\t{}\n'.format(word, count))
+            self.assertEqual(_margins.sniff_file(path, counts=True),
+                             self.tokens_sniffer.get_counters())
+        finally:
+            shutil.rmtree(tmp)
+
+
+
+class TestCountsScripts(unittest.TestCase):
+    def run_script(self, script, *args):
+        proc = subprocess.Popen([sys.executable, os.path.join(BIN, script)] + list(args),
+                                stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+        out, _ = proc.communicate('elma\t3\nokul 2\nelma 1\n'.encode('utf-8'))
+        self.assertEqual(proc.returncode, 0)
+        return out.decode('utf-8')
+
+    def test_param_syllabify(self):
+        out = self.run_script('param_syllabify.py', '--counts', '../tur.yml')
+        self.assertEqual(out.splitlines(), ['word=elma\tcount=4',
+                                            '"elma" -> (-e-l)(m-a-)',
+                                            'word=okul\tcount=2',
+                                            '"okul" -> (-o-)(k-u-l)'])
+
+    def test_syllable_sniffer(self):
+        out = self.run_script('syllable_sniffer.py', '--counts', '--format', 'model')
+        sniffer = _margins.MarginSniffer(_margins.SonorityPeakSlicer)
+        sniffer.parse_tokens_weighted([('elma', 4), ('okul', 2)])
+        initials, finals = sniffer.get_counters()
+        self.assertEqual(_model.parse_margin_model(json.loads(out)),
+                         (dict(initials), dict(finals)))
+
+
+if __name__ == '__main__':
+    unittest.main()
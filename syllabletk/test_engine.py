@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import unittest
+from syllabletk import _syllabletk
+
+
+class TestSyllabifierEngine(unittest.TestCase):
+    def setUp(self):
+        self.engine = _syllabletk.SyllabifierEngine(son_peak=True)
+
+    def test_syllabify_matches_syllabifier(self):
+        self.assertEqual(self.engine.syllabify('ptɛrodaktyl'),
+                         _syllabletk.Syllabifier('ptɛrodaktyl').as_tuples())
+
+    def test_syllabify_many(self):
+        self.assertEqual(list(self.engine.syllabify_many(['hwelp', 'atrɐms'])),
+                         [[('hw', 'e', 'lp')],
+                          [('', 'a', ''), ('tr', 'ɐ', 'ms')]])
+
+    def test_syllabify_many_ignore_errors(self):
+        self.assertEqual(list(self.engine.syllabify_many(['pst', 'hwelp'],
+                                                         ignore_errors=True)),
+                         [None, [('hw', 'e', 'lp')]])
+
+    def test_son_parse_engine(self):
+        engine = _syllabletk.SyllabifierEngine(son_peak=False)
+        self.assertEqual(engine.syllabify('hwelp'),
+                         _syllabletk.Syllabifier('hwelp', son_peak=False).as_tuples())
+
+    def test_shared_engine(self):
+        self.assertIs(_syllabletk.get_engine(True), _syllabletk.get_engine(True))
+
+
+class TestSyllableAnalyzerDepr(unittest.TestCase):
+    def test_evaluate_single_pass(self):
+        sa = _syllabletk.SyllableAnalyzerDepr()
+        ws = ['trup', 'pɹum', 'ap', 'hwelp', 'pewl']
+        values = sa.evaluate(w for w in ws)
+        for name, f in sa.features:
+            self.assertEqual(values[name], f(ws))
+
+
+if __name__ == '__main__':
+    unittest.main()
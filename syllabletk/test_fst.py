@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import io
+import os
+import pickle
+import shutil
+import tempfile
+import unittest
+from syllabletk import _fst, _parameterized, _trie
+
+
+def _syllabify_or_error(f, word):
+    try:
+        return f(word)
+    except IndexError:
+        return 'IndexError'
+
+
+class TestAutomaton(unittest.TestCase):
+    def test_matches_trie(self):
+        seqs = [(), (0,), (0, 1), (0, 1, 2), (3,)]
+        syms = [0, 1, 2, 0, 3]
+        for reverse in (False, True):
+            automaton = _fst.Automaton.from_sequences(seqs, 4, reverse)
+            trie = _trie.SegmentTrie(seqs, reverse)
+            for start in range(len(syms)):
+                for end in range(start, len(syms) + 1):
+                    self.assertEqual(automaton.match_lengths(syms, start, end),
+                                     trie.match_lengths(syms, start, end))
+
+
+class TestCompiledSyllabifier(unittest.TestCase):
+    def setUp(self):
+        self.ps = _parameterized.ParameterizedSyllabifier.from_margin_file('../tur.yml')
+        self.fst = self.ps.compile()
+        with io.open('data/tur-200.txt', encoding='utf-8') as f:
+            self.words = [line.strip() for line in f]
+        self.tmp = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_same_as_parameterized(self):
+        for word in self.words + ['a', 'anne', 'kitap', 'stɾajk']:
+            self.assertEqual(_syllabify_or_error(self.fst.syllabify, word),
+                             _syllabify_or_error(self.ps.syllabify, word), word)
+
+    def test_save_load(self):
+        path = os.path.join(self.tmp, 'tur.fst.json')
+        self.fst.save(path)
+        fst = _fst.CompiledSyllabifier.load(path)
+        self.assertEqual(fst.to_dict(), self.fst.to_dict())
+        self.assertEqual(fst.syllabify_many(self.words, ignore_errors=True),
+                         self.fst.syllabify_many(self.words, ignore_errors=True))
+
+    def test_pickle(self):
+        fst = pickle.loads(pickle.dumps(self.fst))
+        self.assertEqual(fst.to_dict(), self.fst.to_dict())
+
+    def test_bad_format(self):
+        self.assertRaises(_fst.FSTFormatError,
+                          _fst.CompiledSyllabifier.from_dict, {'format': 'other'})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import unittest
+
+from syllabletk import _inventory
+
+
+class TestSegmentInventory(unittest.TestCase):
+    def setUp(self):
+        self.inv = _inventory.SegmentInventory(['a', 't͡ʃ'])
+
+    def test_intern(self):
+        self.assertEqual(self.inv.intern('a'), 0)
+        self.assertEqual(self.inv.intern('t͡ʃ'), 1)
+        self.assertEqual(self.inv.intern('ɾ'), 2)
+        self.assertEqual(len(self.inv), 3)
+        self.assertIn('ɾ', self.inv)
+
+    def test_encode_decode(self):
+        ids = self.inv.encode(['t͡ʃ', 'a', 'k'])
+        self.assertEqual(list(ids), [1, 0, 2])
+        self.assertEqual(self.inv.decode(ids), ('t͡ʃ', 'a', 'k'))
+
+    def test_keys(self):
+        key = self.inv.encode_key(('t͡ʃ', 'a'))
+        self.assertIsInstance(key, bytes)
+        self.assertEqual(key, self.inv.encode_key(['t͡ʃ', 'a']))
+        self.assertEqual(self.inv.decode_key(key), ('t͡ʃ', 'a'))
+        self.assertEqual(self.inv.decode_key(self.inv.encode_key(())), ())
+
+    def test_canonical(self):
+        seg = ''.join(['t', '͡', 'ʃ'])
+        self.assertIs(self.inv.canonical([seg])[0], self.inv.segments[1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,7 +2,7 @@
 from __future__ import print_function, unicode_literals
 
 import unittest
-import _margins
+from syllabletk import _margins
 from collections import Counter
 
 
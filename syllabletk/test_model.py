@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from syllabletk import _model
+
+
+class TestMarginModel(unittest.TestCase):
+    def setUp(self):
+        self.initials = {(): 3, ('s', 't'): 2, ('d͡ʒ',): 1}
+        self.finals = {(): 4, ('n', 't'): 1}
+        self.tmp = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_roundtrip(self):
+        f = io.StringIO()
+        _model.write_margin_model(f, self.initials, self.finals)
+        f.seek(0)
+        self.assertEqual(_model.read_margin_model(f), (self.initials, self.finals))
+
+    def test_schema(self):
+        data = _model.dump_margin_model(self.initials, self.finals)
+        self.assertEqual(data['segments'], ['d͡ʒ', 'n', 's', 't'])
+        self.assertEqual(data['initials'], [[[], 3], [[0], 1], [[2, 3], 2]])
+
+    def test_bad_format(self):
+        self.assertRaises(_model.ModelFormatError,
+                          _model.parse_margin_model, {'format': 'other'})
+
+    def test_convert_yaml(self):
+        path = os.path.join(self.tmp, 'tur.json')
+        _model.convert_yaml_margins('../tur.yml', path)
+        self.assertEqual(_model.load_margins(path),
+                         _model.load_yaml_margins('../tur.yml'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,8 +4,9 @@ from __future__ import unicode_literals
 
 import unittest
 import panphon.sonority
-import _parameterized
+from syllabletk import _parameterized
 import logging
+import pickle
 import yaml
 
 class TestPhonoRepr(unittest.TestCase):
@@ -18,6 +19,19 @@ class TestPhonoRepr(unittest.TestCase):
         phonr.marks = ['O', 'O', 'N', 'C', 'O', 'O', 'N', 'C']
         self.assertEqual(phonr.syllabified(), [(['p', 'r'], ['a'], ['l']), (['s', 't'], ['a'], ['k'])])
 
+    def test_set_mark(self):
+        phonr = _parameterized.PhonoRepr(self.son, 'pralstak')
+        phonr.set_mark(6, 'N')
+        phonr.set_mark(2, 'N')
+        phonr.set_mark(6, 'N')
+        self.assertEqual(phonr.nuclei, [2, 6])
+        self.assertEqual(phonr.marks, [' ', ' ', 'N', ' ', ' ', ' ', 'N', ' '])
+        self.assertEqual(phonr.get_segment(2), ('a', phonr.scores[2], 'N'))
+
+    def test_slots(self):
+        phonr = _parameterized.PhonoRepr(self.son, 'pralstak')
+        self.assertFalse(hasattr(phonr, '__dict__'))
+
 
 class TestPS1(unittest.TestCase):
     def setUp(self):
@@ -70,9 +84,140 @@ class TestPS1(unittest.TestCase):
         phonr = self.ps._mark_intervocalic_clusts(phonr)
         self.assertEqual(phonr.marks, ['N', 'O', 'N'])
 
+    def test_assign_mark(self):
+        phonr = _parameterized.PhonoRepr(self.son, 'ile')
+        phonr.marks[1] = 'O'
+        phonr.marks[0] = 'N'
+        self.assertEqual(phonr.marks, ['N', 'O', ' '])
+        self.assertEqual(phonr.get_mark(1), 'O')
+        self.assertEqual(phonr.nuclei, [])
+        with self.assertRaises(ValueError):
+            phonr.marks[0:2] = ['N']
+
+    def test_phonorepr_ids(self):
+        phonr = _parameterized.PhonoRepr(None, 'elma', self.ps.cache)
+        self.assertEqual(phonr.segs, ['e', 'l', 'm', 'a'])
+        self.assertEqual(phonr.ids.typecode, 'H')
+        self.assertEqual(list(self.ps.cache.inventory.decode(phonr.ids)), phonr.segs)
+        self.assertEqual(phonr.get_segment(1)[0], 'l')
+
     def test_initials1(self):
         self.assertIn(('j',), self.ps.ons_set)
 
 
+class TestResultCache(unittest.TestCase):
+    def setUp(self):
+        with open('../tur.yml', 'r') as f:
+            ons_cod = yaml.load(f.read())
+            self.ons = ons_cod['initials'].keys()
+            self.cod = ons_cod['finals'].keys()
+        self.ps = _parameterized.ParameterizedSyllabifier((self.ons, self.cod),
+                                                          result_cache_size=2)
+
+    def test_immutable_results(self):
+        self.assertEqual(self.ps.syllabify('anne'),
+                         (((), ('a',), ('n',)), (('n',), ('e',), ())))
+
+    def test_hits(self):
+        self.ps.syllabify('pod')
+        self.ps.syllabify('pod')
+        stats = self.ps.result_cache_stats()
+        self.assertEqual((stats['hits'], stats['misses']), (1, 1))
+
+    def test_eviction(self):
+        for word in ['pod', 'sod', 'nod', 'pod']:
+            self.ps.syllabify(word)
+        stats = self.ps.result_cache_stats()
+        self.assertEqual(stats['size'], 2)
+        self.assertEqual(stats['evictions'], 2)
+
+    def test_invalidation(self):
+        self.ps.syllabify('pod')
+        self.ps.cod_set = self.cod
+        self.assertEqual(self.ps.result_cache_stats()['size'], 0)
+
+    def test_disabled(self):
+        ps = _parameterized.ParameterizedSyllabifier((self.ons, self.cod))
+        self.assertIsNone(ps.result_cache_stats())
+        self.assertEqual(ps.syllabify('anne'), [([], ['a'], ['n']), (['n'], ['e'], [])])
+
+
+class TestClusterTable(unittest.TestCase):
+    def setUp(self):
+        with open('../tur.yml', 'r') as f:
+            ons_cod = yaml.load(f.read())
+            self.ons = ons_cod['initials'].keys()
+            self.cod = ons_cod['finals'].keys()
+        self.ps = _parameterized.ParameterizedSyllabifier((self.ons, self.cod))
+
+    def test_shared_entry(self):
+        self.ps.syllabify('anne')
+        self.ps.syllabify('anne')
+        key = self.ps.cache.inventory.encode_key(['n', 'n'])
+        self.assertEqual(self.ps.cluster_table[(key, 0)], ['attested', 1, 2])
+
+    def test_stats(self):
+        self.ps.syllabify('anne')
+        self.assertEqual(self.ps.cluster_table_stats(),
+                         {'attested': {'types': 1, 'tokens': 1}})
+
+    def test_export_and_warm(self):
+        self.ps.syllabify('anne')
+        records = self.ps.export_cluster_table()
+        ps = _parameterized.ParameterizedSyllabifier((self.ons, self.cod))
+        ps.load_cluster_table(records)
+        self.assertEqual(ps.cluster_table, self.ps.cluster_table)
+        self.assertEqual(ps.syllabify('anne'), self.ps.syllabify('anne'))
+
+
+class TestSyllabifyMany(unittest.TestCase):
+    def setUp(self):
+        with open('../tur.yml', 'r') as f:
+            ons_cod = yaml.load(f.read())
+            ons = ons_cod['initials'].keys()
+            cod = ons_cod['finals'].keys()
+        self.ps = _parameterized.ParameterizedSyllabifier((ons, cod))
+        self.words = ['anne', 'ile', 'kitap', 'tʃok'] * 600
+
+    def test_serial(self):
+        self.assertEqual(self.ps.syllabify_many(self.words[:4]),
+                         [self.ps.syllabify(w) for w in self.words[:4]])
+
+    def test_parallel_preserves_order(self):
+        self.assertEqual(self.ps.syllabify_many(self.words, workers=2, chunksize=50),
+                         [self.ps.syllabify(w) for w in self.words])
+
+    def test_pickle_roundtrip(self):
+        ps = pickle.loads(pickle.dumps(self.ps))
+        self.assertEqual(ps.ons_set, self.ps.ons_set)
+        self.assertEqual(ps.syllabify('anne'), self.ps.syllabify('anne'))
+
+
+class TestInstrumentation(unittest.TestCase):
+    def setUp(self):
+        with open('../tur.yml', 'r') as f:
+            ons_cod = yaml.load(f.read())
+            ons = ons_cod['initials'].keys()
+            cod = ons_cod['finals'].keys()
+        self.ps = _parameterized.ParameterizedSyllabifier((ons, cod))
+
+    def test_disabled_by_default(self):
+        self.assertIsNone(self.ps.stats)
+
+    def test_instrument(self):
+        expected = self.ps.syllabify('anne')
+        with self.ps.instrument() as stats:
+            self.assertEqual(self.ps.syllabify('anne'), expected)
+            self.ps.syllabify('ile')
+        self.assertIsNone(self.ps.stats)
+        self.assertEqual(stats.words, 2)
+        self.assertEqual(set(stats.calls.values()), {2})
+        self.assertEqual(stats.splits['attested'], 2)
+        data = stats.as_dict()
+        self.assertEqual([s['stage'] for s in data['stages']],
+                         list(_parameterized.SyllabifyStats.stages))
+        self.assertAlmostEqual(data['seconds'], stats.total())
+
+
 if __name__ == '__main__':
     unittest.main()
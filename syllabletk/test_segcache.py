@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from panphon import pat
+from syllabletk import _segcache
+
+
+class TestSegmentCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = _segcache.SegmentCache()
+
+    def test_sonority(self):
+        self.assertEqual(self.cache.sonority('a'), 9)
+        self.assertEqual(self.cache.sonority('t'), 1)
+
+    def test_hits_and_misses(self):
+        self.cache.sonority_map(['t', 'a', 't'])
+        stats = self.cache.stats()
+        self.assertEqual(stats['misses'], 2)
+        self.assertEqual(stats['hits'], 1)
+
+    def test_features(self):
+        self.assertIn(('-', 'son'), self.cache.features('t'))
+        self.assertEqual(self.cache.features('%'), frozenset())
+
+    def test_match_pattern_seq(self):
+        self.assertTrue(self.cache.match_pattern_seq(pat('[-son][+son]'), ['t', 'r']))
+        self.assertFalse(self.cache.match_pattern_seq(pat('[-son][+son]'), ['r', 't']))
+        self.assertFalse(self.cache.match_pattern_seq(pat('[][]'), ['t']))
+
+    def test_maxsize(self):
+        cache = _segcache.SegmentCache(maxsize=2)
+        cache.sonority_map(['p', 't', 'k'])
+        self.assertEqual(cache.stats()['sonority_size'], 2)
+        self.assertEqual(cache.sonority('k'), 1)
+
+    def test_shared_cache(self):
+        self.assertIs(_segcache.get_segment_cache(), _segcache.get_segment_cache())
+
+
+class TestSonoritySnapshot(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def test_snapshot_avoids_panphon(self):
+        cache = _segcache.SegmentCache()
+        self.assertEqual(cache.sonority_map(['t', 'a', 'j']), [1, 9, 7])
+        self.assertEqual(cache.segmenter.segs('taj'), ['t', 'a', 'j'])
+        self.assertIsNone(cache._son)
+
+    def test_snapshot_agrees_with_panphon(self):
+        son = _segcache.SegmentCache(snapshot=None).son
+        table = _segcache.read_sonority_snapshot(_segcache.SONORITY_SNAPSHOT)
+        for seg in ['a', 'e', 'j', 'l', 'n', 's', 't', 'ʃ', 'ɯ']:
+            self.assertEqual(table[seg], son.sonority(seg))
+
+    def test_given_son_overrides_snapshot(self):
+        class FlatSonority(object):
+            seg_dict = {'a': None, 'aa': None}
+
+            def sonority(self, seg):
+                return 3
+
+        cache = _segcache.SegmentCache(son=FlatSonority())
+        self.assertIsNone(cache.snapshot)
+        self.assertEqual(cache.sonority('a'), 3)
+        self.assertEqual(cache.segmenter.segs('aaat'), ['aa', 'a'])
+
+    def test_write_and_read(self):
+        cache = _segcache.SegmentCache(snapshot=None)
+        path = os.path.join(self.dir, 'sonority.json')
+        n = _segcache.write_sonority_snapshot(path, ['t', 'a', 't'], cache.son)
+        self.assertEqual(n, 2)
+        self.assertEqual(_segcache.read_sonority_snapshot(path),
+                         {'t': 1, 'a': 9})
+        self.assertEqual(_segcache.read_snapshot_segments(path),
+                         sorted(cache.son.seg_dict))
+        cache = _segcache.SegmentCache(snapshot=path)
+        self.assertEqual(cache.sonority('a'), 9)
+        self.assertIsNone(cache._son)
+
+    def test_missing_segment_falls_back(self):
+        path = os.path.join(self.dir, 'sonority.json')
+        _segcache.write_sonority_snapshot(
+            path, ['t'], _segcache.get_segment_cache().son)
+        cache = _segcache.SegmentCache(snapshot=path)
+        self.assertEqual(cache.sonority('a'), 9)
+        self.assertIsNotNone(cache._son)
+
+    def test_lazy_import(self):
+        code = ('import sys; before = set(sys.modules); import syllabletk; '
+                'syllabletk.ParameterizedSyllabifier; '
+                'print(sorted(m for m in set(sys.modules) - before '
+                'if m.split(".")[0] in ("panphon", "numpy", "yaml")))')
+        out = subprocess.check_output([sys.executable, '-c', code])
+        self.assertEqual(out.strip(), b'[]')
+
+
+if __name__ == '__main__':
+    unittest.main()
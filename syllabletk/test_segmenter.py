@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import unittest
+from panphon._panphon import segment_text
+from syllabletk import _segcache, _segmenter
+
+
+class TestSegmenter(unittest.TestCase):
+    def setUp(self):
+        self.seg = _segmenter.Segmenter(['t', 'ts', 'tʃ', 't͡ʃ', 'a', 'aː', 's', 'ʃ', 'r'])
+
+    def test_longest_match(self):
+        self.assertEqual(self.seg.segs('tsaːt͡ʃa'), ['ts', 'aː', 't͡ʃ', 'a'])
+        self.assertEqual(self.seg.segs('tʃar'), ['tʃ', 'a', 'r'])
+
+    def test_unknown_characters(self):
+        self.assertEqual(self.seg.segs('ta-ʔa'), ['t', 'a', 'a'])
+        self.assertEqual(self.seg.segs_safe('ta-ʔa'), ['t', 'a', '-', 'ʔ', 'a'])
+
+    def test_ascii_fast_path(self):
+        self.assertEqual(self.seg.segs('tsat1'), ['ts', 'a', 't'])
+        self.assertEqual(self.seg.segs_safe('tsat1'), ['ts', 'a', 't', '1'])
+        self.assertEqual(self.seg.segs('tsat1'), self.seg._walk('tsat1', False))
+
+    def test_segment_text(self):
+        for word in ['t͡ʃaːʰ', 'kitap', 'ʃ̃ʼx', '“ev”', 'aɪ̯̃ʲ']:
+            self.assertEqual(self.seg.segment_text(word), list(segment_text(word)))
+
+    def test_cache(self):
+        self.seg.segs('tʃar')
+        segs = self.seg.segs('tʃar')
+        segs.append('x')
+        self.assertEqual(self.seg.segs('tʃar'), ['tʃ', 'a', 'r'])
+        self.assertEqual(self.seg.stats()['segs']['hits'], 2)
+
+    def test_matches_panphon(self):
+        cache = _segcache.SegmentCache()
+        son = cache.son
+        for word in ['kitapɫaɾ', 't͡ʃodʒuk', 'ɟøzʲ', 'ʃeh-iɾ', 'pʰaːnː']:
+            self.assertEqual(cache.segmenter.segs(word), son.segs(word))
+            self.assertEqual(cache.segmenter.segs_safe(word), son.segs_safe(word))
+
+
+if __name__ == '__main__':
+    unittest.main()
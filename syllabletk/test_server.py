@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import asyncio
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from syllabletk import _parameterized, _server, _syllabletk
+
+
+class TestSyllabificationServer(unittest.TestCase):
+    def setUp(self):
+        self.ps = _parameterized.ParameterizedSyllabifier.from_margin_file('../tur.yml')
+        self.engine = _syllabletk.SyllabifierEngine()
+        self.server = _server.SyllabificationServer(
+            {'tur': self.ps, 'peak': self.engine}, default='tur',
+            batch_size=8, max_delay=0.01)
+
+    def run_async(self, coro_func):
+        async def run():
+            try:
+                return await coro_func()
+            finally:
+                await self.server.close()
+        return asyncio.run(run())
+
+    def expected(self, word):
+        return [[''.join(o), ''.join(n), ''.join(c)]
+                for (o, n, c) in self.ps.syllabify(word)]
+
+    def test_coalesces_requests(self):
+        words = ['kitap', 'ev', 'okul', 'kalem', 'araba', 'masa'] * 4
+        results = self.run_async(lambda: asyncio.gather(
+            *[self.server.syllabify([w]) for w in words]))
+        self.assertEqual(results, [[self.expected(w)] for w in words])
+        self.assertLess(self.server.metrics.batches, len(words))
+
+    def test_models(self):
+        result = self.run_async(lambda: self.server.syllabify(['kitap'], 'peak'))
+        self.assertEqual(result, [[['k', 'i', ''], ['t', 'a', 'p']]])
+
+    def test_handle_request(self):
+        async def requests():
+            return [await self.server.handle_request(r) for r in
+                    [{'id': 1, 'word': 'ev'},
+                     {'id': 2, 'words': ['ev', 'okul']},
+                     {'id': 3, 'model': 'nope', 'word': 'ev'},
+                     {'id': 4, 'op': 'metrics'}]]
+        r1, r2, r3, r4 = self.run_async(requests)
+        self.assertEqual(r1, {'id': 1, 'result': self.expected('ev')})
+        self.assertEqual(r2['result'][1], self.expected('okul'))
+        self.assertIn('error', r3)
+        self.assertEqual(r4['result']['requests'], 2)
+        self.assertEqual(r4['result']['errors'], 1)
+
+
+class TestSyllabificationClient(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, 'syllabletk.sock')
+        ps = _parameterized.ParameterizedSyllabifier.from_margin_file('../tur.yml')
+        self.server = _server.SyllabificationServer({'tur': ps})
+        self.loop = asyncio.new_event_loop()
+        started = threading.Event()
+
+        def run():
+            asyncio.set_event_loop(self.loop)
+            self.loop.run_until_complete(self.server.start(self.path))
+            started.set()
+            self.loop.run_forever()
+
+        self.thread = threading.Thread(target=run)
+        self.thread.start()
+        started.wait()
+
+    def tearDown(self):
+        asyncio.run_coroutine_threadsafe(self.server.close(), self.loop).result()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+        self.loop.close()
+        shutil.rmtree(self.dir)
+
+    def test_client(self):
+        with _server.SyllabificationClient(self.path, timeout=10) as client:
+            self.assertEqual(client.syllabify('elma'),
+                             [('', 'e', 'l'), ('m', 'a', '')])
+            self.assertEqual(client.syllabify_many(['ev', 'okul']),
+                             [[('', 'e', 'v')], [('', 'o', ''), ('k', 'u', 'l')]])
+            self.assertEqual(client.models(), {'models': ['tur'], 'default': 'tur'})
+            self.assertEqual(client.metrics()['words'], 3)
+            with self.assertRaises(_server.ServerError):
+                client.request({'op': 'nope'})
+
+
+if __name__ == '__main__':
+    unittest.main()
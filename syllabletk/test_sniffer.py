@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from syllabletk import _margins
+
+
+class TestMarginSnifferState(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def sniffer(self, tokens):
+        ms = _margins.MarginSniffer(_margins.SonorityPeakSlicer)
+        ms.parse_tokens(tokens)
+        return ms
+
+    def test_merge(self):
+        merged = self.sniffer(['prak', 'aks']) + self.sniffer(['strak'])
+        self.assertEqual(merged.get_counters(),
+                         self.sniffer(['prak', 'aks', 'strak']).get_counters())
+
+    def test_margin_counts(self):
+        ms = self.sniffer(['prak', 'strak', 'aks'])
+        self.assertEqual(ms.initial[('s', 't', 'r')], 1)
+        size = len(ms.inventory)
+        self.assertEqual(ms.initial[('ʒ', 'ʒ', 'ʒ')], 0)
+        self.assertNotIn(('ʒ', 'ʒ', 'ʒ'), ms.initial)
+        self.assertNotIn(('ʒ̃ʰ',), ms.initial)
+        self.assertEqual(len(ms.inventory), size)
+        self.assertEqual(dict(ms.final), dict(ms.final_counts()))
+        with self.assertRaises(TypeError):
+            ms.initial[('p', 'r')] += 1
+        counts = ms.initial_counts()
+        counts[('p', 'r')] += 1
+        self.assertEqual(ms.initial[('p', 'r')], 1)
+
+    def test_checkpoint_roundtrip(self):
+        ms = self.sniffer(['prak', 'strak', 'stri'])
+        ms.offset = 17
+        restored = _margins.MarginSniffer.from_checkpoint(
+            ms.to_checkpoint(), _margins.SonorityPeakSlicer)
+        self.assertEqual(restored.get_counters(), ms.get_counters())
+        self.assertEqual(restored.offset, 17)
+
+    def test_checkpoint_wrong_parser(self):
+        data = self.sniffer(['prak']).to_checkpoint()
+        self.assertRaises(ValueError, _margins.MarginSniffer.from_checkpoint,
+                          data, _margins.FixedSonoritySlicer)
+
+    def test_resume(self):
+        path = os.path.join(self.tmp, 'words.txt')
+        checkpoint = os.path.join(self.tmp, 'margins.json')
+        with io.open(path, 'w', encoding='utf-8') as f:
+            f.write('prak\nstrak\n')
+        ms = _margins.MarginSniffer(_margins.SonorityPeakSlicer)
+        ms.parse_file(path, checkpoint)
+        with io.open(path, 'a', encoding='utf-8') as f:
+            f.write('aks\n')
+        ms = _margins.MarginSniffer.load_checkpoint(checkpoint, _margins.SonorityPeakSlicer)
+        ms.parse_file(path)
+        self.assertEqual(ms.get_counters(),
+                         self.sniffer(['prak', 'strak', 'aks']).get_counters())
+
+
+class TestSniffFile(unittest.TestCase):
+
+    def setUp(self):
+        self.path = 'data/tur-200.txt'
+
+    def test_shards_cover_file(self):
+        shards = _margins.shard_file(self.path, 4)
+        self.assertEqual(shards[0][0], 0)
+        self.assertEqual(shards[-1][1], os.path.getsize(self.path))
+        for (_, end), (start, _) in zip(shards, shards[1:]):
+            self.assertEqual(end, start)
+        with io.open(self.path, 'rb') as f:
+            data = f.read()
+        for start, _ in shards[1:]:
+            self.assertEqual(data[start - 1:start], b'\n')
+
+    def test_parallel_matches_serial(self):
+        serial = _margins.sniff_file(self.path)
+        self.assertEqual(_margins.sniff_file(self.path, workers=3), serial)
+        ms = _margins.MarginSniffer(_margins.SonorityPeakSlicer)
+        with io.open(self.path, encoding='utf-8') as f:
+            ms.parse_tokens(line.strip() for line in f)
+        self.assertEqual(ms.get_counters(), serial)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 
 import unittest
-import _syllabletk
+from syllabletk import _syllabletk
 
 
 class TestSyllabifier(unittest.TestCase):
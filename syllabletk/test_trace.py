@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import logging
+import unittest
+
+from syllabletk import _syllabletk, _trace
+
+
+class TestTrace(unittest.TestCase):
+    def setUp(self):
+        self.engine = _syllabletk.SyllabifierEngine()
+
+    def test_no_sink_by_default(self):
+        self.assertIsNone(_trace.get_trace_sink())
+
+    def test_recording(self):
+        with _trace.tracing() as rec:
+            segs, cons = self.engine.parse('anne')
+        self.assertIsNone(_trace.get_trace_sink())
+        self.assertEqual(len(rec.words), 1)
+        self.assertEqual(rec.words[0][0], segs)
+        stages = [stage for (stage, _, _) in rec.events]
+        self.assertEqual(stages[0], 'nuclei')
+        self.assertEqual(stages[-1], 'margins')
+        self.assertEqual(rec.events[-1][2], ''.join(cons))
+        self.assertIn('margins', rec.derivation())
+
+    def test_stage_indices(self):
+        with _trace.tracing() as rec:
+            self.engine.parse('hwelpatrɐms')
+        indices = {}
+        for stage, index, _ in rec.events:
+            indices.setdefault(stage, []).append(index)
+        self.assertEqual(indices['coda'], indices['onset'])
+        self.assertEqual(indices['coda'], indices['glide'])
+
+    def test_restores_previous(self):
+        outer = _trace.RecordingSink()
+        with _trace.tracing(outer):
+            with _trace.tracing() as inner:
+                self.engine.parse('anne')
+            self.assertIs(_trace.get_trace_sink(), outer)
+        self.assertEqual(len(inner.words), 1)
+        self.assertEqual(outer.words, [])
+
+    def test_logging_sink(self):
+        logger = logging.getLogger('syllabletk.test')
+        records = []
+        handler = logging.Handler()
+        handler.emit = records.append
+        logger.addHandler(handler)
+        logger.setLevel(logging.DEBUG)
+        try:
+            with _trace.tracing(_trace.LoggingSink(logger)):
+                self.engine.parse('anne')
+        finally:
+            logger.removeHandler(handler)
+        self.assertTrue(records)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import unittest
+from syllabletk import _trie
+
+
+class TestSegmentTrie(unittest.TestCase):
+    def setUp(self):
+        seqs = [(), ('s',), ('s', 't'), ('s', 't', 'r'), ('t͡ʃ',)]
+        self.fwd = _trie.SegmentTrie(seqs)
+        self.rev = _trie.SegmentTrie(seqs, reverse=True)
+
+    def test_contains(self):
+        self.assertIn(('s', 't'), self.fwd)
+        self.assertIn(('s', 't'), self.rev)
+        self.assertNotIn(('t',), self.fwd)
+        self.assertEqual(len(self.fwd), 5)
+
+    def test_prefixes(self):
+        self.assertEqual(self.fwd.match_lengths(['s', 't', 'r', 'a']), [0, 1, 2, 3])
+        self.assertEqual(self.fwd.longest_match(['s', 't', 'a'], 0, 1), 1)
+        self.assertEqual(self.fwd.longest_match(['a', 's']), 0)
+
+    def test_suffixes(self):
+        self.assertEqual(self.rev.match_lengths(['a', 's', 't']), [0, 2])
+        self.assertEqual(self.rev.match_lengths(['a', 's', 't', 'r']), [0, 3])
+        self.assertEqual(self.rev.longest_match(['a', 't͡ʃ']), 1)
+        self.assertEqual(self.rev.longest_match(['s', 't', 'r'], 1), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()